@@ -20,6 +20,12 @@ Moving any of these folders or files will prevent the game from working properly
 Author: Walker M. White (wmw2)
 Date:   November 1, 2017 (Python 3 Version)
 """
+import sys
+import consts
+
+# Read the command line before any module copies the constants
+consts.configure(sys.argv)
+
 from consts import *
 from app import *
 
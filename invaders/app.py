@@ -13,6 +13,7 @@ Date: December 4th, 2018
 from consts import *
 from game2d import *
 from wave import *
+from highscore import HighScore
 from random import randint
 import os.path
 import sys
@@ -77,7 +78,7 @@ class Invaders(GameApp):
     _last:      the number of clicks in the last frame [Point2 or None if mouse
                 was not down last frame]
     _background:the background of the game window [GRectangle]
-    _space:     the animating stars on the background [GRectangle]
+    _space:     the animating stars on the background [GStarfield]
     _scoretext: the text indicating the score [GLabel]
     _pause:     the text displaying the message when the game is manually paused
     _oops:      the text displaying the message when the game is paused when the
@@ -89,9 +90,15 @@ class Invaders(GameApp):
     _mute:      the icon displaying the mute button
                 [GImage]
     _livestext: the text indicating the lives [GLabel]
+    _hud:       the layer holding the score sign, the lives sign and the mute
+                button, retained by the view [GLayer]
+    _overlay:   the layer holding the message drawn on top of the game [GLayer]
     _muted:     int value to check whether the sound is muted [1 or 0]
     _over:      sound played when the game is over and player has lost [Sound]
     _clap:      sound played when the game is over and the player has won [Sound]
+    _best:      the high score of the game [HighScore]
+    _highscore: the text displaying the score and high score at the end of a
+                game [GLabel, or None if the game is not over]
     """
 
     # DO NOT MAKE A NEW INITIALIZER!
@@ -105,16 +112,28 @@ class Invaders(GameApp):
         you should not override or change). This method is called once the game
         is running. You should use it to initialize any game specific attributes.
 
+        All of the images of the game are packed into one texture atlas first,
+        so that the sprites never load or slice an image themselves.
+
         This method should make sure that all of the attributes satisfy the
         given invariants. When done, it sets the _state to STATE_INACTIVE and
         create a message (in attribute _text) saying that the user should press
         to play a game.
         """
+        images=os.path.join(os.path.dirname(os.path.abspath(__file__)),'Images')
+        GAtlas.build([name for name in sorted(os.listdir(images))
+        if name.endswith('.png')])
         self._state=STATE_INACTIVE
         self._lastkeys=self._muted=0
-        self._last=self._wave=self._space=None
+        self._last=self._wave=self._highscore=None
+        self._best=HighScore()
         self._background=GRectangle(x=GAME_WIDTH/2,y=GAME_HEIGHT/2,
         width=GAME_WIDTH,height=GAME_HEIGHT,fillcolor='black')
+        self.view.retain(self._background,LAYER_BACKGROUND)
+        self._space=GStarfield(width=GAME_WIDTH,height=GAME_HEIGHT,
+        count=STAR_COUNT,size=STAR_SIZE,colors=STAR_COLORS)
+        self.view.retain(self._space,LAYER_STARS)
+        self.view.hide(self._space)
         self._scoretext=GLabel(text="SCORE: ", font_size=40,
         font_name='Arcade.ttf',x=GAME_WIDTH/10,y=GAME_HEIGHT-GAME_HEIGHT/16,
         fillcolor='black',linecolor='yellow')
@@ -139,6 +158,12 @@ class Invaders(GameApp):
         self._text=GLabel(text="Press 's' to Play\n Press 'p' to Pause\n Press"+
         " 'q' to Quit Game", font_size=60,font_name='Arcade.ttf',x=GAME_WIDTH/2,
         y=GAME_HEIGHT/2,linecolor='blue')
+        self._hud=GLayer(x=GAME_WIDTH/2,y=GAME_HEIGHT/2,width=GAME_WIDTH,
+        height=GAME_HEIGHT,objects=[self._scoretext,self._livestext,self._mute])
+        self.view.retain(self._hud,LAYER_HUD)
+        self.view.hide(self._hud)
+        self._overlay=GLayer(x=GAME_WIDTH/2,y=GAME_HEIGHT/2,width=GAME_WIDTH,
+        height=GAME_HEIGHT)
         self._gameOverSounds()
 
 
@@ -186,6 +211,10 @@ class Invaders(GameApp):
         if self._state==STATE_INACTIVE:
             self._determineStateStart()
         if self._state==STATE_NEWWAVE:
+            if self._wave is not None:
+                self._wave.release()
+            self.view.show(self._space)
+            self.view.show(self._hud)
             self._wave=Wave()
             self._state=STATE_ACTIVE
         if self._state==STATE_ACTIVE:
@@ -214,17 +243,12 @@ class Invaders(GameApp):
         """
         Draws the background, the animating stars in space, the score sign, the
         lives sign, the mute button, and the wave.
+
+        The score sign, the lives sign and the mute button never change, so they
+        are drawn once into the layer _hud, which the view retains.
         """
         self._background.draw(self.view)
-        a=['white', 'blue', 'green', 'red', 'yellow', 'magenta', 'cyan']
-        for i in range(80):
-            self._space=GRectangle(x=random.randint(0, GAME_WIDTH),
-            y=random.randint(0, GAME_HEIGHT),width=1.5, height=1.5,
-            fillcolor=a[random.randint(0,6)])
-            self._space.draw(self.view)
-        self._scoretext.draw(self.view)
-        self._livestext.draw(self.view)
-        self._mute.draw(self.view)
+        self._space.twinkle()
         self._wave.draw(self.view)
 
 
@@ -235,35 +259,41 @@ class Invaders(GameApp):
         """
         if self._state==STATE_INACTIVE:
             self._background.draw(self.view)
-            self._text.draw(self.view)
+            self._drawOverlay(self._text)
         if self._state==STATE_ACTIVE:
             self.subdraw()
         if self._state==STATE_COMPLETE:
             self.subdraw()
-            self._end.draw(self.view)
-            self._highscore=GLabel(text="YOUR SCORE IS: "
-            +str(self._wave.getScore())+"   HIGHSCORE IS: "+str(self.HighScore()),
-            x=GAME_WIDTH/2, y=GAME_WIDTH/2-200,font_size=30,linecolor='magenta',
-            font_name='Arcade.ttf')
-            self._highscore.draw(self.view)
+            self._drawOverlay(self._end,self._highscore)
         if self._state==STATE_WIN:
             self.subdraw()
-            self._win.draw(self.view)
-            self._highscore=GLabel(text="YOUR SCORE IS: "
-            +str(self._wave.getScore())+"   HIGHSCORE IS: "+str(self.HighScore()),
-            x=GAME_WIDTH/2, y=GAME_WIDTH/2-200, font_size=30, linecolor='magenta',
-             font_name='Arcade.ttf')
-            self._highscore.draw(self.view)
+            self._drawOverlay(self._win,self._highscore)
         if self._state==STATE_MANUAL_PAUSED:
             self.subdraw()
-            self._pause.draw(self.view)
+            self._drawOverlay(self._pause)
         if self._state==STATE_PAUSED:
             self.subdraw()
-            self._oops.draw(self.view)
+            self._drawOverlay(self._oops)
         if self._state==STATE_CONTINUE:
             self._state=STATE_ACTIVE
 
 
+    def _drawOverlay(self,*texts):
+        """
+        Draws the given texts on top of everything else.
+
+        The texts are drawn into the layer _overlay, which is only redrawn when
+        the texts differ from those of the last call. Every other frame, the
+        overlay is a single image.
+
+        Parameter texts: the texts to draw
+        Precondition: texts are GLabel objects
+        """
+        if self._overlay.objects!=texts:
+            self._overlay.objects=texts
+        self._overlay.draw(self.view)
+
+
     # HELPER METHODS FOR THE STATES GO HERE
     def _determineStateStart(self):
         """
@@ -337,22 +367,19 @@ class Invaders(GameApp):
         self._lastkeys=curr_keys
 
 
-    def HighScore(self):
+    def _gameOver(self):
         """
-        Updates and returns the highscore in a .txt file if the previous high
-        score was beaten by the player.
+        Records the score of the finished game and creates the text showing
+        it along with the high score.
+
+        The high score is kept in memory by _best, which saves it to disk in
+        the background, so the end screen never touches the file.
         """
-        hisc=open(os.path.join('invaders','high.txt'),"r")
-        highscore=hisc.read()
-        highnum=int(highscore)
-        hisc.close()
-        hisc=open(os.path.join('invaders','high.txt'),"w+")
-        currentscore=int(self._wave.getScore())
-        if currentscore>highnum:
-            highnum=currentscore
-        hisc.write(str(highnum))
-        hisc.close()
-        return highnum
+        score=self._wave.getScore()
+        best=self._best.submit(score)
+        self._highscore=GLabel(text="YOUR SCORE IS: "+str(score)+
+        "   HIGHSCORE IS: "+str(best),x=GAME_WIDTH/2, y=GAME_WIDTH/2-200,
+        font_size=30,linecolor='magenta',font_name='Arcade.ttf')
 
 
     def _determineStateComplete(self):
@@ -366,10 +393,12 @@ class Invaders(GameApp):
             self._wave.getMusic().stop()
             self._clap.play(loop=False)
             self._state=STATE_WIN
+            self._gameOver()
         elif self._wave.getLives()==0 or self._wave._trackDown()<DEFENSE_LINE:
             self._wave.getMusic().stop()
             self._over.play(loop=False)
             self._state=STATE_COMPLETE
+            self._gameOver()
 
 
     def _nextLife(self):
@@ -0,0 +1,497 @@
+"""
+Batch simulation module for Alien Invaders
+
+This module contains a vectorized version of the simulation in simulation.py.
+An instance of WaveBatch holds N independent waves as NumPy arrays and advances
+all of them with a single call to update. The aliens of every wave are stored
+in one array of shape (N, ALIEN_ROWS, ALIENS_IN_ROW), so marching, firing and
+collisions are computed array-wide instead of one Python object at a time.
+
+The rules are the ones of WaveSim. The differences are the ones you would
+expect from a batch: each wave has a fixed number of slots for alien bolts (a
+wave with no free slot does not fire), all of the bolts that hit the ship in
+the same frame take effect at once, and a destroyed ship is rebuilt at the
+start of the next update as long as there are lives left.
+
+Author: agent (agent@local), extending the game by Mihikaa Goenka (mg897) and
+Oishani Ganguly (og58)
+Date: October 18th, 2026
+"""
+from consts import *
+import numpy as np
+
+
+class WaveBatch(object):
+    """
+    This class simulates N waves of Alien Invaders in lockstep.
+
+    Every attribute is an array whose first axis is the wave. The arrays are
+    updated in place, so the getters return views that stay current.
+
+    INSTANCE ATTRIBUTES:
+        _n:          the number of waves [int > 0]
+        _rows:       the number of rows of aliens [int > 0]
+        _cols:       the number of aliens per row [int > 0]
+        _rng:        the random number generator [numpy Generator]
+        _alienx:     the starting x-coordinate of each column [float (cols,)]
+        _alieny:     the starting y-coordinate of each row [float (rows,)]
+        _values:     the score of an alien in each row [int (rows,)]
+        _alive:      the alien alive flags [bool (n,rows,cols)]
+        _offx:       horizontal offset of each formation [float (n,)]
+        _offy:       vertical offset of each formation [float (n,)]
+        _frame:      the animation frame of each formation [int8 (n,)]
+        _marches:    the number of alien steps of each wave [int (n,)]
+        _shipx:      the x-coordinate of each ship [float (n,)]
+        _shipalive:  whether each ship exists [bool (n,)]
+        _lives:      the number of lives left [int (n,)]
+        _score:      the score of each wave [int (n,)]
+        _tps:        the number of ticks per second of game time [int > 0]
+        _time:       the ticks since the last alien step [int (n,)]
+        _start:      the number of seconds between alien steps at the start of
+                     a wave [number > 0]
+        _speed:      the number of seconds between alien steps [float (n,)]
+        _numMarch:   the steps taken since the last alien bolt [int (n,)]
+        _alienbolts: the steps to take before the next alien bolt [int (n,)]
+        _movingR:    whether each formation is moving right [bool (n,)]
+        _noaliens:   the number of aliens alive in each wave [int (n,)]
+        _done:       whether each wave is over (won or lost) [bool (n,)]
+        _pactive:    whether each ship has a bolt in play [bool (n,)]
+        _px:         the x-coordinate of each ship bolt [float (n,)]
+        _py:         the y-coordinate of each ship bolt [float (n,)]
+        _bactive:    whether each alien bolt slot is in use [bool (n,capacity)]
+        _bx:         the x-coordinate of each alien bolt [float (n,capacity)]
+        _by:         the y-coordinate of each alien bolt [float (n,capacity)]
+        _bkind:      the kind of each alien bolt [int8 (n,capacity), either
+                     BOLT_ALIEN or BOLT_POWERUP]
+    """
+
+
+    # GETTERS
+    def getSize(self):
+        """
+        Returns the number of waves in this batch.
+        """
+        return self._n
+
+
+    def getScore(self):
+        """
+        Returns the score of every wave as an int array of shape (n,).
+        """
+        return self._score
+
+
+    def getLives(self):
+        """
+        Returns the lives left in every wave as an int array of shape (n,).
+        """
+        return self._lives
+
+
+    def getNoAliens(self):
+        """
+        Returns the number of aliens alive in every wave as an int array of
+        shape (n,).
+        """
+        return self._noaliens
+
+
+    def getAlive(self):
+        """
+        Returns the alien alive flags as a bool array of shape (n,rows,cols).
+
+        Rows are numbered from the bottom, just like the 2d list in Wave.
+        """
+        return self._alive
+
+
+    def getShipX(self):
+        """
+        Returns the x-coordinate of every ship as a float array of shape (n,).
+        """
+        return self._shipx
+
+
+    def getDone(self):
+        """
+        Returns whether every wave is over as a bool array of shape (n,).
+        """
+        return self._done
+
+
+    def getWon(self):
+        """
+        Returns whether every wave was won as a bool array of shape (n,).
+        """
+        return self._noaliens==0
+
+
+    # INITIALIZER
+    def __init__(self,n,rows=ALIEN_ROWS,cols=ALIENS_IN_ROW,speed=ALIEN_SPEED,
+    capacity=32,seed=None,tps=TICKS_PER_SECOND):
+        """
+        Creates a batch of n new waves.
+
+        Parameter n: the number of waves
+        Precondition: n is an int > 0
+
+        Parameter rows: the number of rows of aliens
+        Precondition: rows is an int > 0
+
+        Parameter cols: the number of aliens per row
+        Precondition: cols is an int > 0
+
+        Parameter speed: the number of seconds between alien steps, as for
+        WaveSim
+        Precondition: speed is a number > 0
+
+        Parameter capacity: the number of alien bolts a wave can have in play
+        Precondition: capacity is an int > 0
+
+        Parameter seed: the seed of the random number generator
+        Precondition: seed is an int or None
+
+        Parameter tps: the number of ticks per second of game time
+        Precondition: tps is an int > 0
+        """
+        self._n=n
+        self._tps=tps
+        self._rows=rows
+        self._cols=cols
+        self._start=speed
+        self._rng=np.random.default_rng(seed)
+        col=np.arange(cols)
+        k=rows-1-np.arange(rows)
+        self._alienx=(ALIEN_H_SEP*(col+1)+0.5*ALIEN_WIDTH+ALIEN_WIDTH*col)\
+        .astype(float)
+        self._alieny=((GAME_HEIGHT-ALIEN_CEILING)-(ALIEN_V_SEP*k)-\
+        (ALIEN_HEIGHT*k)-(0.5*ALIEN_HEIGHT)).astype(float)
+        row=np.arange(rows)
+        self._values=np.where(row<rows/3,10,np.where(row<2*rows/3,30,50))
+
+        self._alive=np.ones((n,rows,cols),dtype=bool)
+        self._offx=np.zeros(n)
+        self._offy=np.zeros(n)
+        self._frame=np.zeros(n,dtype=np.int8)
+        self._marches=np.zeros(n,dtype=int)
+        self._shipx=np.full(n,float(GAME_WIDTH//2))
+        self._shipalive=np.ones(n,dtype=bool)
+        self._lives=np.full(n,SHIP_LIVES,dtype=int)
+        self._score=np.zeros(n,dtype=int)
+        self._time=np.zeros(n,dtype=int)
+        self._speed=np.full(n,float(speed))
+        self._numMarch=np.zeros(n,dtype=int)
+        self._alienbolts=self._rng.integers(1,BOLT_RATE+1,size=n)
+        self._movingR=np.ones(n,dtype=bool)
+        self._noaliens=np.full(n,rows*cols,dtype=int)
+        self._done=np.zeros(n,dtype=bool)
+        self._pactive=np.zeros(n,dtype=bool)
+        self._px=np.zeros(n)
+        self._py=np.zeros(n)
+        self._bactive=np.zeros((n,capacity),dtype=bool)
+        self._bx=np.zeros((n,capacity))
+        self._by=np.zeros((n,capacity))
+        self._bkind=np.zeros((n,capacity),dtype=np.int8)
+
+
+    def reset(self,mask=None):
+        """
+        Starts a new wave in every game selected by mask.
+
+        Parameter mask: the waves to restart, or None for all of them
+        Precondition: mask is a bool array of shape (n,) or None
+        """
+        if mask is None:
+            mask=np.ones(self._n,dtype=bool)
+        m=int(mask.sum())
+        self._alive[mask]=True
+        self._offx[mask]=0
+        self._offy[mask]=0
+        self._frame[mask]=0
+        self._marches[mask]=0
+        self._shipx[mask]=GAME_WIDTH//2
+        self._shipalive[mask]=True
+        self._lives[mask]=SHIP_LIVES
+        self._score[mask]=0
+        self._time[mask]=0
+        self._speed[mask]=self._start
+        self._numMarch[mask]=0
+        self._alienbolts[mask]=self._rng.integers(1,BOLT_RATE+1,size=m)
+        self._movingR[mask]=True
+        self._noaliens[mask]=self._rows*self._cols
+        self._done[mask]=False
+        self._pactive[mask]=False
+        self._bactive[mask]=False
+
+
+    # UPDATE METHOD
+    def update(self,left,right,fire):
+        """
+        Simulates a single tick of every wave that is not over.
+
+        As in WaveSim, everything is defined per tick, so the batch plays the
+        same game however fast it is stepped. The arguments may be single
+        values, which apply to every wave, or arrays of shape (n,).
+
+        Parameter left: whether each ship should move left
+        Precondition: left is a bool or a bool array of shape (n,)
+
+        Parameter right: whether each ship should move right
+        Precondition: right is a bool or a bool array of shape (n,)
+
+        Parameter fire: whether each ship should fire a bolt
+        Precondition: fire is a bool or a bool array of shape (n,)
+        """
+        live=~self._done
+        respawn=live & ~self._shipalive
+        self._shipx[respawn]=GAME_WIDTH//2
+        self._shipalive[respawn]=True
+
+        self._moveShip(live & self._shipalive,left,right)
+        self._moveAlien(live)
+        self._collisionship(live)
+        self._determineFire(live & np.asarray(fire,dtype=bool))
+        self._done|=(self._noaliens==0) | (self._lives==0) | \
+        (self.trackDown()<DEFENSE_LINE)
+
+
+    # HELPER METHODS FOR THE SHIPS AND THE BOLTS
+    def _moveShip(self,mask,left,right):
+        """
+        Moves the ships selected by mask, stopping them at the window edges.
+
+        Parameter mask: the waves whose ship can move
+        Precondition: mask is a bool array of shape (n,)
+
+        Parameter left: whether each ship should move left
+        Precondition: left is a bool or a bool array of shape (n,)
+
+        Parameter right: whether each ship should move right
+        Precondition: right is a bool or a bool array of shape (n,)
+        """
+        max=GAME_WIDTH-SHIP_WIDTH/2
+        min=0+SHIP_WIDTH/2
+        x=self._shipx
+        go=mask & np.asarray(left,dtype=bool)
+        x[go]=np.where(x[go]-SHIP_WIDTH/2>=min,x[go]-SHIP_MOVEMENT,min)
+        go=mask & np.asarray(right,dtype=bool)
+        x[go]=np.where(x[go]+SHIP_WIDTH/2<=max,x[go]+SHIP_MOVEMENT,max)
+
+
+    def _collisionship(self,mask):
+        """
+        Checks the alien bolts against the ships of the waves in mask.
+
+        Power-up bolts add POWERUP_SCORE to the score. Any other bolt destroys
+        the ship and costs a life. Every bolt that hits is removed.
+
+        Parameter mask: the waves to check
+        Precondition: mask is a bool array of shape (n,)
+        """
+        sx=self._shipx[:,None]
+        hitx=(np.abs(self._bx-BOLT_WIDTH/2-sx)<SHIP_WIDTH/2) | \
+        (np.abs(self._bx+BOLT_WIDTH/2-sx)<SHIP_WIDTH/2)
+        hity=(np.abs(self._by+BOLT_HEIGHT/2-SHIP_BOTTOM)<SHIP_HEIGHT/2) | \
+        (np.abs(self._by-BOLT_HEIGHT/2-SHIP_BOTTOM)<SHIP_HEIGHT/2)
+        hit=self._bactive & hitx & hity & (mask & self._shipalive)[:,None]
+        power=hit & (self._bkind==BOLT_POWERUP)
+        self._score+=POWERUP_SCORE*power.sum(axis=1)
+        killed=(hit & ~power).any(axis=1)
+        self._shipalive[killed]=False
+        self._lives[killed]-=1
+        self._bactive[hit]=False
+
+
+    def _determineFire(self,fire):
+        """
+        Fires the ship bolts requested in fire, moves every bolt and checks the
+        ship bolts against the aliens.
+
+        Parameter fire: the waves whose ship fires
+        Precondition: fire is a bool array of shape (n,)
+        """
+        shoot=fire & self._shipalive & ~self._pactive
+        self._px[shoot]=self._shipx[shoot]
+        self._py[shoot]=SHIP_HEIGHT+BOLT_HEIGHT/2
+        self._pactive|=shoot
+
+        live=~self._done
+        self._py[live]+=BOLT_SPEED
+        self._by[live]-=BOLT_SPEED
+        self._collision(live & self._pactive)
+        self._pactive&=self._py-BOLT_HEIGHT/2<=GAME_HEIGHT
+        self._bactive&=self._by+BOLT_HEIGHT/2>=0
+
+
+    def _collision(self,mask):
+        """
+        Checks the ship bolts of the waves in mask against their aliens.
+
+        A corner of a bolt can only be inside the alien whose row and column
+        are nearest to it, so every bolt is tested against at most four
+        aliens. Each alien hit is destroyed and its value added to the score.
+
+        Parameter mask: the waves with a ship bolt to check
+        Precondition: mask is a bool array of shape (n,)
+        """
+        idx=np.nonzero(mask)[0]
+        if len(idx)==0:
+            return
+        px=self._px[idx]
+        py=self._py[idx]
+        pitchx=ALIEN_WIDTH+ALIEN_H_SEP
+        pitchy=ALIEN_HEIGHT+ALIEN_V_SEP
+        cols=[]
+        for x in (px-BOLT_WIDTH/2,px+BOLT_WIDTH/2):
+            c=np.rint((x-self._offx[idx]-self._alienx[0])/pitchx).astype(int)
+            c=np.clip(c,0,self._cols-1)
+            ok=np.abs(x-self._offx[idx]-self._alienx[c])<ALIEN_WIDTH/2
+            cols.append((c,ok))
+        rows=[]
+        for y in (py+BOLT_HEIGHT/2,py-BOLT_HEIGHT/2):
+            r=np.rint((y-self._offy[idx]-self._alieny[0])/pitchy).astype(int)
+            r=np.clip(r,0,self._rows-1)
+            ok=np.abs(y-self._offy[idx]-self._alieny[r])<ALIEN_HEIGHT/2
+            rows.append((r,ok))
+        # Do not count an alien twice when both corners are inside it
+        cols[1]=(cols[1][0],cols[1][1] & ~(cols[0][1] & (cols[0][0]==cols[1][0])))
+        rows[1]=(rows[1][0],rows[1][1] & ~(rows[0][1] & (rows[0][0]==rows[1][0])))
+
+        gained=np.zeros(len(idx),dtype=int)
+        anyhit=np.zeros(len(idx),dtype=bool)
+        for (r,rok) in rows:
+            for (c,cok) in cols:
+                hit=rok & cok & self._alive[idx,r,c]
+                self._alive[idx[hit],r[hit],c[hit]]=False
+                gained+=np.where(hit,self._values[r],0)
+                anyhit|=hit
+        self._score[idx]+=gained
+        self._noaliens[idx]=self._alive[idx].sum(axis=(1,2))
+        self._pactive[idx[anyhit]]=False
+
+
+    def _alienFire(self,mask):
+        """
+        Makes the lowest alien of a random column fire in every wave in mask.
+        The chances of a power-up bolt being fired are 1 in 10.
+
+        Parameter mask: the waves that fire
+        Precondition: mask is a bool array of shape (n,)
+        """
+        idx=np.nonzero(mask & (self._noaliens>0))[0]
+        if len(idx)==0:
+            return
+        colalive=self._alive[idx].any(axis=1)
+        count=colalive.sum(axis=1)
+        pick=(self._rng.random(len(idx))*count).astype(int)
+        col=np.argmax(np.cumsum(colalive,axis=1)>pick[:,None],axis=1)
+        row=np.argmax(self._alive[idx,:,col],axis=1)
+        power=self._rng.integers(1,11,size=len(idx))==10
+
+        free=~self._bactive[idx]
+        room=free.any(axis=1)
+        slot=np.argmax(free,axis=1)
+        idx,col,row,power,slot=idx[room],col[room],row[room],power[room],slot[room]
+        self._bactive[idx,slot]=True
+        self._bx[idx,slot]=self._alienx[col]+self._offx[idx]
+        self._by[idx,slot]=self._alieny[row]+self._offy[idx]-ALIEN_HEIGHT/2
+        self._bkind[idx,slot]=np.where(power,BOLT_POWERUP,BOLT_ALIEN)
+
+
+    # HELPER METHODS FOR THE ALIENS
+    def _moveAlien(self,mask):
+        """
+        Marches the formations of the waves in mask whose step time is up.
+
+        Parameter mask: the waves to update
+        Precondition: mask is a bool array of shape (n,)
+        """
+        self._time[mask]+=1
+        go=mask & (self._time>self._speed*self._tps) & (self._noaliens>0)
+        if not go.any():
+            return
+        right=self.trackRight()
+        left=self.trackLeft()
+        a=go & self._movingR & (right<GAME_WIDTH-ALIEN_H_SEP)
+        b=go & ~a & (right>=GAME_WIDTH-ALIEN_H_SEP)
+        c=go & ~a & ~b & ~self._movingR & (left>ALIEN_H_SEP)
+        d=go & ~a & ~b & ~c
+
+        self._offx[a]+=ALIEN_H_WALK
+        self._offx[c]-=ALIEN_H_WALK
+        self._frame[a|c]^=1
+        self._marchDown(b|d)
+        self._step(go)
+        self._offx[b]-=ALIEN_H_WALK
+        self._offx[d]+=ALIEN_H_WALK
+        self._frame[b|d]^=1
+        self._step(b|d)
+        self._movingR[b]=False
+        self._movingR[d]=True
+        self._time[go]=0
+
+
+    def _marchDown(self,mask):
+        """
+        Moves the formations in mask down by ALIEN_V_WALK, speeding them up a
+        little for every alien still alive.
+
+        Parameter mask: the waves to move down
+        Precondition: mask is a bool array of shape (n,)
+        """
+        lowest=np.argmax(self._alive.any(axis=2),axis=1)
+        newy=self._alieny[lowest]+self._offy-ALIEN_V_WALK
+        down=mask & (newy!=DEFENSE_LINE+ALIEN_HEIGHT/2)
+        self._offy[down]-=ALIEN_V_WALK
+        self._frame[down]^=1
+        self._speed[down]*=(1-1/300)**self._noaliens[down]
+
+
+    def _step(self,mask):
+        """
+        Counts an alien step in the waves in mask, firing an alien bolt every
+        _alienbolts steps.
+
+        Parameter mask: the waves that took a step
+        Precondition: mask is a bool array of shape (n,)
+        """
+        self._marches[mask]+=1
+        self._numMarch[mask]+=1
+        fire=mask & (self._numMarch==self._alienbolts)
+        self._alienFire(fire)
+        self._numMarch[fire]=0
+        self._alienbolts[fire]=self._rng.integers(1,BOLT_RATE+1,
+        size=int(fire.sum()))
+
+
+    def trackRight(self):
+        """
+        Returns the right edge of the rightmost alien alive in every wave, as a
+        float array of shape (n,). The value is meaningless for a wave with no
+        aliens left.
+        """
+        colalive=self._alive.any(axis=1)
+        col=self._cols-1-np.argmax(colalive[:,::-1],axis=1)
+        return self._alienx[col]+self._offx+ALIEN_WIDTH/2
+
+
+    def trackLeft(self):
+        """
+        Returns the left edge of the leftmost alien alive in every wave, as a
+        float array of shape (n,). The value is meaningless for a wave with no
+        aliens left.
+        """
+        col=np.argmax(self._alive.any(axis=1),axis=1)
+        return self._alienx[col]+self._offx-ALIEN_WIDTH/2
+
+
+    def trackDown(self):
+        """
+        Returns the height used to check whether the aliens of every wave have
+        reached the defense line, as a float array of shape (n,). A wave with
+        no aliens left returns GAME_HEIGHT.
+        """
+        rowalive=self._alive.any(axis=2)
+        row=np.argmax(rowalive,axis=1)
+        y=self._alieny[row]+self._offy-ALIEN_WIDTH/2
+        return np.where(rowalive.any(axis=1),y,GAME_HEIGHT)
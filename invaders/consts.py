@@ -9,8 +9,6 @@ module. This allows all modules to access them.
 Authors: Oishani Ganguly (og58), Mihikaa Goenka (mg897)
 Date: December 4th, 2018
 """
-import introcs
-import sys
 
 ### WINDOW CONSTANTS (all coordinates are in pixels) ###
 
@@ -97,30 +95,45 @@ arguments are everything after the word python. So if you start the game typing
 
     python invaders 3 4 0.5
 
-Python puts ['breakout.py', '3', '4', '0.5'] into sys.argv. Below, we take
-advantage of this fact to change the constants ALIEN_ROWS, ALIENS_IN_ROW, and
-ALIEN_SPEED.
+Python puts ['breakout.py', '3', '4', '0.5'] into sys.argv. The function below
+takes advantage of this fact to change the constants ALIEN_ROWS, ALIENS_IN_ROW,
+and ALIEN_SPEED.
+
+The command line is NOT read when this module is imported. Only the game script
+(__main__.py) calls configure, and it does so before importing any module that
+copies these constants. That way simulations and worker processes can import
+this module safely, whatever the command line of their parent process was.
 """
-try:
-    rows = int(sys.argv[1])
-    if rows >= 1 and rows <= 10:
-        ALIEN_ROWS = rows
-except:
-    pass # Use original value
-
-try:
-    perrow = int(sys.argv[2])
-    if perrow >= 1 and perrow <= 15:
-        ALIENS_IN_ROW = perrow
-except:
-    pass # Use original value
-
-try:
-    speed = float(sys.argv[3])
-    if speed > 0 and speed <= 3:
-        ALIEN_SPEED = speed
-except:
-    pass # Use original value
+def configure(argv):
+    """
+    Changes ALIEN_ROWS, ALIENS_IN_ROW, and ALIEN_SPEED from a command line.
+
+    Values that are missing or out of range leave the constant unchanged.
+
+    Parameter argv: the command line arguments, script name first
+    Precondition: argv is a list of strings
+    """
+    global ALIEN_ROWS, ALIENS_IN_ROW, ALIEN_SPEED
+    try:
+        rows = int(argv[1])
+        if rows >= 1 and rows <= 10:
+            ALIEN_ROWS = rows
+    except:
+        pass # Use original value
+
+    try:
+        perrow = int(argv[2])
+        if perrow >= 1 and perrow <= 15:
+            ALIENS_IN_ROW = perrow
+    except:
+        pass # Use original value
+
+    try:
+        speed = float(argv[3])
+        if speed > 0 and speed <= 3:
+            ALIEN_SPEED = speed
+    except:
+        pass # Use original value
 
 ### ADD MORE CONSTANTS (PROPERLY COMMENTED) AS NECESSARY ###
 
@@ -128,3 +141,66 @@ except:
 
 # state when we are paused manually
 STATE_MANUAL_PAUSED = 4
+
+### SIMULATION CONSTANTS ###
+
+# the number of simulation ticks per second of game time
+TICKS_PER_SECOND = 60
+
+# kind of a bolt fired by the ship
+BOLT_PLAYER  = 0
+# kind of a regular bolt fired by an alien
+BOLT_ALIEN   = 1
+# kind of a power-up bolt fired by an alien
+BOLT_POWERUP = 2
+# the colors of the bolts, indexed by kind
+BOLT_COLORS  = ('blue','yellow','purple')
+# the score for catching a power-up bolt with the ship
+POWERUP_SCORE = 50
+# the number of bolts kept for reuse, in the simulation and on screen
+BOLT_POOL = 64
+
+# event recorded when the aliens take a step
+EVENT_MARCH      = 0
+# event recorded when the ship fires a bolt
+EVENT_FIRE       = 1
+# event recorded when an alien fires a bolt
+EVENT_ALIEN_FIRE = 2
+# event recorded when an alien is destroyed
+EVENT_ALIEN_DIED = 3
+# event recorded when the ship is destroyed
+EVENT_SHIP_DIED  = 4
+# event recorded when the ship catches a power-up bolt
+EVENT_POWERUP    = 5
+
+### ENVIRONMENT CONSTANTS ###
+
+# action that does nothing
+ACTION_NOOP  = 0
+# action that moves the ship left
+ACTION_LEFT  = 1
+# action that moves the ship right
+ACTION_RIGHT = 2
+# action that fires a bolt from the ship
+ACTION_FIRE  = 3
+# the number of actions
+ACTION_COUNT = 4
+
+
+### DRAWING LAYERS ###
+
+# the number of stars in space
+STAR_COUNT  = 80
+# the width and height of a star
+STAR_SIZE   = 1.5
+# the colors of the stars
+STAR_COLORS = ['white', 'blue', 'green', 'red', 'yellow', 'magenta', 'cyan']
+
+# the drawing order of the background of the game window
+LAYER_BACKGROUND = 0
+# the drawing order of the stars in space
+LAYER_STARS      = 1
+# the drawing order of the score and lives signs and the mute button
+LAYER_HUD        = 2
+# the drawing order of the objects a wave keeps on screen
+LAYER_WAVE       = 3
@@ -0,0 +1,201 @@
+"""
+Environment module for Alien Invaders
+
+This module wraps a headless Wave in the reset/step interface used by
+reinforcement learning libraries such as Gym. An agent picks one of the
+discrete actions ACTION_NOOP, ACTION_LEFT, ACTION_RIGHT or ACTION_FIRE, and
+gets back an observation, a reward (the points scored), and whether the game
+is over.
+
+The observation is built without allocating any arrays. It is a dictionary of
+NumPy arrays that are created once, when the environment is created, and then
+overwritten in place by every reset and step. The alien grid is not even
+copied: it is a view of the alive flags of the simulation itself. This means
+that an observation is only valid until the next call to step. Copy the arrays
+if you need to keep them.
+
+Author: agent (agent@local), extending the game by Mihikaa Goenka (mg897) and
+Oishani Ganguly (og58)
+Date: October 18th, 2026
+"""
+from consts import *
+from simulation import SimClock
+from wave import Wave
+import numpy as np
+
+# The keys (left,right,fire) held down for each action
+ACTIONS = ((False,False,False),(True,False,False),(False,True,False),
+    (False,False,True))
+
+
+class InvadersEnv(object):
+    """
+    A class representing Alien Invaders as a reinforcement learning environment.
+
+    A game is played the way Invaders plays it, except that a destroyed ship
+    is rebuilt right away. The game is over when every alien is destroyed, the
+    lives run out, or the aliens reach the defense line.
+
+    The observation returned by reset and step is always the same dictionary:
+
+        'aliens':    the alien alive flags [uint8 array (rows,cols), rows
+                     numbered from the bottom; a view of the simulation]
+        'formation': the offset of the formation from its start
+                     [float64 array (2,)]
+        'ship':      the x-coordinate of the ship and whether it exists
+                     [float64 array (2,)]
+        'bolts':     the x, y, velocity and kind of each bolt in play
+                     [float32 array (capacity,4); unused rows are 0]
+        'nbolts':    the number of rows of 'bolts' in use [int32 array (1,)]
+
+    INSTANCE ATTRIBUTES:
+        _wave:     the wave being played [headless Wave]
+        _sim:      the simulation of _wave [WaveSim]
+        _ticks:    the number of simulation ticks per step [int > 0]
+        _score:    the score after the last step [int >= 0]
+        _done:     whether the game is over [bool]
+        _obs:      the observation [dict of NumPy arrays]
+        _aliens:   the alien grid of the observation [uint8 array]
+        _formation:the formation offset of the observation [float64 array]
+        _ship:     the ship of the observation [float64 array]
+        _bolts:    the bolts of the observation [float32 array]
+        _nbolts:   the bolt count of the observation [int32 array]
+        _used:     the number of rows of _bolts written by the last step
+                   [int >= 0]
+        _info:     the (empty) info dictionary returned by step [dict]
+    """
+
+    # GETTERS
+    def getObservation(self):
+        """
+        Returns the current observation.
+        """
+        return self._obs
+
+
+    def getWave(self):
+        """
+        Returns the wave being played.
+        """
+        return self._wave
+
+
+    # INITIALIZER
+    def __init__(self,rows=ALIEN_ROWS,cols=ALIENS_IN_ROW,speed=ALIEN_SPEED,
+    ticks=1,capacity=64,seed=None,out=None):
+        """
+        Creates a new environment and starts its first game.
+
+        Parameter rows: the number of rows of aliens
+        Precondition: rows is an int > 0
+
+        Parameter cols: the number of aliens per row
+        Precondition: cols is an int > 0
+
+        Parameter speed: the number of seconds between alien steps
+        Precondition: speed is a number > 0
+
+        Parameter ticks: the number of simulation ticks per step (frame skip)
+        Precondition: ticks is an int > 0
+
+        Parameter capacity: the number of bolts the observation can hold; any
+        bolt beyond that is left out of the observation
+        Precondition: capacity is an int > 0
+
+        Parameter seed: the seed of the first game
+        Precondition: seed is an int, or None to seed from the system
+
+        Parameter out: the arrays to use for 'formation', 'ship', 'bolts' and
+        'nbolts' in the observation, for example views of shared memory
+        Precondition: out is None or a dict with those four keys, mapping to
+        writable arrays of the shapes and types listed above
+        """
+        if out is None:
+            out={'formation':np.zeros(2),'ship':np.zeros(2),
+            'bolts':np.zeros((capacity,4),dtype=np.float32),
+            'nbolts':np.zeros(1,dtype=np.int32)}
+        self._wave=Wave(headless=True,seed=seed,rows=rows,cols=cols,
+        speed=speed,clock=SimClock(scale=None,maxticks=ticks))
+        self._sim=self._wave.getSim()
+        self._ticks=ticks
+        self._aliens=np.frombuffer(self._sim.getAliveBuffer(),
+        dtype=np.uint8).reshape(rows,cols)
+        self._formation=out['formation']
+        self._ship=out['ship']
+        self._bolts=out['bolts']
+        self._nbolts=out['nbolts']
+        self._obs={'aliens':self._aliens,'formation':self._formation,
+        'ship':self._ship,'bolts':self._bolts,'nbolts':self._nbolts}
+        self._info={}
+        self._used=0
+        self._score=0
+        self._done=False
+        self._observe()
+
+
+    # PUBLIC METHODS
+    def reset(self,seed=None):
+        """
+        Starts a new game and returns the first observation.
+
+        Parameter seed: the seed of the game
+        Precondition: seed is an int, or None to seed from the system
+        """
+        self._sim.reset(seed)
+        self._score=0
+        self._done=False
+        self._observe()
+        return self._obs
+
+
+    def step(self,action):
+        """
+        Plays one step with the given action.
+
+        Returns the tuple (observation, reward, done, info), where the reward is
+        the number of points scored during the step.
+
+        Parameter action: the action to take
+        Precondition: action is an int and 0<=action<ACTION_COUNT
+        """
+        assert not self._done, 'the game is over; call reset first'
+        keys=ACTIONS[action]
+        self._wave.control(keys[0],keys[1],keys[2],0)
+        if self._wave.getNoAliens()==0:
+            self._done=True
+        elif self._wave.getLives()==0 or self._wave._trackDown()<DEFENSE_LINE:
+            self._done=True
+        elif self._wave._shipExist():
+            self._wave.setShip()
+        score=self._wave.getScore()
+        reward=score-self._score
+        self._score=score
+        self._observe()
+        return (self._obs,reward,self._done,self._info)
+
+
+    # HIDDEN METHODS
+    def _observe(self):
+        """
+        Writes the state of the simulation into the observation arrays.
+        """
+        offset=self._sim.getOffset()
+        self._formation[0]=offset[0]
+        self._formation[1]=offset[1]
+        self._ship[0]=self._sim.getShipX()
+        self._ship[1]=self._sim.isShipAlive()
+        bolts=self._bolts
+        n=0
+        capacity=len(bolts)
+        for bolt in self._sim.getBolts():
+            if n==capacity:
+                break
+            bolts[n,0]=bolt.x
+            bolts[n,1]=bolt.y
+            bolts[n,2]=bolt.velocity
+            bolts[n,3]=bolt.kind
+            n+=1
+        if n<self._used:
+            bolts[n:self._used]=0
+        self._used=n
+        self._nbolts[0]=n
@@ -4,13 +4,53 @@ A module to support simple 2D game development.
 This module is a simple wrapper around Kivy interfaces to make 2D game development
 simpler for students in CS 1110.
 
+Importing this package is cheap.  Each class is only imported (along with the Kivy
+modules it needs) the first time it is used, so a program that only needs a few of
+the classes never loads the others.  A star import still imports every class.
+
 Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
-from .gobject import GObject, GScene
-from .grectangle import GRectangle, GEllipse, GImage, GLabel
-from .gsprite import GSprite
-from .gpath import GPath, GTriangle, GPolygon
-from .gview import GInput, GView
-from .sound import Sound, SoundLibrary
-from .app import GameApp
\ No newline at end of file
+import importlib
+
+# The module defining each public name of this package
+_MODULES = {
+    'GObject': 'gobject', 'GScene': 'gobject', 'set_positions': 'gobject',
+    'GLeanObject': 'glean', 'GBox': 'glean',
+    'GRectangle': 'grectangle', 'GEllipse': 'grectangle',
+    'GImage': 'grectangle', 'GLabel': 'grectangle',
+    'GSprite': 'gsprite',
+    'GSpriteBatch': 'gbatch',
+    'GAtlas': 'gatlas',
+    'GPath': 'gpath', 'GTriangle': 'gpath', 'GPolygon': 'gpath',
+    'GStarfield': 'gstarfield',
+    'GNumber': 'gnumber',
+    'GLayer': 'glayer',
+    'GInput': 'gview', 'GView': 'gview',
+    'Sound': 'sound', 'SoundLibrary': 'sound',
+    'GameApp': 'app',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    """
+    Imports a public name of this package the first time it is used.
+
+    :param name: the name to import
+    :type name:  ``str``
+    """
+    if not name in _MODULES:
+        raise AttributeError('module %r has no attribute %r' % (__name__,name))
+    value = getattr(importlib.import_module('.'+_MODULES[name],__name__),name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    :return: the public names of this package
+    :rtype:  ``list``
+    """
+    return sorted(set(globals()) | set(__all__))
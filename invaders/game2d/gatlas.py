@@ -0,0 +1,159 @@
+"""
+A module to support a shared texture atlas.
+
+Every image and filmstrip of a game is usually loaded into its own texture, and every
+:class:`GSprite` slices its filmstrip into frames whenever it is reset.  This module
+packs the images into a single large texture once, when the game starts, and cuts
+every frame of every filmstrip only once.  Afterwards, finding the frames of a sprite
+is a dictionary lookup.
+
+The atlas is a 'singleton' with only class methods, just like the texture cache of
+:class:`GameApp`.  Images that were not packed, or that do not fit in the atlas, are
+still loaded with :meth:`GameApp.load_texture` and cached the same way.
+
+Author: agent (agent@local), extending the game2d package by Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+from kivy.graphics.texture import Texture
+from .app import GameApp
+
+
+# #mark -
+class GAtlas(object):
+    """
+    A class representing the texture atlas of the game.
+
+    **You should never construct an object of this class**.  Call the class method
+    :meth:`build` once, in the ``start`` method of your game, with the names of the
+    images to pack.  Then use :meth:`texture` and :meth:`frames` instead of loading
+    the images yourself.
+    """
+    # The largest width and height of the atlas texture
+    SIZE = 2048
+    # The empty pixels around each image, so filtering does not bleed between them
+    PADDING = 1
+
+    # The atlas texture [Texture, or None if not built]
+    _atlas = None
+    # The texture of each image [dict mapping str to Texture or TextureRegion]
+    _textures = {}
+    # The frames of each filmstrip [dict mapping (str,(int,int)) to tuple]
+    _frames = {}
+
+    @classmethod
+    def build(cls,names):
+        """
+        Packs the given images into the atlas.
+
+        The images are placed in rows (shelves), tallest first.  An image that does
+        not fit in the space that is left keeps its own texture.  Building the atlas a
+        second time replaces the first one, and clears every cached frame.
+
+        :param names: the file names of the images, as given to ``load_texture``
+        :type names:  list of ``str``
+        """
+        cls._atlas = None
+        cls._textures = {}
+        cls._frames = {}
+        loaded = []
+        for name in names:
+            texture = GameApp.load_texture(name)
+            if texture:
+                loaded.append((name,texture))
+        loaded.sort(key=lambda item: -item[1].height)
+
+        # Place the images on shelves
+        places = []
+        x = y = height = 0
+        for name, texture in loaded:
+            w = texture.width+2*cls.PADDING
+            h = texture.height+2*cls.PADDING
+            if w > cls.SIZE:
+                continue
+            if x+w > cls.SIZE:
+                x = 0
+                y += height
+                height = 0
+            if y+h > cls.SIZE:
+                continue
+            places.append((name,texture,x+cls.PADDING,y+cls.PADDING))
+            x += w
+            height = max(height,h)
+        if not places:
+            return
+
+        # Copy the pixels into the atlas
+        size = max(x+cls.PADDING for name, texture, x, y in places)+cls.PADDING
+        top = max(y+texture.height for name, texture, x, y in places)+cls.PADDING
+        atlas = Texture.create(size=(size,top), colorfmt='rgba')
+        atlas.blit_buffer(bytes(4*size*top), colorfmt='rgba', bufferfmt='ubyte')
+        for name, texture, x, y in places:
+            atlas.blit_buffer(texture.pixels, pos=(x,y), size=texture.size,
+                              colorfmt='rgba', bufferfmt='ubyte')
+            region = atlas.get_region(x,y,texture.width,texture.height)
+            # Images are usually loaded upside down and flipped when drawn
+            if texture.uvsize[1] < 0:
+                region.flip_vertical()
+            cls._textures[name] = region
+        cls._atlas = atlas
+
+    @classmethod
+    def texture(cls,name):
+        """
+        Returns the texture of the given image.
+
+        The texture is a region of the atlas if the image was packed.  Otherwise it is
+        loaded (once) with :meth:`GameApp.load_texture`.
+
+        :param name: the file name of the image
+        :type name:  ``str``
+
+        :return: the texture of the image, or None if it cannot be loaded
+        :rtype:  ``Texture`` or ``None``
+        """
+        if not name in cls._textures:
+            cls._textures[name] = GameApp.load_texture(name)
+        return cls._textures[name]
+
+    @classmethod
+    def frames(cls,name,format):
+        """
+        Returns the frames of the given filmstrip.
+
+        The frames are cut left-to-right and top-to-bottom, as :class:`GSprite` has
+        always cut them, and only the first time a filmstrip is asked for.  The same
+        tuple is returned every time afterwards.  Each row is one frame height below
+        the one before it, so the frames need not be square.
+
+        :param name: the file name of the filmstrip
+        :type name:  ``str``
+
+        :param format: the rows and columns of the filmstrip
+        :type format:  2-element tuple of ``int`` > 0
+
+        :return: the texture region of each frame (all None if it cannot be loaded)
+        :rtype:  ``tuple``
+        """
+        key = (name,format)
+        if key in cls._frames:
+            return cls._frames[key]
+
+        rows, cols = format
+        texture = cls.texture(name)
+        if not texture:
+            frames = (None,)*(rows*cols)
+        else:
+            width  = texture.width/cols
+            height = texture.height/rows
+            frames = []
+            ty = 0
+            for row in range(rows):
+                tx = 0
+                for col in range(cols):
+                    frames.append(texture.get_region(int(tx),texture.height-int(ty)-int(height),
+                                                     int(width),int(height)))
+                    tx += width
+                ty += height
+            frames = tuple(frames)
+        cls._frames[key] = frames
+        return frames
@@ -0,0 +1,281 @@
+"""
+A module to support drawing many sprites at once.
+
+A :class:`GSprite` is drawn with its own transforms, color and rectangle, so a
+thousand sprites are a thousand separate draws.  A sprite batch instead draws any
+number of copies of the same filmstrip with a single Kivy ``Mesh``.  The copies all
+have the same size and show the same animation frame, which is the case for a
+formation of identical enemies.
+
+For every animation frame, the batch keeps one mesh with the texture coordinates of
+that frame already in place, and only draws the mesh of the current frame.  Changing
+the frame is therefore a single change, however many sprites there are.  The
+vertices of a sprite are only written when it is added, or when the batch is
+resized.  Removing a sprite only rewrites the indices of the meshes.
+
+Author: agent (agent@local), extending the game2d package by Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .gobject import GObject
+from .app import GameApp
+from .gatlas import GAtlas
+
+# Kivy meshes use 16 bit indices, and every sprite has 4 vertices
+MAX_SPRITES = 65536//4
+
+
+# #mark -
+class GSpriteBatch(GObject):
+    """
+    A class representing many copies of a filmstrip, drawn as one.
+
+    The filmstrip is given by the attributes ``source`` and ``format``, exactly as in
+    :class:`GSprite`.  Every copy (a sprite of the batch) has the size given by
+    ``width`` and ``height``, and is centered at a point relative to the position
+    (x,y) of the batch.  Moving the batch moves every sprite at once.
+
+    Sprites are added with :meth:`add`, which returns a handle for the sprite, and
+    removed with :meth:`remove`.  A batch holds at most ``MAX_SPRITES`` sprites.
+    """
+
+    # MUTABLE PROPERTIES
+    @property
+    def frame(self):
+        """
+        The current animation frame of every sprite in this batch.
+
+        **invariant**. Value is an int 0..rows*columns-1 of the filmstrip ``format``.
+        """
+        return self._frame
+
+    @frame.setter
+    def frame(self,value):
+        assert type(value) == int, '%s is not an int' % repr(value)
+        assert value >= 0 and value < self._format[0]*self._format[1], '%s is out of range' % repr(value)
+        if value != self._frame:
+            self._frame = value
+            if self._defined:
+                self._body.clear()
+                self._body.add(self._meshes[value])
+
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def source(self):
+        """
+        The source file of the filmstrip.
+
+        **invariant**. Value is a string refering to a valid file.
+        """
+        return self._source
+
+    @property
+    def size(self):
+        """
+        The number of sprites in this batch.
+
+        **invariant**. Value is an int >= 0.
+        """
+        return len(self._indices)//6
+
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new sprite batch.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to draw
+        three 33x33 copies of the filmstrip ``alien-strip1.png``, which has 3 rows and
+        2 columns, use the constructor::
+
+            GSpriteBatch(width=33,height=33,source='alien-strip1.png',format=(3,2),
+                         positions=[(50,600),(100,600),(150,600)])
+
+        This class supports the same keywords as :class:`GSprite`, except for the
+        colors.  The new keyword ``positions`` is a list of the centers of the first
+        sprites; their handles are 0, 1, 2, ... in order.
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        source = keywords['source'] if 'source' in keywords else None
+        assert GameApp.is_image(source), '%s is not an image file' % repr(source)
+        self._source = source
+        format = keywords['format'] if 'format' in keywords else (1,1)
+        assert type(format) == tuple and len(format) == 2, '%s does is not a tuple pair' % repr(format)
+        assert type(format[0]) == int and type(format[1]) == int, '%s does not have int values' % repr(format)
+        assert format[0] > 0 and format[1] > 0, '%s does not have valid values' % repr(format)
+        self._format = format
+        self._frame = keywords['frame'] if 'frame' in keywords else 0
+        assert type(self._frame) == int and 0 <= self._frame < format[0]*format[1], '%s is out of range' % repr(self._frame)
+        self._vertices = [[] for frame in range(format[0]*format[1])]
+        self._centers = []
+        self._indices = []
+        self._slots = []
+        self._handles = []
+        self._meshes = None
+        self._body = InstructionGroup()
+        GObject.__init__(self,**keywords)
+        self._texture = GAtlas.texture(self._source)
+        if not self._texture:
+            print('Failed to load',repr(self._source))
+        self._coords = self._load_coords()
+        for (x,y) in (keywords['positions'] if 'positions' in keywords else []):
+            self._append(x,y)
+        self._reset()
+        self._defined = True
+
+
+    # PUBLIC METHODS
+    def add(self,x,y):
+        """
+        Adds a sprite centered at (x,y) and returns its handle.
+
+        :param x: the horizontal coordinate of the sprite center, relative to the batch
+        :type x:  ``int`` or ``float``
+
+        :param y: the vertical coordinate of the sprite center, relative to the batch
+        :type y:  ``int`` or ``float``
+        """
+        handle = self._append(x,y)
+        self._push_vertices()
+        self._push_indices()
+        return handle
+
+    def remove(self,handle):
+        """
+        Removes a sprite from this batch.
+
+        Nothing happens if the sprite has already been removed.  The handles of the
+        other sprites do not change.
+
+        :param handle: the handle of the sprite
+        :type handle:  ``int`` returned by :meth:`add` (or given by ``positions``)
+        """
+        slot = self._slots[handle]
+        if slot < 0:
+            return
+        last = len(self._handles)-1
+        if slot != last:
+            moved = self._handles[last]
+            self._indices[6*slot:6*slot+6] = self._indices[6*last:6*last+6]
+            self._handles[slot] = moved
+            self._slots[moved] = slot
+        del self._indices[6*last:]
+        del self._handles[last]
+        self._slots[handle] = -1
+        self._push_indices()
+
+    def contains_sprite(self,handle):
+        """
+        Checks whether a sprite is still in this batch.
+
+        :param handle: the handle of the sprite
+        :type handle:  ``int`` returned by :meth:`add` (or given by ``positions``)
+
+        :return: True if the sprite has not been removed
+        :rtype:  ``bool``
+        """
+        return self._slots[handle] >= 0
+
+
+    # HIDDEN METHODS
+    def _load_coords(self):
+        """
+        Returns the texture coordinates of each animation frame.
+
+        The coordinates of a frame are the 8 values of its bottom left, bottom right,
+        top right and top left corners, taken from the frames of the filmstrip in
+        :class:`GAtlas`, so they work whether or not the image is in the atlas.
+        """
+        rows, cols = self._format
+        if not self._texture:
+            return [(0.0,0.0,1.0,0.0,1.0,1.0,0.0,1.0)]*(rows*cols)
+        return [tuple(region.tex_coords) for region in GAtlas.frames(self._source,self._format)]
+
+    def _append(self,x,y):
+        """
+        Writes the vertices of a new sprite and returns its handle.
+
+        :param x: the horizontal coordinate of the sprite center
+        :type x:  ``int`` or ``float``
+
+        :param y: the vertical coordinate of the sprite center
+        :type y:  ``int`` or ``float``
+        """
+        assert type(x) in [int,float] and type(y) in [int,float], '%s is not a point' % repr((x,y))
+        handle = len(self._slots)
+        assert handle < MAX_SPRITES, 'a batch holds at most %d sprites' % MAX_SPRITES
+        x0 = x-self._width/2.0
+        x1 = x+self._width/2.0
+        y0 = y-self._height/2.0
+        y1 = y+self._height/2.0
+        for frame in range(len(self._vertices)):
+            u0, v0, u1, v1, u2, v2, u3, v3 = self._coords[frame]
+            self._vertices[frame].extend((x0,y0,u0,v0, x1,y0,u1,v1, x1,y1,u2,v2, x0,y1,u3,v3))
+        self._centers.append((x,y))
+        k = 4*handle
+        self._indices.extend((k,k+1,k+2,k+2,k+3,k))
+        self._slots.append(len(self._handles))
+        self._handles.append(handle)
+        return handle
+
+    def _resize(self):
+        """
+        Rewrites the corners of every sprite for a new width or height.
+
+        Sprites that were removed are rewritten too, as they keep their vertices.  The
+        texture coordinates do not change.
+        """
+        w = self._width/2.0
+        h = self._height/2.0
+        for handle in range(len(self._centers)):
+            x, y = self._centers[handle]
+            x0 = x-w
+            x1 = x+w
+            y0 = y-h
+            y1 = y+h
+            k = 16*handle
+            for vertices in self._vertices:
+                vertices[k   ] = x0; vertices[k+ 1] = y0
+                vertices[k+ 4] = x1; vertices[k+ 5] = y0
+                vertices[k+ 8] = x1; vertices[k+ 9] = y1
+                vertices[k+12] = x0; vertices[k+13] = y1
+        self._push_vertices()
+
+    def _push_vertices(self):
+        """
+        Copies the vertices into the meshes.
+        """
+        if not self._meshes is None:
+            for frame in range(len(self._meshes)):
+                self._meshes[frame].vertices = self._vertices[frame]
+
+    def _push_indices(self):
+        """
+        Copies the indices of the sprites still in the batch into the meshes.
+        """
+        if not self._meshes is None:
+            for mesh in self._meshes:
+                mesh.indices = self._indices
+
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        texture = self._texture if self._texture else None
+        # One mesh per frame; only the mesh of the current frame is drawn
+        self._meshes = []
+        for frame in range(len(self._vertices)):
+            self._meshes.append(Mesh(vertices=self._vertices[frame],indices=self._indices,
+                                     mode='triangles',texture=texture))
+        self._body.clear()
+        self._body.add(self._meshes[self._frame])
+        self._cache.add(Color(1,1,1))
+        self._cache.add(self._body)
+        self._cache.add(PopMatrix())
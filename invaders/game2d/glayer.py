@@ -0,0 +1,203 @@
+"""
+A module to support cached drawing layers.
+
+Text and images that never change are still drawn through their own instructions,
+every frame.  A layer instead draws a group of objects once, into an offscreen Kivy
+``Fbo``, and afterwards is drawn as a single textured rectangle.  The objects are only
+drawn again when the layer is told that they changed.
+
+Author: agent (agent@local), extending the game2d package by Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .gobject import GObject
+
+
+# #mark -
+class GLayer(GObject):
+    """
+    A class representing a group of objects drawn once into a texture.
+
+    The layer covers the rectangle of size ``width`` x ``height`` centered at its
+    position (x,y).  The objects of the layer are drawn in the coordinates of that
+    rectangle, with (0,0) at its bottom left corner.  So a layer centered in the window
+    and of the same size as the window uses the same coordinates as the window.
+
+    Objects are added with :meth:`add` and removed with :meth:`remove`.  An object in a
+    layer belongs to it, just as a retained object belongs to the view: calling its
+    ``draw`` method does nothing.  Changing an object in the layer does not change the
+    layer until :meth:`invalidate` is called.
+
+    The layer is itself an object.  It may be drawn every frame, or retained by the
+    view, like any other.
+    """
+
+    # MUTABLE PROPERTIES
+    @property
+    def objects(self):
+        """
+        The objects of this layer, in drawing order.
+
+        Assigning this attribute replaces every object of the layer at once, and
+        redraws the layer only once.
+
+        **invariant**: Value is a tuple of :class:`GObject`
+        """
+        return tuple(self._objects)
+
+    @objects.setter
+    def objects(self,value):
+        for obj in self._objects:
+            self._detach(obj)
+        self._objects = []
+        self._content.clear()
+        for obj in value:
+            self._attach(obj)
+        if self._defined:
+            self.invalidate()
+
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def texture(self):
+        """
+        The texture holding the drawn objects of this layer.
+
+        **invariant**: Value is a Kivy ``Texture``
+        """
+        return self._fbo.texture
+
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new, empty layer.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to make a
+        layer covering an 800x700 window, use the constructor::
+
+            GLayer(x=400,y=350,width=800,height=700)
+
+        This class supports the same keywords as :class:`GObject`, except for the
+        colors.  The new keyword ``objects`` is a list of the first objects of the
+        layer.
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        self._objects = []
+        self._fbo = None
+        self._content = InstructionGroup()
+        GObject.__init__(self,**keywords)
+        self.objects = keywords['objects'] if 'objects' in keywords else []
+        self._reset()
+        self._defined = True
+
+
+    # PUBLIC METHODS
+    def add(self,obj):
+        """
+        Adds an object on top of the others in this layer, and redraws the layer.
+
+        :param obj: the object to add
+        :type obj:  :class:`GObject` not retained by a view or in another layer
+        """
+        self._attach(obj)
+        self.invalidate()
+
+    def remove(self,obj):
+        """
+        Removes an object from this layer, and redraws the layer.
+
+        Nothing happens if the object is not in this layer.
+
+        :param obj: the object to remove
+        :type obj:  :class:`GObject`
+        """
+        if not obj in self._objects:
+            return
+        self._objects.remove(obj)
+        self._content.remove(obj._slot)
+        self._detach(obj)
+        self.invalidate()
+
+    def clear(self):
+        """
+        Removes every object from this layer, and redraws the (now empty) layer.
+        """
+        self.objects = []
+
+    def contains_object(self,obj):
+        """
+        Checks whether an object is in this layer.
+
+        :param obj: the object to check
+        :type obj:  :class:`GObject`
+
+        :return: True if the object is in this layer
+        :rtype:  ``bool``
+        """
+        return obj in self._objects
+
+    def invalidate(self):
+        """
+        Redraws the objects of this layer into its texture.
+
+        Call this after changing an object of the layer.  This is the only time the
+        objects of a layer are drawn.
+        """
+        if not self._fbo is None:
+            self._fbo.draw()
+
+
+    # HIDDEN METHODS
+    def _attach(self,obj):
+        """
+        Makes an object part of this layer, without redrawing the layer.
+
+        The object is held the same way that :class:`GView` holds a retained object,
+        so that the layer follows the object when its drawing cache is reset.
+
+        :param obj: the object to add
+        :type obj:  :class:`GObject` not retained by a view or in another layer
+        """
+        assert isinstance(obj,GObject), '%s is not a GObject' % repr(obj)
+        assert obj._slot is None, '%s is already retained' % repr(obj)
+        slot = InstructionGroup()
+        slot.add(obj._cache)
+        self._content.add(slot)
+        self._objects.append(obj)
+        obj._slot = slot
+        obj._hidden = False
+
+    def _detach(self,obj):
+        """
+        Lets go of an object of this layer, without redrawing the layer.
+
+        :param obj: the object to let go
+        :type obj:  :class:`GObject` in this layer
+        """
+        obj._slot.clear()
+        obj._slot = None
+        obj._hidden = False
+
+    def _reset(self):
+        """
+        Resets the drawing cache, and redraws the layer.
+        """
+        GObject._reset(self)
+        size = (max(1,int(round(self.width))),max(1,int(round(self.height))))
+        if not self._fbo is None:
+            self._fbo.remove(self._content)
+        self._fbo = Fbo(size=size)
+        self._fbo.add(ClearColor(0,0,0,0))
+        self._fbo.add(ClearBuffers())
+        self._fbo.add(self._content)
+        self._fbo.draw()
+        self._cache.add(Color(1,1,1))
+        self._cache.add(Rectangle(pos=(-self.width/2.0,-self.height/2.0),
+                                  size=(self.width,self.height),texture=self._fbo.texture))
+        self._cache.add(PopMatrix())
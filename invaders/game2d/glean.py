@@ -0,0 +1,234 @@
+"""
+A module to support lightweight objects for fast-moving shapes.
+
+A :class:`GObject` checks every value it is given, keeps its position in Kivy
+transforms, and has a full instance dictionary.  That is convenient, but an object
+that moves every frame pays for all of it every frame.  The objects in this module
+are leaner.  Their attributes are slots holding plain floats, the values are checked
+once, when the object is made, and the position is only copied to Kivy when the
+object is drawn.
+
+These objects cannot be rotated or scaled, and they do not check the values assigned
+to ``x``, ``y``, ``width`` or ``height`` at all.  Checks made with ``assert`` are also
+skipped entirely when Python runs with the ``-O`` flag, which is the production mode
+of this package.
+
+Author: agent (agent@local), extending the game2d package by Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from introcs.geom import Point2
+from .gobject import to_rgba
+
+
+# #mark -
+class GLeanObject(object):
+    """
+    A class representing a lightweight graphics object.
+
+    The attributes ``x`` and ``y`` are the center of the object, and ``width`` and
+    ``height`` its size.  They are plain floats, and assigning them does nothing else;
+    the Kivy instructions are updated the next time the object is drawn.
+
+    You should never make a `GLeanObject` directly.  Instead, you should use a subclass
+    such as :class:`GBox`.  A lean object may be retained by a view, just as a
+    :class:`GObject`, but it still needs its ``draw`` method called whenever it moves.
+    """
+    __slots__ = ('x','y','width','height','_cache','_slot','_hidden','_pushed')
+
+    # DERIVED PROPERTIES
+    @property
+    def left(self):
+        """
+        The left edge of this shape.
+
+        **invariant**: Value must be an ``int`` or ``float``.
+        """
+        return self.x-self.width/2.0
+
+    @property
+    def right(self):
+        """
+        The right edge of this shape.
+
+        **invariant**: Value must be an ``int`` or ``float``.
+        """
+        return self.x+self.width/2.0
+
+    @property
+    def top(self):
+        """
+        The vertical coordinate of the top edge.
+
+        **invariant**: Value must be an ``int`` or ``float``.
+        """
+        return self.y+self.height/2.0
+
+    @property
+    def bottom(self):
+        """
+        The vertical coordinate of the bottom edge.
+
+        **invariant**: Value must be an ``int`` or ``float``.
+        """
+        return self.y-self.height/2.0
+
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new lean object.
+
+        The keywords are ``x``, ``y``, ``width`` and ``height``, with the same meaning
+        and defaults as for :class:`GObject`.  They are checked here, and never again.
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        x = keywords['x'] if 'x' in keywords else 0
+        y = keywords['y'] if 'y' in keywords else 0
+        width  = keywords['width']  if 'width'  in keywords else 1
+        height = keywords['height'] if 'height' in keywords else 1
+        assert type(x) in [int,float], '%s is not a number' % repr(x)
+        assert type(y) in [int,float], '%s is not a number' % repr(y)
+        assert type(width)  in [int,float] and width  > 0, '%s is not a valid width'  % repr(width)
+        assert type(height) in [int,float] and height > 0, '%s is not a valid height' % repr(height)
+        self.x = float(x)
+        self.y = float(y)
+        self.width  = float(width)
+        self.height = float(height)
+        self._cache  = InstructionGroup()
+        self._slot   = None
+        self._hidden = False
+        self._pushed = None
+
+    def __str__(self):
+        """
+        :return: A readable string representation of this object.
+        :rtype:  ``str``
+        """
+        return '[center=(%s,%s),width=%s,height=%s]' \
+                % (repr(self.x),repr(self.y),repr(self.width),repr(self.height))
+
+    def __repr__(self):
+        """
+        :return: An unambiguous string representation of this object.
+        :rtype:  ``str``
+        """
+        return str(self.__class__)+str(self)
+
+
+    # PUBLIC METHODS
+    def contains(self,point):
+        """
+        Checks whether this shape contains the point
+
+        :param point: the point to check
+        :type point: :class:`Point2` or a pair of numbers
+
+        :return: True if the shape contains this point
+        :rtype:  ``bool``
+        """
+        if isinstance(point,Point2):
+            point = (point.x,point.y)
+        return abs(point[0]-self.x) < self.width/2.0 and abs(point[1]-self.y) < self.height/2.0
+
+    def draw(self, view):
+        """
+        Draws this shape in the provide view.
+
+        This copies the position and size to the Kivy instructions if they changed.
+        If the object is retained by the view, that is all it does.
+
+        :param view: view to draw to
+        :type view:  :class:`GView`
+        """
+        bounds = (self.x,self.y,self.width,self.height)
+        if bounds != self._pushed:
+            self._push(bounds)
+            self._pushed = bounds
+        if self._slot is None:
+            view.draw(self._cache)
+
+
+    # HIDDEN METHODS
+    def _push(self,bounds):
+        """
+        Copies the position and size of this object to its Kivy instructions.
+
+        :param bounds: the center and size of this object
+        :type bounds:  4-element tuple of ``float``
+        """
+        pass
+
+
+# #mark -
+class GBox(GLeanObject):
+    """
+    A class representing a lean, solid rectangle.
+
+    The interior of the rectangle has the color ``fillcolor``.  A box has no border.
+    """
+    __slots__ = ('_color','_rgba','_bounds')
+
+    # MUTABLE PROPERTIES
+    @property
+    def fillcolor(self):
+        """
+        The fill color of this box.
+
+        Colors may be given in any form accepted by :class:`GObject`.  Changing the
+        color only changes the existing Kivy color instruction.
+
+        **invariant**: Value must be a 4-element tuple of floats between 0 and 1.
+        """
+        return self._rgba
+
+    @fillcolor.setter
+    def fillcolor(self,value):
+        rgba = to_rgba(value)
+        assert not rgba is None, '%s is not a valid color' % repr(value)
+        if rgba is not self._rgba:
+            self._rgba = rgba
+            self._color.rgba = rgba
+
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new solid box.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to create a
+        red 4x16 box centered at (100,50), use the constructor::
+
+            GBox(x=100,y=50,width=4,height=16,fillcolor='red')
+
+        The keywords are ``x``, ``y``, ``width``, ``height`` and ``fillcolor`` (default
+        white).
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        GLeanObject.__init__(self,**keywords)
+        self._color  = Color(1,1,1,1)
+        self._rgba   = (1.0,1.0,1.0,1.0)
+        self._bounds = Rectangle(pos=(0,0),size=(0,0))
+        if 'fillcolor' in keywords:
+            self.fillcolor = keywords['fillcolor']
+        self._cache.add(self._color)
+        self._cache.add(self._bounds)
+
+
+    # HIDDEN METHODS
+    def _push(self,bounds):
+        """
+        Copies the position and size of this box to its rectangle.
+
+        :param bounds: the center and size of this box
+        :type bounds:  4-element tuple of ``float``
+        """
+        x, y, width, height = bounds
+        self._bounds.pos  = (x-width/2.0,y-height/2.0)
+        self._bounds.size = (width,height)
@@ -0,0 +1,206 @@
+"""
+A module to support fast numeric displays.
+
+A :class:`GLabel` renders its whole string with the font every time its text changes.
+That is fine for messages, but not for a score that changes many times a second.  A
+numeric display instead renders the ten digits of a font once, and then draws any
+number as a row of textured quads, one per digit.  Changing the number only changes
+the textures and positions of these quads.
+
+The digits of each font and size are rendered only once, and are shared by every
+numeric display that uses them.
+
+Author: agent (agent@local), extending the game2d package by Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from .gobject import GObject
+
+
+# #mark -
+class GNumber(GObject):
+    """
+    A class representing a non-negative integer drawn with a font.
+
+    The digits are centered at the position (x,y) of this object.  As with
+    :class:`GLabel`, the attribute ``linecolor`` is the color of the digits, and the
+    attribute ``fillcolor`` is the color of the box behind them.
+
+    The attributes ``width`` and ``height`` are the size of the digits currently shown,
+    and may not be changed.
+    """
+    # The textures of the digits 0..9 of each font [dict mapping (name,size) to tuple]
+    _glyphs = {}
+
+    # MUTABLE PROPERTIES
+    @property
+    def value(self):
+        """
+        The number displayed.
+
+        **invariant**: Value must be an ``int`` >= 0
+        """
+        return self._value
+
+    @value.setter
+    def value(self,value):
+        assert type(value) == int and value >= 0, '%s is not a valid number' % repr(value)
+        if value != self._value:
+            self._value = value
+            if self._defined:
+                self._layout()
+
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def font_name(self):
+        """
+        The font of the digits.
+
+        **invariant**: Value must be a string naming a font file, or None for the
+        default font.
+        """
+        return self._font_name
+
+    @property
+    def font_size(self):
+        """
+        The size of the digits in points.
+
+        **invariant**: Value must be an ``int`` or ``float`` > 0
+        """
+        return self._font_size
+
+    @property
+    def width(self):
+        """
+        The width of the digits currently shown.
+
+        **invariant**: Value is a ``float`` >= 0
+        """
+        return self._textwidth
+
+    @width.setter
+    def width(self,value):
+        pass
+
+    @property
+    def height(self):
+        """
+        The height of the digits.
+
+        **invariant**: Value is a ``float`` >= 0
+        """
+        return self._textheight
+
+    @height.setter
+    def height(self,value):
+        pass
+
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new numeric display.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to show a
+        score of 0 in yellow, 40 point Arcade font, use the constructor::
+
+            GNumber(value=0,font_size=40,font_name='Arcade.ttf',linecolor='yellow')
+
+        This class supports the same keywords as :class:`GObject`, except ``width`` and
+        ``height``.  The new keywords are ``value`` (default 0), ``font_name`` (default
+        None) and ``font_size`` (default 12).
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        self._value = keywords['value'] if 'value' in keywords else 0
+        assert type(self._value) == int and self._value >= 0, '%s is not a valid number' % repr(self._value)
+        self._font_name = keywords['font_name'] if 'font_name' in keywords else None
+        self._font_size = keywords['font_size'] if 'font_size' in keywords else 12
+        assert type(self._font_size) in [int,float] and self._font_size > 0, '%s is not a valid size' % repr(self._font_size)
+        self._textwidth = self._textheight = 0.0
+        self._digits = []
+        self._box = None
+        GObject.__init__(self,**keywords)
+        self._reset()
+        self._defined = True
+
+
+    # HIDDEN METHODS
+    def _load_glyphs(self):
+        """
+        Returns the textures of the digits 0..9 in the font of this display.
+
+        The digits are rendered the first time a font and size is used.
+        """
+        key = (self._font_name,self._font_size)
+        if not key in GNumber._glyphs:
+            from kivy.core.text import Label as CoreLabel
+            glyphs = []
+            for digit in '0123456789':
+                if self._font_name is None:
+                    label = CoreLabel(text=digit,font_size=self._font_size)
+                else:
+                    label = CoreLabel(text=digit,font_size=self._font_size,font_name=self._font_name)
+                label.refresh()
+                glyphs.append(label.texture)
+            GNumber._glyphs[key] = tuple(glyphs)
+        return GNumber._glyphs[key]
+
+    def _layout(self):
+        """
+        Places the digit quads to show the current value.
+
+        New quads are only made when the value has more digits than ever before.
+        """
+        text = str(self._value)
+        if len(text) > len(self._digits):
+            self._reset()
+            return
+        glyphs = self._glyphs[(self._font_name,self._font_size)]
+        width = 0.0
+        height = 0.0
+        for c in text:
+            texture = glyphs[ord(c)-48]
+            width += texture.width
+            height = max(height,texture.height)
+        x = -width/2.0
+        for pos in range(len(self._digits)):
+            quad = self._digits[pos]
+            if pos < len(text):
+                texture = glyphs[ord(text[pos])-48]
+                quad.texture = texture
+                quad.pos = (x,-texture.height/2.0)
+                quad.size = texture.size
+                x += texture.width
+            else:
+                quad.size = (0,0)
+        self._textwidth = width
+        self._textheight = height
+        if not self._box is None:
+            self._box.pos = (-width/2.0,-height/2.0)
+            self._box.size = (width,height)
+
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        self._load_glyphs()
+        if not self._fillcolor is None:
+            self._box = Rectangle(pos=(0,0),size=(0,0))
+            self._cache.add(self._fillcolor)
+            self._cache.add(self._box)
+        else:
+            self._box = None
+        self._cache.add(Color(1,1,1) if self._linecolor is None else self._linecolor)
+        self._digits = [Rectangle(pos=(0,0),size=(0,0)) for c in str(self._value)]
+        for quad in self._digits:
+            self._cache.add(quad)
+        self._cache.add(PopMatrix())
+        self._layout()
@@ -10,7 +10,55 @@ Date:   August 1, 2017 (Python 3 version)
 """
 from kivy.graphics import *
 from kivy.graphics.instructions import *
-from introcs.geom import Point2, Matrix
+from introcs.geom import Point2
+import numpy as np
+import math
+
+# The colors resolved so far [dict mapping str or tuple to 4-element tuple]
+_COLORS = {}
+
+def to_rgba(c):
+    """
+    Converts a value representing a color into a 4-element tuple of floats.
+
+    Colors given as strings or sequences are resolved only the first time they are
+    seen.  Afterwards, the same value always returns the same (immutable) tuple, so
+    many objects of the same color share one tuple, and comparing two colors from
+    this function is a comparison of tuples, not of names.
+
+    Colormodel objects are mutable, so they are converted every time.
+
+    :return: The color as a 4-element tuple of floats between 0 and 1, or None if c is
+        not a color
+    :rtype:  ``tuple`` or ``None``
+
+    :param c: The value to convert
+    :type c:  any
+    """
+    key = tuple(c) if type(c) == list else c
+    try:
+        return _COLORS[key]
+    except (KeyError, TypeError):
+        pass
+
+    rgba = None
+    if type(c) in [tuple, list]:
+        if 3 <= len(c) <= 4 and all(type(z) in [int, float] and 0 <= z <= 1 for z in c):
+            rgba = tuple(float(z) for z in c)+((1.0,) if len(c) == 3 else ())
+    else:
+        import introcs
+        if type(c) in [introcs.RGB, introcs.HSV]:
+            return tuple(c.glColor())
+        if type(c) == str and (introcs.is_tkcolor(c) or introcs.is_webcolor(c)):
+            if c[0] == '#':
+                rgba = tuple(introcs.RGB.CreateWebColor(c).glColor())
+            else:
+                rgba = tuple(introcs.RGB.CreateName(c).glColor())
+
+    if not rgba is None:
+        _COLORS[key] = rgba
+    return rgba
+
 
 def is_color(c):
     """
@@ -26,15 +74,7 @@ def is_color(c):
     :param c: The value to test
     :type c:  any
     """
-    import introcs
-    if type(c) in [introcs.RGB, introcs.HSV]:
-        return True
-
-    if type(c) in [tuple, list] and 3 <= len(c) <= 4:
-        from functools import reduce
-        return reduce(lambda x, y: x and y, map(lambda z: type(z) in [int, float] and 0 <= z <= 1, c))
-
-    return type(c) == str and (introcs.is_tkcolor(c) or introcs.is_webcolor(c))
+    return not to_rgba(c) is None
 
 
 def is_num_tuple(t,size):
@@ -53,8 +93,7 @@ def is_num_tuple(t,size):
     :type size:  ``int`` >= 0
     """
     try:
-        from functools import reduce
-        return len(t) == size and reduce(lambda x, y: x and y, map(lambda z: type(z) in [int, float], t))
+        return len(t) == size and all(type(z) in [int, float] for z in t)
     except:
         return False
 
@@ -70,12 +109,39 @@ def is_gobject_list(g):
     :type g:  any
     """
     try:
-        from functools import reduce
-        return len(g) >= 0 and reduce(lambda x, y: x and y, map(lambda z: isinstance(z,GObject), g))
+        return len(g) >= 0 and all(isinstance(z,GObject) for z in g)
     except:
         return False
 
 
+def set_positions(objects,positions):
+    """
+    Moves many objects at once.
+
+    Object i is moved so that its center is the point in row i of ``positions``.  This
+    is the same as assigning ``x`` and ``y`` of every object, but the points are only
+    checked once, as a whole.  A :class:`GObject` is moved with a single write to its Kivy
+    transform, and a :class:`GLeanObject` with two writes to its float slots, which it
+    copies to Kivy when drawn.  Nothing else is done for either.
+
+    :param objects: the objects to move
+    :type objects:  sequence of :class:`GObject` or :class:`GLeanObject`
+
+    :param positions: the new centers of the objects
+    :type positions:  n x 2 array-like of numbers, where n is ``len(objects)``
+    """
+    points = np.asarray(positions,dtype=float)
+    if points.size == 0:
+        points = points.reshape(0,2)
+    assert points.shape == (len(objects),2), '%s is not a list of %d points' % (repr(positions),len(objects))
+    for obj, point in zip(objects,points.tolist()):
+        if isinstance(obj,GObject):
+            obj._trans.xy = point
+            obj._mtrue = False
+        else:
+            obj.x, obj.y = point
+
+
 # #mark -
 
 class GObject(object):
@@ -89,6 +155,10 @@ class GObject(object):
     subclasses: :class:`GRectangle`, :class:`GEllipse`, :class:`GImage`, :class:`GLabel`,
     :class:`GTriangle`, :class:`GPolygon`, or :class:`GPath`.
     """
+    # The group holding this object in a view, if retained (see GView.retain)
+    _slot = None
+    # Whether this object is retained, but hidden
+    _hidden = False
 
     # MUTABLE PROPERTIES
     @property
@@ -138,7 +208,7 @@ class GObject(object):
         assert value > 0, '%s is not positive' % repr(value)
         self._width = float(value)
         if self._defined:
-            self._reset()
+            self._resize()
 
     @property
     def height(self):
@@ -157,7 +227,7 @@ class GObject(object):
         assert value > 0, '%s is not positive' % repr(value)
         self._height = float(value)
         if self._defined:
-            self._reset()
+            self._resize()
 
     @property
     def scale(self):
@@ -203,9 +273,8 @@ class GObject(object):
     @angle.setter
     def angle(self,value):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
-        diff = np.allclose([self._rotate.angle],[value])
-        self._rotate.angle = float(value)
-        if not diff:
+        if float(value) != self._rotate.angle:
+            self._rotate.angle = float(value)
             self._mtrue = False
 
     @property
@@ -216,31 +285,31 @@ class GObject(object):
         This is the border color of the shape.  If there no value (e.g. the linecolor
         is ``None``), this shape will have no border.
 
-        The default representation of color in GObject is a 4-element list of floats
+        The default representation of color in GObject is a 4-element tuple of floats
         between 0 and 1 (representing r, g, b, and a).  As with the Turtle, you may also
         assign color an `RGB` or `HSV` object from `colormodel`, or a string with a valid
         color name. If you chose either of these alternate representations (a string or
         an object from `colormodel`), Python will automatically convert the result into
-        a 4-element list.
+        a 4-element tuple.  The tuple is shared by every object given the same color name or
+        sequence (see :func:`to_rgba`), so such colors may be compared with ``is``.
 
-        **invariant**: Value must be ``None`` or a 4-element list of floats between 0 and 1.
+        **invariant**: Value must be ``None`` or a 4-element tuple of floats between 0 and 1.
         """
-        return None if self._linecolor is None else self._linecolor.rgba
+        return self._linergba
 
     @linecolor.setter
     def linecolor(self,value):
-        import introcs
-        assert value is None or is_color(value), '%s is not a valid color' % repr(value)
-        if type(value) in [tuple, list] and len(value) == 3:
-            value = list(value)+[1.0]
-        elif type(value) in [introcs.RGB, introcs.HSV]:
-            value = value.glColor()
-        elif type(value) == str:
-            if value[0] == '#':
-                value = introcs.RGB.CreateWebColor(value).glColor()
-            else:
-                value = introcs.RGB.CreateName(value).glColor()
-
+        rgba = None if value is None else to_rgba(value)
+        assert value is None or not rgba is None, '%s is not a valid color' % repr(value)
+        value = rgba
+        if self._defined and value is self._linergba:
+            return
+        self._linergba = value
+
+        if self._defined and not value is None and not self._linecolor is None:
+            # Recolor the instruction already in the drawing cache
+            self._linecolor.rgba = value
+            return
         self._linecolor = None if value is None else Color(value[0],value[1],value[2],value[3])
         if self._defined:
             self._reset()
@@ -254,31 +323,31 @@ class GObject(object):
         the shape interior. If there no value (e.g. the fillcolor is ``None``), this
         shape will have no interior.
 
-        The default representation of color in GObject is a 4-element list of floats
+        The default representation of color in GObject is a 4-element tuple of floats
         between 0 and 1 (representing r, g, b, and a).  As with the Turtle, you may also
         assign color an `RGB` or `HSV` object from `colormodel`, or a string with a valid
         color name. If you chose either of these alternate representations (a string or
         an object from `colormodel`), Python will automatically convert the result into
-        a 4-element list.
+        a 4-element tuple.  The tuple is shared by every object given the same color name or
+        sequence (see :func:`to_rgba`), so such colors may be compared with ``is``.
 
-        **invariant**: Value must be ``None`` or a 4-element list of floats between 0 and 1.
+        **invariant**: Value must be ``None`` or a 4-element tuple of floats between 0 and 1.
         """
-        return None if self._fillcolor is None else self._fillcolor.rgba
+        return self._fillrgba
 
     @fillcolor.setter
     def fillcolor(self,value):
-        import introcs
-        assert value is None or is_color(value), '%s is not a valid color' % repr(value)
-        if type(value) in [tuple, list] and len(value) == 3:
-            value = list(value)+[1.0]
-        elif type(value) in [introcs.RGB, introcs.HSV]:
-            value = value.glColor()
-        elif type(value) == str:
-            if value[0] == '#':
-                value = introcs.RGB.CreateWebColor(value).glColor()
-            else:
-                value = introcs.RGB.CreateName(value).glColor()
-
+        rgba = None if value is None else to_rgba(value)
+        assert value is None or not rgba is None, '%s is not a valid color' % repr(value)
+        value = rgba
+        if self._defined and value is self._fillrgba:
+            return
+        self._fillrgba = value
+
+        if self._defined and not value is None and not self._fillcolor is None:
+            # Recolor the instruction already in the drawing cache
+            self._fillcolor.rgba = value
+            return
         self._fillcolor = None if value is None else Color(value[0],value[1],value[2],value[3])
         if self._defined:
             self._reset()
@@ -320,11 +389,7 @@ class GObject(object):
         if self._rotate.angle == 0.0:
             return self.x-self.width/2.0
 
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[0]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[0]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[0]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[0]
-        return min(p0,p1,p2,p3)
+        return min(self._corners()[:,0])
 
     @left.setter
     def left(self,value):
@@ -350,11 +415,7 @@ class GObject(object):
         if self._rotate.angle == 0.0:
             return self.x+self.width/2.0
 
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[0]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[0]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[0]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[0]
-        return max(p0,p1,p2,p3)
+        return max(self._corners()[:,0])
 
     @right.setter
     def right(self,value):
@@ -380,11 +441,7 @@ class GObject(object):
         if self._rotate.angle == 0.0:
             return self.y+self.height/2.0
 
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[1]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[1]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[1]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[1]
-        return max(p0,p1,p2,p3)
+        return max(self._corners()[:,1])
 
     @top.setter
     def top(self,value):
@@ -411,11 +468,7 @@ class GObject(object):
         if self._rotate.angle == 0.0:
             return self.y-self.height/2.0
 
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[1]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[1]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[1]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[1]
-        return min(p0,p1,p2,p3)
+        return min(self._corners()[:,1])
 
 
     @bottom.setter
@@ -431,12 +484,14 @@ class GObject(object):
         """
         The transformation matrix for this object
 
-        This value is constructed dynamically as needed.  It should only be used
-        internally in this package
+        This value is a 3x3 affine matrix taking the local coordinates of this object
+        to the coordinates of its parent.  It is only computed when needed, and is
+        then cached until the position, angle or scale changes.  It should only be
+        used internally in this package
 
-        **invariant**: Either a :class:`Matrix` or ``None``
+        **invariant**: Value is a 3x3 ``numpy.ndarray``
         """
-        if not self._mtrue or self._matrix is None:
+        if not self._mtrue:
             self._build_matrix()
         return self._matrix
 
@@ -445,12 +500,12 @@ class GObject(object):
         """
         The inverse transformation matrix for this object
 
-        This value is constructed dynamically as needed.  It should only be used
-        internally in this package
+        This value is a 3x3 affine matrix, cached along with :attr:`matrix`.  It
+        should only be used internally in this package
 
-        **invariant**: Either a :class:`Matrix` or ``None``
+        **invariant**: Value is a 3x3 ``numpy.ndarray``
         """
-        if not self._mtrue or self._matrix is None:
+        if not self._mtrue:
             self._build_matrix()
         return self._invrse
 
@@ -479,6 +534,11 @@ class GObject(object):
         # Set the properties.
         self._defined = False
 
+        # The transform matrices are computed when first needed
+        self._mtrue  = False
+        self._matrix = None
+        self._invrse = None
+
         # Create the Kivy transforms for position and size
         self._trans  = Translate(0,0,0)
         self._rotate = Rotate(angle=0,axis=(0,0,1))
@@ -542,9 +602,12 @@ class GObject(object):
         """
         Checks whether this shape contains the point
 
-        By default, this method just checks the bounding box of the shape.
+        By default, this method just checks the bounding box of the shape.  The point is
+        moved to the local coordinate system first, so the box is rotated and scaled
+        along with the shape.
 
-        **Warning**: Using this method on a rotated object may slow down your framerate.
+        **Warning**: Using this method on a rotated or scaled object may slow down your
+        framerate.
 
         :param point: the point to check
         :type point: :class:`Point2` or a pair of numbers
@@ -556,11 +619,31 @@ class GObject(object):
             point = (point.x,point.y)
         assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
 
-        if self._rotate.angle == 0.0:
+        if self._rotate.angle == 0.0 and self._scale.x == 1.0 and self._scale.y == 1.0:
             return abs(point[0]-self.x) < self.width/2.0 and abs(point[1]-self.y) < self.height/2.0
 
-        p = self.matrix.inverse()._transform(point[0],point[1])
-        return abs(p[0]) < self.width/2.0 and abs(p[1]) < self.height/2.0
+        inv = self.inverse
+        px = inv[0,0]*point[0]+inv[0,1]*point[1]+inv[0,2]
+        py = inv[1,0]*point[0]+inv[1,1]*point[1]+inv[1,2]
+        return abs(px) < self.width/2.0 and abs(py) < self.height/2.0
+
+    def contains_many(self,points):
+        """
+        Checks which of many points this shape contains.
+
+        The points are all moved to the local coordinate system with one matrix
+        multiplication (see :meth:`transform_points`), and then checked against the
+        bounding box of the shape.  The answer for each point is the same as that of
+        :meth:`contains`.
+
+        :param points: the points to check
+        :type points:  n x 2 array-like of numbers
+
+        :return: whether the shape contains each point
+        :rtype:  ``numpy.ndarray`` of n ``bool``
+        """
+        local = self.transform_points(points)
+        return (np.abs(local[:,0]) < self.width/2.0) & (np.abs(local[:,1]) < self.height/2.0)
 
     def transform(self,point):
         """
@@ -578,21 +661,41 @@ class GObject(object):
         :rtype:  :class:`Point2`
         """
         if isinstance(point,Point2):
-            return self.inverse.transform(point)
-        else:
-            assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
-            p = self.inverse._transform(point[0],point[2])
-            return Point2(p[0],p[1])
+            point = (point.x,point.y)
+        assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
+        inv = self.inverse
+        return Point2(float(inv[0,0]*point[0]+inv[0,1]*point[1]+inv[0,2]),
+                      float(inv[1,0]*point[0]+inv[1,1]*point[1]+inv[1,2]))
+
+    def transform_points(self,points):
+        """
+        Transforms many points to the local coordinate system at once
+
+        This is :meth:`transform` for a whole array of points, done with a single
+        matrix multiplication.
+
+        :param points: the points to transform
+        :type points:  n x 2 array-like of numbers
+
+        :return: The points transformed to local coordinate system
+        :rtype:  n x 2 ``numpy.ndarray`` of ``float``
+        """
+        points = np.asarray(points,dtype=float).reshape(-1,2)
+        inv = self.inverse
+        return points.dot(inv[:2,:2].T)+inv[:2,2]
 
     def draw(self, view):
         """
         Draws this shape in the provide view.
 
-        Ideally, the view should be the one provided by :class:`GameApp`.
+        Ideally, the view should be the one provided by :class:`GameApp`.  This
+        method does nothing if the object is retained by the view.
 
         :param view: view to draw to
         :type view:  :class:`GView`
         """
+        if not self._slot is None:
+            return
         try:
             view.draw(self._cache)
         except:
@@ -604,23 +707,56 @@ class GObject(object):
         Resets the drawing cache.
         """
         self._cache = InstructionGroup()
+        if not self._slot is None:
+            self._slot.clear()
+            if not self._hidden:
+                self._slot.add(self._cache)
         self._cache.add(PushMatrix())
         self._cache.add(self._trans)
         self._cache.add(self._rotate)
         self._cache.add(self._scale)
 
+    def _resize(self):
+        """
+        Updates the drawing cache after a change to the width or height.
+
+        By default this resets the drawing cache.  Subclasses that can resize their
+        instructions in place should override this method.
+        """
+        self._reset()
+
+    def _corners(self):
+        """
+        Returns the corners of this shape, in the coordinates of its parent.
+
+        :return: the bottom left, bottom right, top right and top left corners
+        :rtype:  4 x 2 ``numpy.ndarray``
+        """
+        w = self.width/2.0
+        h = self.height/2.0
+        m = self.matrix
+        return np.array(((-w,-h),(w,-h),(w,h),(-w,h))).dot(m[:2,:2].T)+m[:2,2]
+
     def _build_matrix(self):
         """
         Builds the transform matrices after a settings change.
-        """
-        self._matrix = Matrix()
-        self._matrix.translate(self._trans.x,self._trans.y)
-        self._matrix.rotate(self._rotate.angle)
-        self._matrix.scale(self._scale.x,self._scale.y)
-        self._invrse = Matrix()
-        self._invrse.scale(1.0/self._scale.x,1.0/self._scale.y)
-        self._invrse.rotate(-self._rotate.angle)
-        self._invrse.translate(-self._trans.x,-self._trans.y)
+
+        The matrix translates, then rotates, then scales, like the Kivy
+        transforms of this object.
+        """
+        angle = math.radians(self._rotate.angle)
+        c = math.cos(angle)
+        s = math.sin(angle)
+        sx = self._scale.x
+        sy = self._scale.y
+        tx = self._trans.x
+        ty = self._trans.y
+        self._matrix = np.array(((c*sx, -s*sy, tx),
+                                 (s*sx,  c*sy, ty),
+                                 (0.0,   0.0,  1.0)))
+        self._invrse = np.array((( c/sx, s/sx, -(c*tx+s*ty)/sx),
+                                 (-s/sy, c/sy,  (s*tx-c*ty)/sy),
+                                 (0.0,   0.0,   1.0)))
         self._mtrue = True
 
 
@@ -10,7 +10,10 @@ Date:   August 1, 2017 (Python 3 version)
 # Lower-level kivy modules to support animation
 from kivy.graphics import *
 from kivy.graphics.instructions import *
+from introcs.geom import Point2
 from .gobject import GObject
+import numpy as np
+import math
 
 
 def same_side(p1, p2, a, b):
@@ -32,11 +35,12 @@ def same_side(p1, p2, a, b):
     :return: True if ``p1``, ``p2`` are on the same side of segment ``ba``; False otherwise
     :rtype:  ``bool``
     """
-    import numpy as np
-    ba  = np.append(np.subtract(b,a),[0])
-    cp1 = np.cross(ba,np.subtract(p1,a))
-    cp2 = np.cross(ba,np.subtract(p2,a))
-    return np.dot(cp1,cp2) >= 0
+    # Only the z-components of the cross products are nonzero
+    bax = b[0]-a[0]
+    bay = b[1]-a[1]
+    cp1 = bax*(p1[1]-a[1])-bay*(p1[0]-a[0])
+    cp2 = bax*(p2[1]-a[1])-bay*(p2[0]-a[0])
+    return cp1*cp2 >= 0
 
 
 def in_triangle(p, t):
@@ -57,6 +61,80 @@ def in_triangle(p, t):
             same_side(p, t[4:6], t[0:2], t[2:4]))
 
 
+def edge_table(points):
+    """
+    Returns the edges of the polygon with the given vertices, for ray-crossing tests.
+
+    The polygon is closed by the edge from the last vertex back to the first.  Each edge
+    is stored as (x0,y0,y1,slope), where (x0,y0) is its first end point, y1 is the y
+    value of the other one, and slope is the change in x for each unit of y.  Horizontal
+    edges are left out, as a horizontal ray never crosses them.
+
+    :param points: The vertices of the polygon, as alternating x and y values
+    :type points:  even sequence of ``int`` or ``float``
+
+    :return: The edges of the polygon
+    :rtype:  ``list`` of 4-element ``tuple`` of ``float``
+    """
+    size = len(points)//2
+    result = []
+    for k in range(size):
+        j = (k+1) % size
+        x0, y0 = float(points[2*k]), float(points[2*k+1])
+        x1, y1 = float(points[2*j]), float(points[2*j+1])
+        if y0 != y1:
+            result.append((x0,y0,y1,(x1-x0)/(y1-y0)))
+    return result
+
+
+def in_polygon(p, edges):
+    """
+    Checks whether a point is inside of the polygon with the given edges
+
+    This is the even-odd rule: a ray from ``p`` to the right crosses the edges of the
+    polygon an odd number of times if and only if ``p`` is inside.  It works for any
+    simple polygon, concave or not, using only float arithmetic.
+
+    :param p: A point in 2 dimensions
+    :type p:  2-element sequence of ``int`` or ``float``
+
+    :param edges: The edges of the polygon, as returned by :func:`edge_table`
+    :type edges:  ``list`` of 4-element ``tuple`` of ``float``
+
+    :return: True if ``p`` is in the polygon; False otherwise
+    :rtype:  ``bool``
+    """
+    px, py = p[0], p[1]
+    inside = False
+    for (x0,y0,y1,slope) in edges:
+        if (y0 > py) != (y1 > py) and px < x0+(py-y0)*slope:
+            inside = not inside
+    return inside
+
+
+def in_polygon_many(points, table):
+    """
+    Checks which of many points are inside of the polygon with the given edges
+
+    This is :func:`in_polygon` for every point and every edge at once, with NumPy.
+
+    :param points: The points to test
+    :type points:  n x 2 ``numpy.ndarray`` of ``float``
+
+    :param table: The edges of the polygon, one per row, as returned by
+        :func:`edge_table`
+    :type table:  m x 4 ``numpy.ndarray`` of ``float``
+
+    :return: Whether each point is in the polygon
+    :rtype:  ``numpy.ndarray`` of n ``bool``
+    """
+    px = points[:,0:1]
+    py = points[:,1:2]
+    x0, y0, y1, slope = table.T
+    crosses = ((y0 > py) != (y1 > py)) & (px < x0+(py-y0)*slope)
+    return crosses.sum(axis=1) % 2 == 1
+
+
 def is_point_tuple(t,minsize):
     """
     Checks whether a value is an EVEN sequence of numbers.
@@ -75,9 +153,8 @@ def is_point_tuple(t,minsize):
     :rtype:  ``bool``
     """
     try:
-        from functools import reduce
         return len(t) % 2 == 0 and len(t) >= 2*minsize and \
-            reduce(lambda x, y: x and y, map(lambda z: type(z) in [int, float], t))
+            all(type(z) in [int, float] for z in t)
     except:
         return False
 
@@ -120,7 +197,7 @@ class GPath(GObject):
         assert is_point_tuple(value,2),'value %s is not a valid list of points' %  repr(value)
         self._points = tuple(value)
         if self._defined:
-            self._reset()
+            self._repoint()
     
     @property
     def linewidth(self):
@@ -139,7 +216,10 @@ class GPath(GObject):
         assert value >= 0, 'value %s is negative' % repr(value)
         self._linewidth = value
         if self._defined:
-            self._reset()
+            if not self._line is None and value > 0:
+                self._line.width = value
+            else:
+                self._reset()
     
     
     # IMMUTABLE PROPERTIES
@@ -189,6 +269,7 @@ class GPath(GObject):
         :type keywords:  keys are attribute names
         """
         self._defined = False
+        self._line = None
         self.linewidth = keywords['linewidth'] if 'linewidth' in keywords else 1.0
         self.points = keywords['points'] if 'points' in keywords else (0,0,10,10)
         if not 'linecolor' in keywords:
@@ -238,10 +319,10 @@ class GPath(GObject):
             p = self.points[2*ii  :2*ii+2]
             q = self.points[2*ii+2:2*ii+4]
             if p == q:
-                test = np.sqrt((q[0]-x)*(q[0]-x)+(q[1]-y)*(q[1]-y)) < epsilon
+                test = math.sqrt((q[0]-x)*(q[0]-x)+(q[1]-y)*(q[1]-y)) < epsilon
             else:
                 num = abs((q[0]-p[0])*x-(q[1]-p[1])*y+q[0]*p[1]-p[0]*q[1])
-                den = np.sqrt((q[0]-p[0])*(q[0]-p[0])+(q[1]-p[1])*(q[1]-p[1]))
+                den = math.sqrt((q[0]-p[0])*(q[0]-p[0])+(q[1]-p[1])*(q[1]-p[1]))
                 test = num/den
             if test:
                 return True
@@ -250,15 +331,48 @@ class GPath(GObject):
     
     
     # HIDDEN METHODS
+    def _make_edges(self):
+        """
+        Stores the edges of the closed shape through the points, for hit tests.
+        
+        The edges are kept both as a list, for single points, and as an array, for
+        :meth:`contains_many`.
+        """
+        self._edges = edge_table(self._points)
+        self._table = np.array(self._edges,dtype=float).reshape(-1,4)
+    
+    def _local(self,point):
+        """
+        Returns the given point in the coordinates of the points of this path.
+        
+        :param point: the point to transform
+        :type point:  pair of numbers
+        """
+        if self._rotate.angle == 0.0 and self._scale.x == 1.0 and self._scale.y == 1.0:
+            return (point[0]-self.x,point[1]-self.y)
+        inv = self.inverse
+        return (inv[0,0]*point[0]+inv[0,1]*point[1]+inv[0,2],
+                inv[1,0]*point[0]+inv[1,1]*point[1]+inv[1,2])
+    
+    def _repoint(self):
+        """
+        Updates the drawing cache after a change to the points.
+        """
+        if self._line is None:
+            self._reset()
+        else:
+            self._line.points = self.points
+
     def _reset(self):
         """
         Resets the drawing cache
         """
         GObject._reset(self)
+        self._line = None
         if not self._linecolor is None:
             self._cache.add(self._linecolor)
-            line = Line(points=self.points,cap='round',joint='round',width=self.linewidth)
-            self._cache.add(line)
+            self._line = Line(points=self.points,cap='round',joint='round',width=self.linewidth)
+            self._cache.add(self._line)
         self._cache.add(PopMatrix())
 
 
@@ -297,8 +411,9 @@ class GTriangle(GPath):
         assert is_point_tuple(value,3),'value %s is not a valid list of points' %  repr(value)
         assert len(value) == 6, 'value %s does not have the right length'  %  repr(value)
         self._points = tuple(value)
+        self._make_edges()
         if self._defined:
-            self._reset()
+            self._repoint()
     
     
     # BUILT-IN METHODS
@@ -319,6 +434,8 @@ class GTriangle(GPath):
         :type keywords:  keys are attribute names
         """
         self._defined = False
+        self._line = None
+        self._mesh = None
         self.linewidth = keywords['linewidth'] if 'linewidth' in keywords else 0.0
         self.points = keywords['points'] if 'points' in keywords else (-100,-58,0,116,100,-58)
         GObject.__init__(self,**keywords)
@@ -345,28 +462,61 @@ class GTriangle(GPath):
             point = (point.x,point.y)
         assert is_point_tuple(point,1), "%s is not a valid point" % repr(point)
         
-        return in_triangle(points,self._points)
+        return in_polygon(self._local(point),self._edges)
+    
+    def contains_many(self,points):
+        """
+        Checks which of many points this shape contains
+        
+        The points are moved to the local coordinate system with one matrix 
+        multiplication, and then tested against the edges of the triangle with NumPy.
+        
+        :param points: the points to check
+        :type points:  n x 2 array-like of numbers
+        
+        :return: whether the shape contains each point
+        :rtype:  ``numpy.ndarray`` of n ``bool``
+        """
+        return in_polygon_many(self.transform_points(points),self._table)
     
     
     # HIDDEN METHODS
-    def _reset(self):
+    def _vertices(self):
         """
-        Resets the drawing cache
+        Returns the mesh vertices of this triangle.
         """
-        GObject._reset(self)
-        
         vertices = ()
         for x in range(3):
             # Need to tack on degenerate texture coords
             vertices += self.points[2*x:2*x+2]+(0,0)
-        mesh = Mesh(vertices=vertices, indices=range(3), mode='triangle_strip')
+        return vertices
+    
+    def _repoint(self):
+        """
+        Updates the drawing cache after a change to the points.
+        """
+        if self._mesh is None:
+            self._reset()
+            return
+        self._mesh.vertices = self._vertices()
+        if not self._line is None:
+            self._line.points = self.points
+    
+    def _reset(self):
+        """
+        Resets the drawing cache
+        """
+        GObject._reset(self)
+        
+        self._mesh = Mesh(vertices=self._vertices(), indices=range(3), mode='triangle_strip')
         self._cache.add(self._fillcolor)
-        self._cache.add(mesh)
+        self._cache.add(self._mesh)
         
+        self._line = None
         if self.linewidth > 0:
-            line = Line(points=self.points,joint='miter',close=True,width=self.linewidth)
+            self._line = Line(points=self.points,joint='miter',close=True,width=self.linewidth)
             self._cache.add(self._linecolor)
-            self._cache.add(line)
+            self._cache.add(self._line)
         
         self._cache.add(PopMatrix())
 
@@ -413,6 +563,7 @@ class GPolygon(GPath):
     def points(self,value):
         assert is_point_tuple(value,3),'value %s is not a valid list of points' %  repr(value)
         self._points = tuple(value)
+        self._make_edges()
         if self._defined:
             self._reset()
     
@@ -502,6 +653,7 @@ class GPolygon(GPath):
         :type keywords:  keys are attribute names
         """
         self._defined = False
+        self._line = None
         self.linewidth = keywords['linewidth'] if 'linewidth' in keywords else 0.0
         self.points = keywords['points'] if 'points' in keywords else (-100,-58,0,116,100,-58)
         self.source = keywords['source'] if 'source' in keywords else None
@@ -531,12 +683,23 @@ class GPolygon(GPath):
             point = (point.x,point.y)
         assert is_point_tuple(point,1), "%s is not a valid point" % repr(point)
         
-        found = False
-        for i in xrange(4,len(self._points),2):
-            t = (0,0)+self.points[i-4:i]
-            found = found or in_triangle(point,t)
+        return in_polygon(self._local(point),self._edges)
+    
+    def contains_many(self,points):
+        """
+        Checks which of many points this shape contains
+        
+        The points are moved to the local coordinate system with one matrix 
+        multiplication, and then tested against every edge of the polygon at once with 
+        NumPy.  This is the fast way to test a whole batch of bolts against a shape.
+        
+        :param points: the points to check
+        :type points:  n x 2 array-like of numbers
         
-        return found
+        :return: whether the shape contains each point
+        :rtype:  ``numpy.ndarray`` of n ``bool``
+        """
+        return in_polygon_many(self.transform_points(points),self._table)
     
     
     # HIDDEN METHODS
@@ -544,7 +707,7 @@ class GPolygon(GPath):
         """
         Creates the mesh for this polygon
         """
-        size = len(self.points)/2
+        size = len(self.points)//2
         try:
             texture = Image(source=self.source).texture
             texture.wrap = 'repeat'
@@ -557,7 +720,7 @@ class GPolygon(GPath):
             # Create the fan.
             for x in range(size):
                 pt = self.points[2*x:2*x+2]
-                self._verts += pt+(pt[0]/tw+0.5,pt[1]/th+0.5)
+                verts += pt+(pt[0]/tw+0.5,pt[1]/th+0.5)
             
             # Come back to the beginning
             pt = self.points[0:2]
@@ -581,10 +744,11 @@ class GPolygon(GPath):
         self._cache.add(self._fillcolor)
         self._cache.add(self._mesh)
         
+        self._line = None
         if self.linewidth > 0:
-            line = Line(points=self.points,joint='miter',close=True,width=self.linewidth)
+            self._line = Line(points=self.points,joint='miter',close=True,width=self.linewidth)
             self._cache.add(self._linecolor)
-            self._cache.add(line)
+            self._cache.add(self._line)
         
         self._cache.add(PopMatrix())
 
@@ -13,6 +13,7 @@ from kivy.graphics import *
 from kivy.graphics.instructions import *
 from .grectangle import GRectangle, GObject
 from .app import GameApp
+from .gatlas import GAtlas
 
 # #mark -
 class GSprite(GRectangle):
@@ -105,6 +106,7 @@ class GSprite(GRectangle):
         self._frame  = 0
         self._images = [None]*self.count
         self._bounds = None
+        self._border = None
         self._texture = None
         GRectangle.__init__(self,**keywords)
         self._defined = True
@@ -122,6 +124,20 @@ class GSprite(GRectangle):
         assert value[0] > 0 and value[1] > 0, '%s does not have valid values' % repr(value)
         self._format = value
     
+    def _resize(self):
+        """
+        Resizes the image (and border) in place after a change to the width or height.
+        """
+        if self._bounds is None:
+            self._reset()
+            return
+        x = -self.width/2.0
+        y = -self.height/2.0
+        self._bounds.pos  = (x,y)
+        self._bounds.size = (self.width,self.height)
+        if not self._border is None:
+            self._border.rectangle = (x,y,self.width,self.height)
+
     def _reset(self):
         """
         Resets the drawing cache.
@@ -130,19 +146,9 @@ class GSprite(GRectangle):
         x = -self.width/2.0
         y = -self.height/2.0
         
-        texture = GameApp.load_texture(self.source)
-        if texture:
-            width  = texture.width/self._format[1]
-            height = texture.height/self._format[0]
-            
-            ty = 0
-            for row in range(self._format[0]):
-                tx = 0
-                for col in range(self._format[1]):
-                    self._images[row*self._format[1]+col] = texture.get_region(int(tx),texture.height-int(ty)-int(height),int(width),int(height))
-                    tx += width
-                ty += width
-        else:
+        # The frames are cut once per filmstrip and shared by every sprite
+        self._images = GAtlas.frames(self.source,self._format)
+        if self._images[0] is None:
             print('Failed to load',repr(self.source))
         
         self._texture = self._images[self._frame]
@@ -153,10 +159,11 @@ class GSprite(GRectangle):
             self._cache.add(Color(1,1,1))
         self._cache.add(self._bounds)
         
+        self._border = None
         if not self._linecolor is None and self.linewidth > 0:
-            line = Line(rectangle=(x,y,self.width,self.height),joint='miter',close=True,width=self.linewidth)
+            self._border = Line(rectangle=(x,y,self.width,self.height),joint='miter',close=True,width=self.linewidth)
             self._cache.add(self._linecolor)
-            self._cache.add(line)
+            self._cache.add(self._border)
         
         self._cache.add(PopMatrix())
 
@@ -0,0 +1,152 @@
+"""
+A module to support twinkling starfields.
+
+A starfield is a large number of tiny colored squares that move around every frame.
+Drawing each star as its own :class:`GRectangle` would create thousands of objects
+every second.  This module instead draws all of the stars with a single Kivy ``Mesh``
+whose vertices are preallocated once and then overwritten in place.
+
+The stars are colored with a tiny palette texture, one pixel per color.  Each star
+looks up its color through its texture coordinates, so changing the color of a star
+is no more expensive than moving it.
+
+Author: agent (agent@local), extending the game2d package by Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+from kivy.graphics import *
+from kivy.graphics.instructions import *
+from kivy.graphics.texture import Texture
+from .gobject import GObject, to_rgba
+import random
+
+
+# #mark -
+class GStarfield(GObject):
+    """
+    A class representing a field of twinkling stars.
+
+    The stars are placed at random in the rectangle from (0,0) to (``width``,
+    ``height``), relative to the position (x,y) of this object.  Every call to
+    :meth:`twinkle` moves every star to a new random position with a new random color
+    from the palette.
+    """
+
+    # IMMUTABLE PROPERTIES
+    @property
+    def count(self):
+        """
+        The number of stars in this field.
+
+        **invariant**: Value is an ``int`` > 0.
+        """
+        return self._count
+
+    @property
+    def size(self):
+        """
+        The width and height of a single star.
+
+        **invariant**: Value is an ``int`` or ``float`` > 0.
+        """
+        return self._size
+
+
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new starfield.
+
+        To use the constructor for this class, you should provide it with a list of
+        keyword arguments that initialize various attributes. For example, to create
+        80 white and blue stars over a 800x700 window, use the constructor::
+
+            GStarfield(width=800,height=700,count=80,colors=['white','blue'])
+
+        This class supports the same keywords as :class:`GObject`, except for the
+        colors.  The new keywords are ``count`` (the number of stars, default 80),
+        ``size`` (the size of a star, default 1.5) and ``colors`` (a list of colors
+        in any form accepted by ``fillcolor``, default white).
+
+        :param keywords: dictionary of keyword arguments
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        self._count = keywords['count'] if 'count' in keywords else 80
+        self._size  = keywords['size']  if 'size'  in keywords else 1.5
+        assert type(self._count) == int and self._count > 0, '%s is not a valid count' % repr(self._count)
+        assert type(self._size) in [int,float] and self._size > 0, '%s is not a valid size' % repr(self._size)
+        colors = keywords['colors'] if 'colors' in keywords else ['white']
+        self._colors  = len(colors)
+        self._palette = self._make_palette(colors)
+        self._vertices = [0.0]*(16*self._count)
+        self._indices = []
+        for star in range(self._count):
+            k = 4*star
+            self._indices.extend((k,k+1,k+2,k+2,k+3,k))
+        self._mesh = None
+        GObject.__init__(self,**keywords)
+        self.twinkle()
+        self._reset()
+        self._defined = True
+
+
+    # PUBLIC METHODS
+    def twinkle(self):
+        """
+        Moves every star to a new random position, with a new random color.
+
+        The vertices of the stars are rewritten in place; no new objects are made.
+        """
+        vertices = self._vertices
+        width = self._width
+        height = self._height
+        half = self._size/2.0
+        colors = self._colors
+        randint = random.randint
+        pos = 0
+        for star in range(self._count):
+            x = randint(0,int(width))
+            y = randint(0,int(height))
+            u = (randint(0,colors-1)+0.5)/colors
+            vertices[pos   ] = x-half; vertices[pos+ 1] = y-half
+            vertices[pos+ 4] = x+half; vertices[pos+ 5] = y-half
+            vertices[pos+ 8] = x+half; vertices[pos+ 9] = y+half
+            vertices[pos+12] = x-half; vertices[pos+13] = y+half
+            for k in range(2,16,4):
+                vertices[pos+k] = u
+                vertices[pos+k+1] = 0.5
+            pos += 16
+        if not self._mesh is None:
+            self._mesh.vertices = vertices
+
+
+    # HIDDEN METHODS
+    def _make_palette(self,colors):
+        """
+        Returns a texture with one pixel for each color.
+
+        :param colors: the colors of the palette
+        :type colors:  non-empty list of colors
+        """
+        assert type(colors) in [list,tuple] and len(colors) > 0, '%s is not a list of colors' % repr(colors)
+        data = bytearray()
+        for value in colors:
+            rgba = to_rgba(value)
+            assert not rgba is None, '%s is not a valid color' % repr(value)
+            data.extend(int(round(255*c)) for c in rgba)
+        texture = Texture.create(size=(len(colors),1), colorfmt='rgba')
+        texture.mag_filter = 'nearest'
+        texture.min_filter = 'nearest'
+        texture.blit_buffer(bytes(data), colorfmt='rgba', bufferfmt='ubyte')
+        return texture
+
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        self._mesh = Mesh(vertices=self._vertices, indices=self._indices,
+                          mode='triangles', texture=self._palette)
+        self._cache.add(Color(1,1,1))
+        self._cache.add(self._mesh)
+        self._cache.add(PopMatrix())
@@ -15,6 +15,7 @@ from kivy.uix.floatlayout import FloatLayout
 from kivy.metrics import dp
 
 from introcs.geom import Point2
+import bisect
 
 
 class GInput(object):
@@ -319,6 +320,14 @@ class GView(FloatLayout):
     :class:`GObject` instances to the :meth:`draw` method.  You must do this every
     animation frame, as the game is constantly clearing the window.
 
+    Objects that are on screen for a long time can instead be retained with the
+    method :meth:`retain`.  A retained object stays in the window, and is redrawn
+    automatically whenever it changes, until it is released with :meth:`release`.
+    Clearing the window does not remove it, and calling its ``draw`` method does
+    nothing.  Retained objects are drawn below the objects drawn this frame, in the
+    order given when they were retained. Only retaining, releasing, hiding and
+    showing an object changes the Kivy instructions of the window.
+
     **You should never construct an object of this class**.  Creating a new instance
     of this class will not properly display it on the screen.  Instead, you should
     only use the one provided in the `view` attribute of :class:`GameApp`.
@@ -337,6 +346,9 @@ class GView(FloatLayout):
         """
         FloatLayout.__init__(self)
         self._frame = InstructionGroup()
+        self._retained = InstructionGroup()
+        self._slots  = []
+        self._orders = []
         self.bind(pos=self._reset)
         self.bind(size=self._reset)
         self._reset()
@@ -363,11 +375,81 @@ class GView(FloatLayout):
         Clears the contents of the view.
 
         This method is called for you automatically at the start of the animation
-        frame.  That way, you are not drawing images on top of one another.
+        frame.  That way, you are not drawing images on top of one another.  Retained
+        objects are not cleared.
         """
         self._frame.clear()
         self._contents.clear()
 
+    def retain(self,obj,order=0):
+        """
+        Keeps the given object in this view until it is released.
+
+        Objects with a smaller order are drawn first (below).  Objects with the same
+        order are drawn in the order they were retained.  Retaining an object that is
+        already retained only changes its order.
+
+        :param obj: the object to retain
+        :type obj:  :class:`GObject`
+
+        :param order: the drawing order of the object
+        :type order:  ``int``
+        """
+        assert type(order) == int, '%s is not an int' % repr(order)
+        if not obj._slot is None:
+            self.release(obj)
+        slot = InstructionGroup()
+        index = bisect.bisect_right(self._orders,order)
+        self._orders.insert(index,order)
+        self._slots.insert(index,slot)
+        self._retained.insert(index,slot)
+        obj._slot = slot
+        obj._hidden = False
+        slot.add(obj._cache)
+
+    def release(self,obj):
+        """
+        Removes a retained object from this view.
+
+        Nothing happens if the object is not retained.
+
+        :param obj: the object to release
+        :type obj:  :class:`GObject`
+        """
+        if obj._slot is None:
+            return
+        index = self._slots.index(obj._slot)
+        del self._orders[index]
+        del self._slots[index]
+        self._retained.remove(obj._slot)
+        obj._slot.clear()
+        obj._slot = None
+        obj._hidden = False
+
+    def hide(self,obj):
+        """
+        Hides a retained object, keeping its place in the drawing order.
+
+        :param obj: the object to hide
+        :type obj:  retained :class:`GObject`
+        """
+        assert not obj._slot is None, '%s is not retained' % repr(obj)
+        if not obj._hidden:
+            obj._slot.clear()
+            obj._hidden = True
+
+    def show(self,obj):
+        """
+        Shows a retained object hidden by :meth:`hide`.
+
+        :param obj: the object to show
+        :type obj:  retained :class:`GObject`
+        """
+        assert not obj._slot is None, '%s is not retained' % repr(obj)
+        if obj._hidden:
+            obj._slot.add(obj._cache)
+            obj._hidden = False
+
     # HIDDEN METHODS
     def _reset(self,obj=None,value=None):
         """
@@ -378,4 +460,5 @@ class GView(FloatLayout):
         self.canvas.add(Rectangle(pos=self.pos,size=self.size))
         # Work-around for Retina Macs
         self.canvas.add(Scale(dp(1),dp(1),dp(1)))
+        self.canvas.add(self._retained)
         self.canvas.add(self._frame)
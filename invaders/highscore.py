@@ -0,0 +1,139 @@
+"""
+High score module for Alien Invaders
+
+This module keeps the high score of the game. The score is read from its file
+once, when the game starts, and is kept in memory from then on. Whenever it is
+beaten, the new high score is written back to the file on a background thread,
+so the game never waits for the disk while it is drawing.
+
+The file is never written in place. The new score goes to a temporary file in
+the same folder, which then replaces the old file in one step, so the file
+always holds either the old or the new high score, even if the game is closed
+while it is being saved.
+
+Author: agent (agent@local), extending the game by Mihikaa Goenka (mg897) and
+Oishani Ganguly (og58)
+Date: October 18th, 2026
+"""
+import os.path
+import tempfile
+import threading
+
+# The file storing the high score, next to this module
+HIGHSCORE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    'high.txt')
+
+
+class HighScore(object):
+    """
+    A class keeping the high score of the game in memory and on disk.
+
+    INSTANCE ATTRIBUTES:
+        _path:   the file storing the high score [str]
+        _score:  the high score [int >= 0]
+        _saved:  the high score last written to the file [int >= 0]
+        _lock:   the lock guarding _score, _saved and _writer [threading.Lock]
+        _writer: the thread saving the high score [Thread, or None if the file
+                 is up to date]
+    """
+
+    # GETTERS
+    def getScore(self):
+        """
+        Returns the high score.
+        """
+        return self._score
+
+
+    # INITIALIZER
+    def __init__(self,path=HIGHSCORE_FILE):
+        """
+        Loads the high score from its file.
+
+        A missing, empty or unreadable file counts as a high score of 0.
+
+        Parameter path: the file storing the high score
+        Precondition: path is a str
+        """
+        self._path=path
+        self._score=0
+        try:
+            with open(path) as file:
+                self._score=max(0,int(file.read().strip() or 0))
+        except (OSError,ValueError):
+            pass
+        self._saved=self._score
+        self._lock=threading.Lock()
+        self._writer=None
+
+
+    # PUBLIC METHODS
+    def submit(self,score):
+        """
+        Records the score of a game and returns the (new) high score.
+
+        If the score beats the high score, the file is saved in the background.
+
+        Parameter score: the score of the game
+        Precondition: score is an int >= 0
+        """
+        with self._lock:
+            if score>self._score:
+                self._score=score
+                if self._writer is None:
+                    self._writer=threading.Thread(target=self._save)
+                    self._writer.start()
+            return self._score
+
+
+    def wait(self):
+        """
+        Waits until the high score has been saved.
+        """
+        writer=self._writer
+        if writer is not None:
+            writer.join()
+
+
+    # HIDDEN METHODS
+    def _save(self):
+        """
+        Writes the high score to its file until the file is up to date.
+
+        Scores submitted while the file is being written are saved by the same
+        thread, so there is never more than one writer.
+        """
+        while True:
+            with self._lock:
+                score=self._score
+                if score==self._saved:
+                    self._writer=None
+                    return
+            try:
+                self._write(score)
+            except OSError:
+                with self._lock:
+                    self._writer=None
+                return
+            with self._lock:
+                self._saved=score
+
+
+    def _write(self,score):
+        """
+        Replaces the file with one holding the given score.
+
+        Parameter score: the score to write
+        Precondition: score is an int >= 0
+        """
+        folder=os.path.dirname(self._path) or '.'
+        handle,temp=tempfile.mkstemp(dir=folder,prefix='.high',suffix='.tmp')
+        try:
+            with os.fdopen(handle,'w') as file:
+                file.write(str(score))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp,self._path)
+        except:
+            os.remove(temp)
+            raise
@@ -7,15 +7,15 @@ the aliens.
 
 Just because something is a model does not mean there has to be a special class
 for it.  Unless you need something special for your extra gameplay features,
-Ship and Alien could just be an instance of GImage that you move across the
-screen. You only need a new class when you add extra features to an object. So
-technically Bolt, which has a velocity, is really the only model that needs to
-have its own class.
+Ship could just be an instance of GImage that you move across the screen. You
+only need a new class when you add extra features to an object. So technically
+Bolt, which has a velocity, is really the only model that needs to have its own
+class.
 
-With that said, we have included the subclasses for Ship and Aliens.  That is
-because there are a lot of constants in consts.py for initializing the objects,
-and you might want to add a custom initializer.  With that said, feel free to
-keep the pass underneath the class definitions if you do not want to do that.
+With that said, we have included a subclass for Ship, because there are a lot of
+constants in consts.py for initializing it.  The aliens are not separate objects
+at all; they are drawn by a Formation.  Collisions are not checked here either,
+but by the simulation in simulation.py, which knows nothing about these classes.
 
 You are free to add even more models to this module.  You may wish to do this
 when you add new features to your game, such as power-ups.  If you are unsure
@@ -50,122 +50,121 @@ class Ship(GImage):
         height=SHIP_HEIGHT,source='ship.png')
 
 
-    # METHODS TO MOVE THE SHIP AND CHECK FOR COLLISIONS
-    def _collidesship(self,bolt):
-        """
-        Returns: True if the bolt was fired by an alien and collides with the
-        ship. Else returns False.
+    # ADD MORE METHODS (PROPERLY SPECIFIED) AS NECESSARY
 
-        Parameter bolt: The laser bolt to check.
-        Precondition: bolt is an object of class Bolt.
-        """
-        k=False
-        left_x=bolt.x-BOLT_WIDTH/2
-        top_y=bolt.y+BOLT_HEIGHT/2
-        right_x=bolt.x+BOLT_WIDTH/2
-        bottom_y=bolt.y-BOLT_HEIGHT/2
-        if self.contains((left_x,top_y)) or self.contains((right_x,top_y)):
-            k=True
-        elif self.contains((left_x,bottom_y))or self.contains((right_x,bottom_y)):
-            k=True
-        if bolt.getVelocity() < 0:
-            return k
-        return False
 
+class Formation(GScene):
+    """
+    A class representing the whole formation of aliens.
 
-    # ADD MORE METHODS (PROPERLY SPECIFIED) AS NECESSARY
+    The aliens are drawn as a single scene, so the formation moves with one
+    change of its position, however many aliens there are. The aliens keep
+    their starting positions, relative to the formation, forever.
 
+    The aliens are not separate sprites. All of the aliens of the same image
+    are drawn together by one GSpriteBatch, so a formation is only one draw per
+    image, even with thousands of aliens. All aliens show the same animation
+    frame, and switching frames is one change per batch.
 
-class Alien(GSprite):
-    """
-    A class to represent a single alien.
+    INSTANCE ATTRIBUTES:
+        _batches: the batch drawing the aliens of each image [dict mapping
+                  str to GSpriteBatch]
+        _handles: the batch and handle of each alien [rectangular 2d list of
+                  (GSpriteBatch,int), or None if the alien is gone]
+        _frame:   the animation frame of every alien [int >= 0]
     """
 
 
     # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
-    def getX(self):
+    def getFrame(self):
         """
-        Returns the x coordinate of the center of the alien.
+        Returns the animation frame shared by every alien.
         """
-        return self.x
+        return self._frame
 
 
-    def getY(self):
-        """
-        Returns the y coordinate of the center of the alien.
+    def setFrame(self,value):
         """
-        return self.y
+        Shows every alien in the given animation frame.
 
-
-    def setX(self,value):
-        """
-        Assigns value to the x coordinate of the center of the alien.
-
-        Parameter value: the value of the x-coordinate
-        Precondition: value is an int or float and 0.0<=x<=GAME_WIDTH
+        Parameter value: the animation frame
+        Precondition: value is an int and 0<=value<6
         """
-        self.x=value
+        if value!=self._frame:
+            self._frame=value
+            for batch in self._batches.values():
+                batch.frame=value
 
 
-    def setY(self,value):
+    def hasAlien(self,row,col):
         """
-        Assigns value to the y coordinate of the center of the alien.
+        Returns True if the alien at (row,col) is still in the formation.
+
+        Parameter row: the row of the alien, counting from the bottom
+        Precondition: row is a valid row of the formation
 
-        Parameter value: the value of the y-coordinate
-        Precondition: value is an int or float and 0.0<=x<=GAME_HEIGHT
+        Parameter col: the column of the alien
+        Precondition: col is a valid column of the formation
         """
-        self.y=value
+        return self._handles[row][col] is not None
 
 
-    # INITIALIZER TO CREATE AN ALIEN
-    def __init__(self,x,y,src):
+    def removeAlien(self,row,col):
         """
-        Creates and initializes a new Alien object.
+        Removes the alien at (row,col) from the formation.
 
-        Parameter x: the value of the x-coordinate
-        Precondition: x is an int or float and 0.0<=x<=GAME_WIDTH
+        Nothing happens if the alien has already been removed.
 
-        Parameter y: the value of the y-coordinate
-        Precondition: y is an int or float and 0.0<=x<=GAME_HEIGHT
+        Parameter row: the row of the alien, counting from the bottom
+        Precondition: row is a valid row of the formation
 
-        Parameter src: the source of the image
-        Precondition: src is a .png image file
+        Parameter col: the column of the alien
+        Precondition: col is a valid column of the formation
         """
-
-        super().__init__(x=x,y=y,width=ALIEN_WIDTH,height=ALIEN_HEIGHT,
-        source=src,format=(3,2))
+        entry=self._handles[row][col]
+        if entry is not None:
+            entry[0].remove(entry[1])
+            self._handles[row][col]=None
 
 
-    # METHOD TO CHECK FOR COLLISION (IF DESIRED)
-    def collides(self,bolt):
+    # INITIALIZER TO CREATE THE FORMATION
+    def __init__(self,aliens):
         """
-        Returns: True if the bolt was fired by the player and collides with
-        this alien.
+        Creates a formation at (0,0) out of the given aliens.
 
-        Parameter bolt: The laser bolt to check.
-        Precondition: bolt is an object of class Bolt.
+        Parameter aliens: the starting position and image of every alien
+        Precondition: aliens is a rectangular 2d list of tuples (x,y,src),
+        where x and y are ints or floats and src is one of ALIEN_IMAGES
         """
-        k=False
-        left_x=bolt.x-BOLT_WIDTH/2
-        top_y=bolt.y+BOLT_HEIGHT/2
-        right_x=bolt.x+BOLT_WIDTH/2
-        bottom_y=bolt.y-BOLT_HEIGHT/2
-        if self.contains((left_x,top_y)) or self.contains((right_x,top_y)):
-            k=True
-        elif self.contains((left_x,bottom_y)) or self.contains((right_x,bottom_y)):
-            k=True
-        if bolt.getVelocity() > 0:
-            return k
-        return False
-
-
-    # ADD MORE METHODS (PROPERLY SPECIFIED) AS NECESSARY
-
-
-class Bolt(GRectangle):
+        positions={}
+        self._handles=[]
+        for row in aliens:
+            handlerow=[]
+            for (x,y,src) in row:
+                points=positions.setdefault(src,[])
+                handlerow.append((src,len(points)))
+                points.append((x,y))
+            self._handles.append(handlerow)
+        self._batches={}
+        for src in positions:
+            self._batches[src]=GSpriteBatch(width=ALIEN_WIDTH,
+            height=ALIEN_HEIGHT,source=src,format=(3,2),
+            positions=positions[src])
+        for row in self._handles:
+            for col in range(len(row)):
+                src,handle=row[col]
+                row[col]=(self._batches[src],handle)
+        self._frame=0
+        super().__init__(children=list(self._batches.values()))
+
+
+class Bolt(GBox):
     """
     A class representing a laser bolt.
 
+    Bolts move every frame, so a bolt is a lean GBox and not a GRectangle.
+    Its attributes are slots, and moving it only sets two floats.
+
     INSTANCE ATTRIBUTES:
         _velocity: The velocity in y direction [int or float]
 
@@ -173,6 +172,7 @@ class Bolt(GRectangle):
     _is_delete:     boolean value that checks to see if bolt should be deleted
     _isPlayerBolt:  boolean value that checks to see if bolt is fired by ship
     """
+    __slots__=('_velocity','_is_delete','_isPlayerBolt')
 
 
     # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
@@ -220,6 +220,16 @@ class Bolt(GRectangle):
         """
         return self._velocity
 
+
+    def setVelocity(self,value):
+        """
+        Assigns value to the velocity of the bolt.
+
+        Parameter value: the velocity in y direction
+        Precondition: value is an int or float
+        """
+        self._velocity=value
+
     # INITIALIZER TO SET THE VELOCITY
     def __init__(self,x,y,v,col):
         """
@@ -238,7 +248,7 @@ class Bolt(GRectangle):
         Precondition: col must be an RGB object
         """
         super().__init__(x=x,y=y,width=BOLT_WIDTH,height=BOLT_HEIGHT,
-        linecolor=col,fillcolor=col)
+        fillcolor=col)
         self._velocity=v
         self._is_delete=self.setDelete(False)
         self._isPlayerBolt=self.setPlayerBolt(False)
@@ -247,3 +257,95 @@ class Bolt(GRectangle):
 
 
 # IF YOU NEED ADDITIONAL MODEL CLASSES, THEY GO HERE
+
+
+class BoltPool(object):
+    """
+    A class keeping the Bolt objects on screen for reuse.
+
+    The pool starts with a fixed number of bolts, so firing a bolt never makes
+    a new Bolt. Every frame, the pool shows one of its bolts for each
+    bolt of the simulation, in the same order, and hides the rest. A bolt is
+    only recolored when it shows a bolt of a different kind than before, so
+    a frame in which bolts only move just changes their positions.
+
+    INSTANCE ATTRIBUTES:
+        _bolts: the bolts of the pool [list of Bolt, at least BOLT_POOL long]
+        _kinds: the kind each bolt is colored for [list of BOLT_PLAYER,
+                BOLT_ALIEN or BOLT_POWERUP, as long as _bolts]
+        _count: the number of bolts shown [0<=_count<=len(_bolts)]
+    """
+
+
+    # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
+    def getCount(self):
+        """
+        Returns the number of bolts shown.
+        """
+        return self._count
+
+
+    # INITIALIZER TO CREATE THE POOL
+    def __init__(self,capacity=BOLT_POOL):
+        """
+        Creates a pool of capacity bolts, none of them shown.
+
+        The pool grows past its capacity if more bolts are ever in play at
+        once, and keeps the extra bolts from then on.
+
+        Parameter capacity: the number of bolts to make up front
+        Precondition: capacity is an int >= 0
+        """
+        self._bolts=[]
+        self._kinds=[]
+        self._count=0
+        for i in range(capacity):
+            self._grow()
+
+
+    # PUBLIC METHODS
+    def sync(self,data):
+        """
+        Shows one bolt for each bolt of the simulation.
+
+        Parameter data: the bolts of the simulation
+        Precondition: data is a list of BoltData objects
+        """
+        while len(self._bolts)<len(data):
+            self._grow()
+        bolts=self._bolts
+        kinds=self._kinds
+        for i in range(len(data)):
+            d=data[i]
+            bolt=bolts[i]
+            if kinds[i]!=d.kind:
+                kinds[i]=d.kind
+                bolt.fillcolor=BOLT_COLORS[d.kind]
+                bolt.setPlayerBolt(d.kind==BOLT_PLAYER)
+            bolt.setVelocity(d.velocity)
+            bolt.x=d.x
+            bolt.y=d.y
+        self._count=len(data)
+
+
+    def draw(self,view):
+        """
+        Draws the bolts shown.
+
+        Parameter view: the game view, used in drawing
+        Precondition: view is an instance of GView
+        """
+        bolts=self._bolts
+        for i in range(self._count):
+            bolts[i].draw(view)
+
+
+    # HELPER METHODS
+    def _grow(self):
+        """
+        Adds a new, hidden alien bolt to the pool.
+        """
+        bolt=Bolt(0,0,-BOLT_SPEED,BOLT_COLORS[BOLT_ALIEN])
+        bolt.setPlayerBolt(False)
+        self._bolts.append(bolt)
+        self._kinds.append(BOLT_ALIEN)
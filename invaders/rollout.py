@@ -0,0 +1,289 @@
+"""
+Rollout module for Alien Invaders
+
+This module plays complete games of Alien Invaders without a window, spread
+over a pool of worker processes. A game is played the way Invaders plays it,
+from STATE_NEWWAVE until STATE_COMPLETE or STATE_WIN, except that a bot (a
+policy) presses the keys and a destroyed ship is rebuilt right away.
+
+Every worker owns its own Wave objects, and every game has its own seed, so a
+run is reproducible no matter how the games are spread over the workers. The
+workers never send model objects back to the parent process. Each game is
+packed into a fixed-size binary record, and a whole chunk of games travels as
+a single bytes object.
+
+To play 1000 games with the random bot on every core, type
+
+    python invaders/rollout.py 1000
+
+Author: agent (agent@local), extending the game by Mihikaa Goenka (mg897) and
+Oishani Ganguly (og58)
+Date: October 18th, 2026
+"""
+from consts import *
+from wave import Wave
+from simulation import SimClock
+import multiprocessing
+import collections
+import random
+import struct
+import sys
+import time
+
+
+#: The result of a single game
+Result = collections.namedtuple('Result',
+    ['seed','state','score','lives','frames','kills'])
+
+# The fixed part of a packed result: seed, state, score, lives, frames
+RECORD = struct.Struct('<qBiBi')
+
+
+class BotInput(object):
+    """
+    A class standing in for GInput when a policy plays the game.
+
+    INSTANCE ATTRIBUTES:
+        _keys: the keys currently held down [set of str]
+    """
+
+    def __init__(self):
+        """
+        Creates an input with no keys held down.
+        """
+        self._keys=set()
+
+    def setKeys(self,left,right,fire):
+        """
+        Holds down the keys of the given action, releasing all others.
+
+        Parameter left: whether to hold the 'left' key
+        Precondition: left is a bool
+
+        Parameter right: whether to hold the 'right' key
+        Precondition: right is a bool
+
+        Parameter fire: whether to hold the 'up' key
+        Precondition: fire is a bool
+        """
+        self._keys.clear()
+        if left:
+            self._keys.add('left')
+        if right:
+            self._keys.add('right')
+        if fire:
+            self._keys.add('up')
+
+    def is_key_down(self,key):
+        """
+        Returns True if key is currently held down.
+
+        Parameter key: the key to test
+        Precondition: key is a str
+        """
+        return key in self._keys
+
+
+# POLICIES: functions policy(sim,rng) returning the tuple (left,right,fire)
+def random_policy(sim,rng):
+    """
+    Returns a random action.
+
+    Parameter sim: the simulation being played
+    Precondition: sim is a WaveSim
+
+    Parameter rng: the random number generator of the bot
+    Precondition: rng is a random.Random
+    """
+    return (rng.random()<0.3,rng.random()<0.3,rng.random()<0.5)
+
+
+def hunter_policy(sim,rng):
+    """
+    Returns the action that moves the ship under the nearest column of aliens
+    and fires.
+
+    Parameter sim: the simulation being played
+    Precondition: sim is a WaveSim
+
+    Parameter rng: the random number generator of the bot
+    Precondition: rng is a random.Random
+    """
+    x=sim.getShipX()
+    best=None
+    for col in range(sim.getCols()):
+        for row in range(sim.getRows()):
+            if sim.isAlive(row,col):
+                ax=sim.getAlienX(col)
+                if best is None or abs(ax-x)<abs(best-x):
+                    best=ax
+                break
+    if best is None:
+        return (False,False,False)
+    return (best<x-SHIP_MOVEMENT,best>x+SHIP_MOVEMENT,True)
+
+
+#: The policies that can be named in a rollout
+POLICIES = {'random':random_policy,'hunter':hunter_policy}
+
+
+def play(seed,policy=random_policy,rows=ALIEN_ROWS,cols=ALIENS_IN_ROW,
+speed=ALIEN_SPEED,maxframes=100000):
+    """
+    Plays a complete headless game and returns its Result.
+
+    The game runs as fast as possible: every frame is a single simulation tick,
+    and the bot chooses a new action on every tick.
+
+    The game ends in STATE_WIN when every alien is destroyed, and in
+    STATE_COMPLETE when the lives run out or the aliens reach the defense line.
+    A game cut short by maxframes ends in STATE_ACTIVE.
+
+    Parameter seed: the seed of the game
+    Precondition: seed is an int
+
+    Parameter policy: the bot playing the game
+    Precondition: policy is a function policy(sim,rng) returning a tuple of
+    three bools (left,right,fire)
+
+    Parameter rows: the number of rows of aliens
+    Precondition: rows is an int > 0
+
+    Parameter cols: the number of aliens per row
+    Precondition: cols is an int > 0
+
+    Parameter speed: the number of seconds between alien steps
+    Precondition: speed is a number > 0
+
+    Parameter maxframes: the largest number of frames to play
+    Precondition: maxframes is an int > 0
+    """
+    wave=Wave(headless=True,seed=seed,rows=rows,cols=cols,speed=speed,
+    clock=SimClock(scale=None))
+    sim=wave.getSim()
+    rng=random.Random('policy-%d' % seed)
+    input=BotInput()
+    state=STATE_ACTIVE
+    frames=0
+    while frames<maxframes:
+        input.setKeys(*policy(sim,rng))
+        wave.update(input,0)
+        frames+=1
+        if wave.getNoAliens()==0:
+            state=STATE_WIN
+            break
+        elif wave.getLives()==0 or wave._trackDown()<DEFENSE_LINE:
+            state=STATE_COMPLETE
+            break
+        elif wave._shipExist():
+            wave.setShip()
+    return Result(seed,state,wave.getScore(),wave.getLives(),frames,
+    tuple(sim.getKills()))
+
+
+def pack(result):
+    """
+    Returns the result of a game packed as bytes.
+
+    Parameter result: the result to pack
+    Precondition: result is a Result
+    """
+    return RECORD.pack(result.seed,result.state,result.score,result.lives,
+    result.frames)+struct.pack('<%dH' % len(result.kills),*result.kills)
+
+
+def unpack(data,rows):
+    """
+    Returns the list of results packed in data.
+
+    Parameter data: the packed results of one or more games
+    Precondition: data is a bytes object made of results packed with pack
+
+    Parameter rows: the number of rows of aliens in the games
+    Precondition: rows is an int > 0
+    """
+    kills=struct.Struct('<%dH' % rows)
+    size=RECORD.size+kills.size
+    results=[]
+    for pos in range(0,len(data),size):
+        fixed=RECORD.unpack_from(data,pos)
+        results.append(Result(*fixed,kills.unpack_from(data,pos+RECORD.size)))
+    return results
+
+
+# WORKER PROCESSES
+# The configuration of a worker, set once by _initWorker
+_config = None
+
+def _initWorker(config):
+    """
+    Stores the configuration of this worker process.
+
+    Parameter config: the keyword arguments of play, except seed and policy,
+    plus the key 'policy' naming one of POLICIES
+    Precondition: config is a dict
+    """
+    global _config
+    _config=dict(config)
+    _config['policy']=POLICIES[_config['policy']]
+
+
+def _playChunk(seeds):
+    """
+    Plays a game for every seed in seeds and returns all of the packed results.
+
+    Parameter seeds: the seeds of the games to play
+    Precondition: seeds is a range of ints
+    """
+    return b''.join(pack(play(seed,**_config)) for seed in seeds)
+
+
+def run(games,processes=None,policy='random',seed=0,chunk=16,rows=ALIEN_ROWS,
+cols=ALIENS_IN_ROW,speed=ALIEN_SPEED,maxframes=100000):
+    """
+    Generator that plays games over a pool of processes, yielding the Result
+    of every game as soon as its chunk is done.
+
+    Game i is played with seed seed+i. The results come in the order in which
+    the chunks finish, not in the order of the seeds.
+
+    Parameter games: the number of games to play
+    Precondition: games is an int >= 0
+
+    Parameter processes: the number of worker processes
+    Precondition: processes is an int > 0, or None for one per core
+
+    Parameter policy: the name of the bot playing the games
+    Precondition: policy is a key of POLICIES
+
+    Parameter seed: the seed of the first game
+    Precondition: seed is an int
+
+    Parameter chunk: the number of games a worker plays per task
+    Precondition: chunk is an int > 0
+
+    The other parameters are the same as for play.
+    """
+    assert policy in POLICIES, '%s is not a known policy' % repr(policy)
+    config={'policy':policy,'rows':rows,'cols':cols,'speed':speed,
+    'maxframes':maxframes}
+    tasks=[range(s,min(s+chunk,seed+games)) for s in range(seed,seed+games,chunk)]
+    with multiprocessing.Pool(processes,_initWorker,(config,)) as pool:
+        for data in pool.imap_unordered(_playChunk,tasks):
+            for result in unpack(data,rows):
+                yield result
+
+
+# Application code
+if __name__ == '__main__':
+    games=int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    policy=sys.argv[2] if len(sys.argv) > 2 else 'random'
+    start=time.time()
+    results=list(run(games,policy=policy))
+    elapsed=time.time()-start
+    frames=sum(r.frames for r in results)
+    wins=sum(1 for r in results if r.state==STATE_WIN)
+    print('%d games, %d frames in %.2fs (%.0f frames/s)'
+    % (len(results),frames,elapsed,frames/elapsed))
+    print('mean score %.1f, %d won' % (sum(r.score for r in results)/
+    max(len(results),1),wins))
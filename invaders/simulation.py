@@ -0,0 +1,1130 @@
+"""
+Simulation module for Alien Invaders
+
+This module contains the headless simulation core for a single wave of Alien
+Invaders. The classes here only hold plain Python data (positions, alive flags,
+velocities, the score and the lives). They never touch Kivy or game2d, so a
+wave can be stepped without a window, a GL context or any graphics objects.
+
+The subcontroller Wave (in wave.py) owns an instance of WaveSim and drives it
+every frame. When Wave is not headless, it copies the result of each step onto
+the model objects in models.py, which are only used to draw the wave.
+
+Author: agent (agent@local), extending the game by Mihikaa Goenka (mg897) and
+Oishani Ganguly (og58)
+Date: October 18th, 2026
+"""
+from consts import *
+import random
+import struct
+import math
+import os
+
+# PRIMARY RULE: The simulation is not allowed to import game2d or models.py.
+# Anything that needs to be drawn or played is reported through the events.
+
+
+class BoltData(object):
+    """
+    A class representing a laser bolt as plain data.
+
+    INSTANCE ATTRIBUTES:
+        x:        the x-coordinate of the bolt center [int or float]
+        y:        the y-coordinate of the bolt center [int or float]
+        velocity: the velocity in y direction [int or float]
+        kind:     who fired the bolt and what it does [one of BOLT_PLAYER,
+                  BOLT_ALIEN, BOLT_POWERUP]
+        delete:   whether the bolt is removed at the end of the frame [bool]
+    """
+
+    def __init__(self,x,y,v,kind):
+        """
+        Creates and initializes a new BoltData object.
+
+        Parameter x: the value of the x-coordinate
+        Precondition: x is an int or float and 0.0<=x<=GAME_WIDTH
+
+        Parameter y: the value of the y-coordinate
+        Precondition: y is an int or float
+
+        Parameter v: the velocity of the bolt
+        Precondition: v is an int or float
+
+        Parameter kind: the kind of the bolt
+        Precondition: kind is one of BOLT_PLAYER, BOLT_ALIEN, BOLT_POWERUP
+        """
+        self.x=x
+        self.y=y
+        self.velocity=v
+        self.kind=kind
+        self.delete=False
+
+
+# The constants of SimRandom
+_MASK64 = (1 << 64)-1
+_INV53 = 2.0**-53
+
+
+class SimRandom(random.Random):
+    """
+    A class representing a random number generator with a tiny state.
+
+    The Mersenne Twister behind random.Random keeps 2.5 KB of state, which is
+    far too much to copy every time a wave is saved. This generator is
+    SplitMix64 instead: its whole state is a single 64-bit int, so it fits in
+    8 bytes of a snapshot. Every method of random.Random (randint, choice, ...)
+    works as usual, since they are all built on random and getrandbits.
+
+    INSTANCE ATTRIBUTES:
+        _state: the state of the generator [int, 0<=_state<2**64]
+    """
+
+    def seed(self,a=None,version=2):
+        """
+        Initializes the generator from a seed.
+
+        Parameter a: the seed
+        Precondition: a is an int, or None to seed from the system
+        """
+        if a is None:
+            a=int.from_bytes(os.urandom(8),'little')
+        self._state=a & _MASK64
+        self.gauss_next=None
+
+
+    def getstate(self):
+        """
+        Returns the state of the generator as an int.
+        """
+        return self._state
+
+
+    def setstate(self,state):
+        """
+        Restores a state returned by getstate.
+
+        Parameter state: the state of the generator
+        Precondition: state is an int, 0<=state<2**64
+        """
+        self._state=state
+
+
+    def random(self):
+        """
+        Returns a random float in [0.0,1.0).
+        """
+        return (self._next() >> 11)*_INV53
+
+
+    def getrandbits(self,k):
+        """
+        Returns a random int with k random bits.
+
+        Parameter k: the number of bits
+        Precondition: k is an int >= 0
+        """
+        if k<=64:
+            return self._next() >> (64-k)
+        result=0
+        for shift in range(0,k,64):
+            result|=self._next() << shift
+        return result & ((1 << k)-1)
+
+
+    def _next(self):
+        """
+        Advances the generator and returns the next 64 random bits.
+        """
+        self._state=z=(self._state+0x9E3779B97F4A7C15) & _MASK64
+        z=((z ^ (z >> 30))*0xBF58476D1CE4E5B9) & _MASK64
+        z=((z ^ (z >> 27))*0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+
+class SimClock(object):
+    """
+    A class turning real time into fixed simulation ticks.
+
+    A clock runs either in real time or as fast as possible. In real time, the
+    clock advances scale seconds of game time for every second of real time,
+    so a scale of 100 runs the game at 100x realtime. To avoid falling further
+    and further behind on a slow machine, a single call to advance never
+    returns more than _maxticks ticks; any time beyond that is dropped.
+
+    As fast as possible (a scale of None), the clock ignores real time and
+    every call to advance returns exactly _maxticks ticks.
+
+    INSTANCE ATTRIBUTES:
+        _tps:      the number of ticks per second of game time [int > 0]
+        _scale:    the seconds of game time per second of real time
+                   [number > 0, or None to run as fast as possible]
+        _maxticks: the largest number of ticks returned by advance [int > 0]
+        _accum:    the game time not yet simulated, in ticks [float >= 0]
+    """
+
+    def getTicksPerSecond(self):
+        """
+        Returns the number of ticks per second of game time.
+        """
+        return self._tps
+
+
+    def getScale(self):
+        """
+        Returns the seconds of game time per second of real time, or None if
+        the clock runs as fast as possible.
+        """
+        return self._scale
+
+
+    def isFast(self):
+        """
+        Returns True if the clock runs as fast as possible.
+        """
+        return self._scale is None
+
+
+    def __init__(self,tps=TICKS_PER_SECOND,scale=1.0,maxticks=None):
+        """
+        Creates a new clock.
+
+        Parameter tps: the number of ticks per second of game time
+        Precondition: tps is an int > 0
+
+        Parameter scale: the seconds of game time per second of real time
+        Precondition: scale is a number > 0, or None to run as fast as possible
+
+        Parameter maxticks: the largest number of ticks returned by advance
+        Precondition: maxticks is an int > 0, or None for a quarter second of
+        real time (1 tick if the clock runs as fast as possible)
+        """
+        self._tps=tps
+        self._scale=scale
+        if maxticks is None and scale is None:
+            maxticks=1
+        elif maxticks is None:
+            maxticks=max(1,int(math.ceil(scale*tps/4)))
+        self._maxticks=maxticks
+        self._accum=0.0
+
+
+    def advance(self,dt):
+        """
+        Returns the number of ticks to simulate for dt seconds of real time.
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float) >= 0
+        """
+        if self._scale is None:
+            return self._maxticks
+        self._accum+=dt*self._scale*self._tps
+        # Round up tiny float errors, so 60 frames of 1/60 are 60 ticks
+        ticks=int(self._accum+1e-6)
+        self._accum=max(0.0,self._accum-ticks)
+        if ticks>self._maxticks:
+            ticks=self._maxticks
+            self._accum=0.0
+        return ticks
+
+
+class WaveSim(object):
+    """
+    This class simulates a single wave of Alien Invaders as plain data.
+
+    The aliens always move as one formation, so their positions are not stored
+    one by one. The position of the alien in row r and column c is its starting
+    position (see getAlienX and getAlienY) shifted by the formation offset.
+    Rows are numbered from the bottom, just like the 2d list in Wave.
+
+    The simulation runs on a fixed timestep. It only knows about ticks, never
+    about the wall clock, so it plays the same game whether it is stepped 60
+    times a second or as fast as possible. A SimClock turns real time into
+    ticks when the game is played in a window.
+
+    Every call to update records what happened during its ticks (the aliens
+    stepped, an alien died, the ship fired, ...) as a list of EVENT_* values.
+    Wave uses these events to play the sounds of the game.
+
+    INSTANCE ATTRIBUTES:
+        _rows:       the number of rows of aliens [int > 0]
+        _cols:       the number of aliens per row [int > 0]
+        _random:     the random number generator of this wave [SimRandom]
+        _alive:      the alien alive flags, row by row from the bottom
+                     [bytearray of length _rows*_cols of 0 or 1]
+        _offx:       horizontal offset of the formation [int or float]
+        _offy:       vertical offset of the formation [int or float <= 0]
+        _frame:      the animation frame shared by every alien [0 or 1]
+        _marches:    the number of alien steps since the wave started [int >= 0]
+        _shipx:      the x-coordinate of the ship center [int or float]
+        _shipalive:  whether the ship exists [bool]
+        _bolts:      the laser bolts currently in play, in no particular order
+                     [list of BoltData]
+        _spare:      the removed bolts kept for reuse [list of at most BOLT_POOL
+                     BoltData]
+        _lives:      the number of lives left [int >= 0]
+        _score:      the score of the player [int >= 0]
+        _tps:        the number of ticks per second of game time [int > 0]
+        _time:       the number of ticks since the last alien step [int >= 0]
+        _start:      the number of seconds between alien steps at the start of
+                     the wave [number > 0]
+        _speed:      the number of seconds between alien steps [number > 0]
+        _numMarch:   the number of steps taken since the last alien bolt
+                     [int >= 0]
+        _alienbolts: the number of steps the aliens take before firing a bolt
+                     [1<=_alienbolts<=BOLT_RATE]
+        _movingR:    whether the aliens are moving right [bool]
+        _noaliens:   the number of aliens still alive [int >= 0]
+        _rowcount:   the number of aliens alive in each row [list of _rows ints]
+        _colcount:   the number of aliens alive in each column
+                     [list of _cols ints]
+        _lowrow:     the lowest row with an alien alive [int, _rows if none]
+        _leftcol:    the leftmost column with an alien alive [int, _cols if none]
+        _rightcol:   the rightmost column with an alien alive [int, -1 if none]
+        _events:     the events recorded by the last update [list of EVENT_*]
+        _killed:     the (row,col) of every alien destroyed, in the order they
+                     were destroyed [list of tuples, as long as the number of
+                     aliens destroyed, or None until getKilled rebuilds it from
+                     _alive after a reset or restore]
+        _grid:       the packed alive flags of the last snapshot restored, with
+                     the flags, row counts and column counts they unpack to
+                     [tuple (bytes,bytes,tuple,tuple), or None]
+    """
+
+    # The fixed part of a snapshot: rows, cols, offx, offy, shipx, _speed, the
+    # random state, score, lives, _time, marches, _numMarch, _alienbolts,
+    # number of aliens, number of bolts, frame, direction and ship alive. It is
+    # followed by the alive flags, one bit per alien, and then by x, y and kind
+    # for every bolt.
+    _SNAPSHOT = struct.Struct('<HHddddQiiiIHHHHBBB')
+    # Turn alive flags into binary digits, and each byte of bits into 8 flags
+    _TO_DIGITS = bytes.maketrans(b'\x00\x01',b'01')
+    _SPREAD = [bytes((b>>i)&1 for i in range(8)) for b in range(256)]
+    _BOLT = struct.Struct('<ddB')
+
+
+    # GETTERS AND SETTERS
+    def getScore(self):
+        """
+        Returns the score of the player.
+        """
+        return self._score
+
+
+    def getLives(self):
+        """
+        Returns the number of lives left.
+        """
+        return self._lives
+
+
+    def getNoAliens(self):
+        """
+        Returns the number of aliens still alive.
+        """
+        return self._noaliens
+
+
+    def getShipX(self):
+        """
+        Returns the x coordinate of the center of the ship.
+        """
+        return self._shipx
+
+
+    def isShipAlive(self):
+        """
+        Returns True if the ship exists, False if it has been destroyed.
+        """
+        return self._shipalive
+
+
+    def setShip(self):
+        """
+        Creates a new ship in the middle of the bottom of the game window.
+        """
+        self._shipx=GAME_WIDTH//2
+        self._shipalive=True
+
+
+    def isAlive(self,row,col):
+        """
+        Returns True if the alien at (row,col) is alive.
+
+        Parameter row: the row of the alien, counting from the bottom
+        Precondition: row is an int and 0<=row<_rows
+
+        Parameter col: the column of the alien
+        Precondition: col is an int and 0<=col<_cols
+        """
+        return self._alive[row*self._cols+col]==1
+
+
+    def getAlienX(self,col):
+        """
+        Returns the x coordinate of the center of the aliens in column col.
+
+        Parameter col: the column of the alien
+        Precondition: col is an int and 0<=col<_cols
+        """
+        return ALIEN_H_SEP*(col+1)+0.5*ALIEN_WIDTH+ALIEN_WIDTH*col+self._offx
+
+
+    def getAlienY(self,row):
+        """
+        Returns the y coordinate of the center of the aliens in row row.
+
+        Parameter row: the row of the alien, counting from the bottom
+        Precondition: row is an int and 0<=row<_rows
+        """
+        k=self._rows-1-row
+        return (GAME_HEIGHT-ALIEN_CEILING)-(ALIEN_V_SEP*k)-(ALIEN_HEIGHT*k)-\
+        (0.5*ALIEN_HEIGHT)+self._offy
+
+
+    def getFrame(self):
+        """
+        Returns the animation frame shared by all of the aliens.
+        """
+        return self._frame
+
+
+    def getMarches(self):
+        """
+        Returns the number of steps the aliens have taken in this wave.
+
+        The value only changes when the formation moves, so it can be used to
+        tell whether the aliens have to be redrawn.
+        """
+        return self._marches
+
+
+    def getBolts(self):
+        """
+        Returns the list of bolts currently in play.
+
+        The list is owned by the simulation and must not be modified.
+        """
+        return self._bolts
+
+
+    def getAliveBuffer(self):
+        """
+        Returns the buffer holding the alien alive flags.
+
+        The buffer is a bytearray of _rows*_cols bytes (1 if the alien is alive
+        and 0 otherwise) stored row by row from the bottom. It is the storage
+        of the simulation itself, so it is always current and it must not be
+        modified. The buffer is never replaced, not even by reset, which makes
+        it safe to wrap in a NumPy array once.
+        """
+        return self._alive
+
+
+    def getOffset(self):
+        """
+        Returns the offset of the formation from its start as a tuple (dx,dy).
+        """
+        return (self._offx,self._offy)
+
+
+    def getEvents(self):
+        """
+        Returns the list of events recorded by the last update.
+        """
+        return self._events
+
+
+    def getKilled(self):
+        """
+        Returns the (row,col) of every alien destroyed since the wave started,
+        in the order they were destroyed.
+
+        The list is only ever appended to, until the wave is reset or restored,
+        so the aliens destroyed since the list was last looked at are the ones
+        past its old length. A reset or restore only marks the list as stale,
+        and it is rebuilt from the alive grid here, in the order of the grid.
+        """
+        if self._killed is None:
+            alive=self._alive
+            cols=self._cols
+            self._killed=[(row,col) for row in range(self._rows)
+                for col in range(cols) if not alive[row*cols+col]]
+        return self._killed
+
+
+    def getRows(self):
+        """
+        Returns the number of rows of aliens.
+        """
+        return self._rows
+
+
+    def getCols(self):
+        """
+        Returns the number of aliens per row.
+        """
+        return self._cols
+
+
+    def getKills(self):
+        """
+        Returns the number of aliens destroyed in each row, from the bottom.
+        """
+        return [self._cols-count for count in self._rowcount]
+
+
+    # INITIALIZER
+    def __init__(self,rows=ALIEN_ROWS,cols=ALIENS_IN_ROW,speed=ALIEN_SPEED,
+    seed=None,tps=TICKS_PER_SECOND):
+        """
+        Initialises all the instance attributes.
+
+        Every wave owns its own random number generator, so two waves with the
+        same seed (and the same inputs) play exactly the same game.
+
+        Parameter rows: the number of rows of aliens
+        Precondition: rows is an int > 0
+
+        Parameter cols: the number of aliens per row
+        Precondition: cols is an int > 0
+
+        Parameter speed: the number of seconds between alien steps
+        Precondition: speed is a number > 0
+
+        Parameter seed: the seed of the random number generator
+        Precondition: seed is an int, or None to seed from the system
+
+        Parameter tps: the number of ticks per second of game time
+        Precondition: tps is an int > 0
+        """
+        self._rows=rows
+        self._tps=tps
+        self._cols=cols
+        self._start=speed
+        self._random=SimRandom()
+        self._alive=bytearray(self._rows*self._cols)
+        self._rowcount=[0]*self._rows
+        self._colcount=[0]*self._cols
+        self._bolts=[]
+        self._spare=[]
+        self._events=[]
+        self._killed=None
+        self._grid=None
+        self.reset(seed)
+
+
+    def reset(self,seed=None):
+        """
+        Starts the wave over, reseeding the random number generator.
+
+        The wave is reset in place: the buffer returned by getAliveBuffer and
+        the list returned by getBolts are the same objects afterwards.
+
+        Parameter seed: the seed of the random number generator
+        Precondition: seed is an int, or None to seed from the system
+        """
+        self._random.seed(seed)
+        for i in range(len(self._alive)):
+            self._alive[i]=1
+        self._offx=0
+        self._offy=0
+        self._frame=0
+        self._marches=0
+        self._shipx=GAME_WIDTH//2
+        self._shipalive=True
+        while self._bolts:
+            self._removeBolt(len(self._bolts)-1)
+        self._lives=SHIP_LIVES
+        self._score=0
+        self._time=0
+        self._speed=self._start
+        self._numMarch=0
+        self._alienbolts=self._random.randint(1,BOLT_RATE)
+        self._movingR=True
+        self._recount()
+        self._killed=None
+        del self._events[:]
+
+
+    # SNAPSHOTS
+    def snapshot(self):
+        """
+        Returns the complete state of the wave packed into bytes.
+
+        A snapshot holds everything the game depends on, including the state
+        of the random number generator, so a wave restored from it plays on
+        exactly like the wave it was taken from. The alive flags are packed
+        into bits, so a wave of 5x11 aliens takes 78 bytes plus 17 bytes per
+        bolt. The clock and the events of
+        the last update are not part of the snapshot.
+        """
+        parts=[self._SNAPSHOT.pack(self._rows,self._cols,self._offx,self._offy,
+        self._shipx,self._speed,self._random.getstate(),self._score,
+        self._lives,self._time,self._marches,self._numMarch,self._alienbolts,
+        self._noaliens,len(self._bolts),self._frame,self._movingR,
+        self._shipalive)]
+        size=len(self._alive)
+        bits=int(self._alive.translate(self._TO_DIGITS)[::-1],2)
+        parts.append(bits.to_bytes((size+7)//8,'little'))
+        pack=self._BOLT.pack
+        for bolt in self._bolts:
+            parts.append(pack(bolt.x,bolt.y,bolt.kind))
+        return b''.join(parts)
+
+
+    def restore(self,data):
+        """
+        Puts the wave back into the state saved in a snapshot.
+
+        The wave is restored in place and no new objects are made, except for
+        a BoltData when the snapshot has more bolts than are in play now. The
+        BoltData objects in play may be reused for different bolts. The alien
+        grid is unpacked and counted once for each new grid; restoring the same
+        grid again, as a search does, only copies the saved flags and counts.
+
+        Parameter data: the snapshot to restore
+        Precondition: data is a bytes-like object returned by snapshot on a
+        wave with the same number of rows and columns
+        """
+        (rows,cols,self._offx,self._offy,self._shipx,self._speed,state,
+        self._score,self._lives,self._time,self._marches,self._numMarch,
+        self._alienbolts,self._noaliens,count,self._frame,movingR,
+        shipalive)=self._SNAPSHOT.unpack_from(data,0)
+        assert rows==self._rows and cols==self._cols, \
+        'snapshot of a %dx%d wave' % (rows,cols)
+        self._movingR=movingR==1
+        self._shipalive=shipalive==1
+        self._random.setstate(state)
+        pos=self._SNAPSHOT.size
+        size=len(self._alive)
+        packed=bytes(memoryview(data)[pos:pos+(size+7)//8])
+        pos+=len(packed)
+        grid=self._grid
+        if grid is not None and grid[0]==packed:
+            # Searches restore the same grid over and over
+            self._alive[:]=grid[1]
+            self._rowcount[:]=grid[2]
+            self._colcount[:]=grid[3]
+            self._findEdges()
+        else:
+            spread=self._SPREAD
+            flags=b''.join([spread[b] for b in packed])
+            self._alive[:]=memoryview(flags)[:size]
+            self._recount()
+            self._grid=(packed,bytes(self._alive),tuple(self._rowcount),
+                tuple(self._colcount))
+        bolts=self._bolts
+        while len(bolts)>count:
+            self._removeBolt(len(bolts)-1)
+        unpack=self._BOLT.unpack_from
+        for i in range(count):
+            x,y,kind=unpack(data,pos)
+            pos+=self._BOLT.size
+            v=BOLT_SPEED if kind==BOLT_PLAYER else -BOLT_SPEED
+            if i<len(bolts):
+                bolt=bolts[i]
+                bolt.x=x
+                bolt.y=y
+                bolt.velocity=v
+                bolt.kind=kind
+                bolt.delete=False
+            else:
+                self._addBolt(x,y,v,kind)
+        self._killed=None
+        del self._events[:]
+
+
+    # UPDATE METHODS
+    def update(self,left,right,fire,ticks=1):
+        """
+        Simulates the given number of ticks with the same input.
+
+        The events of the previous update are cleared first, so afterwards
+        getEvents returns everything that happened during these ticks. An
+        update of 0 ticks only clears the events.
+
+        Parameter left: whether the ship should move left
+        Precondition: left is a bool
+
+        Parameter right: whether the ship should move right
+        Precondition: right is a bool
+
+        Parameter fire: whether the ship should fire a bolt
+        Precondition: fire is a bool
+
+        Parameter ticks: the number of ticks to simulate
+        Precondition: ticks is an int >= 0
+        """
+        del self._events[:]
+        for i in range(ticks):
+            self.tick(left,right,fire)
+
+
+    def tick(self,left,right,fire):
+        """
+        Simulates a single tick of the wave, which is 1/_tps seconds of game
+        time.
+
+        Everything in the simulation is defined per tick: the ship moves
+        SHIP_MOVEMENT pixels, the bolts move BOLT_SPEED pixels, and the aliens
+        step once _speed seconds worth of ticks have gone by. The steps are the
+        same as in Wave.update: move the ship, march the aliens, check the alien
+        bolts against the ship, fire and move the bolts, and finally remove the
+        bolts that hit something.
+
+        Parameter left: whether the ship should move left
+        Precondition: left is a bool
+
+        Parameter right: whether the ship should move right
+        Precondition: right is a bool
+
+        Parameter fire: whether the ship should fire a bolt
+        Precondition: fire is a bool
+        """
+        self._moveShip(left,right)
+        self._moveAlien()
+        for bolt in self._bolts:
+            if bolt.kind!=BOLT_PLAYER:
+                self._collisionship(bolt)
+        self._determineFire(fire)
+        self._DeleteBolt()
+
+
+    # HELPER METHODS FOR THE SHIP AND THE BOLTS
+    def _moveShip(self,left,right):
+        """
+        Moves the ship by SHIP_MOVEMENT pixels in the requested directions,
+        stopping it at the edges of the game window.
+
+        Parameter left: whether the ship should move left
+        Precondition: left is a bool
+
+        Parameter right: whether the ship should move right
+        Precondition: right is a bool
+        """
+        max=GAME_WIDTH-SHIP_WIDTH/2
+        min=0+SHIP_WIDTH/2
+        if self._shipalive:
+            if left:
+                if self._shipx-SHIP_WIDTH/2>=min:
+                    self._shipx-=SHIP_MOVEMENT
+                else:
+                    self._shipx=min
+            if right:
+                if self._shipx+SHIP_WIDTH/2<=max:
+                    self._shipx+=SHIP_MOVEMENT
+                else:
+                    self._shipx=max
+
+
+    def _determineFire(self,fire):
+        """
+        Fires a bolt from the ship if requested, then moves every bolt and
+        checks the player bolts against the aliens.
+
+        The ship may only have one bolt on screen at a time. Bolts that leave
+        the top of the game window are removed.
+
+        Parameter fire: whether the ship should fire a bolt
+        Precondition: fire is a bool
+        """
+        if fire and self._shipalive:
+            c=0
+            for bolt in self._bolts:
+                if bolt.velocity>0:
+                    c+=1
+            if c==0:
+                y=SHIP_HEIGHT+BOLT_HEIGHT/2
+                self._addBolt(self._shipx,y,BOLT_SPEED,BOLT_PLAYER)
+                self._events.append(EVENT_FIRE)
+        for bolt in self._bolts:
+            bolt.y+=bolt.velocity
+            if bolt.kind==BOLT_PLAYER:
+                self._collision(bolt)
+        i = 0
+        while i < len(self._bolts):
+            if self._bolts[i].y-BOLT_HEIGHT/2 > GAME_HEIGHT:
+                self._removeBolt(i)
+            else:
+                i += 1
+
+
+    def _collision(self,bolt):
+        """
+        Checks whether a bolt from the ship has collided with any alien.
+
+        Every alien that contains a corner of the bolt is destroyed and its
+        value is added to the score.
+
+        The aliens sit on a regular grid, so a corner can only be inside the
+        alien whose row and column are nearest to it (see _rowAt and _colAt).
+        This makes the check O(1), however many aliens there are.
+
+        Parameter bolt: the player bolt with which the collision is checked
+        Precondition: bolt is a BoltData object of kind BOLT_PLAYER
+        """
+        top=self._rowAt(bolt.y+BOLT_HEIGHT/2)
+        bottom=self._rowAt(bolt.y-BOLT_HEIGHT/2)
+        if top<0 and bottom<0:
+            return
+        left=self._colAt(bolt.x-BOLT_WIDTH/2)
+        right=self._colAt(bolt.x+BOLT_WIDTH/2)
+        if left<0 and right<0:
+            return
+        for row in sorted({top,bottom}):
+            if row<0:
+                continue
+            if row<self._rows/3:
+                val=10
+            elif row<2*self._rows/3:
+                val=30
+            else:
+                val=50
+            for col in sorted({left,right}):
+                if col>=0 and self._alive[row*self._cols+col]:
+                    self._kill(row,col)
+                    self._score+=val
+                    self._events.append(EVENT_ALIEN_DIED)
+                    bolt.delete=True
+
+
+    def _rowAt(self,y):
+        """
+        Returns the row of aliens whose height contains y, or -1 if none.
+
+        Parameter y: the y-coordinate to look up
+        Precondition: y is an int or float
+        """
+        pitch=ALIEN_V_SEP+ALIEN_HEIGHT
+        row=self._rows-1-int(round((self.getAlienY(self._rows-1)-y)/pitch))
+        if row<0 or row>=self._rows:
+            return -1
+        if abs(y-self.getAlienY(row))<ALIEN_HEIGHT/2:
+            return row
+        return -1
+
+
+    def _colAt(self,x):
+        """
+        Returns the column of aliens whose width contains x, or -1 if none.
+
+        Parameter x: the x-coordinate to look up
+        Precondition: x is an int or float
+        """
+        pitch=ALIEN_H_SEP+ALIEN_WIDTH
+        col=int(round((x-self.getAlienX(0))/pitch))
+        if col<0 or col>=self._cols:
+            return -1
+        if abs(x-self.getAlienX(col))<ALIEN_WIDTH/2:
+            return col
+        return -1
+
+
+    def _kill(self,row,col):
+        """
+        Destroys the alien at (row,col), updating the counts and the edges of
+        the formation.
+
+        Only the row and column of the alien are looked at, so this is O(1)
+        unless the alien was the last one of an edge row or column.
+
+        Parameter row: the row of the alien, counting from the bottom
+        Precondition: row is an int, 0<=row<_rows, and the alien is alive
+
+        Parameter col: the column of the alien
+        Precondition: col is an int, 0<=col<_cols, and the alien is alive
+        """
+        self._alive[row*self._cols+col]=0
+        if self._killed is not None:
+            self._killed.append((row,col))
+        self._noaliens-=1
+        self._rowcount[row]-=1
+        self._colcount[col]-=1
+        if self._rowcount[row]==0 and row==self._lowrow:
+            while self._lowrow<self._rows and not \
+            self._rowcount[self._lowrow]:
+                self._lowrow+=1
+        if self._colcount[col]==0:
+            while self._leftcol<self._cols and not \
+            self._colcount[self._leftcol]:
+                self._leftcol+=1
+            while self._rightcol>=0 and not self._colcount[self._rightcol]:
+                self._rightcol-=1
+
+
+    def _recount(self):
+        """
+        Recounts the aliens alive in every row and column, and finds the edges
+        of the formation from scratch.
+
+        The alive grid is read in place. Each row is counted with one call to
+        count, and the columns are summed by adding the rows of the grid, read
+        as one integer with a byte per alien, so that each byte of the total is
+        the count of one column.
+        """
+        rows=self._rows
+        cols=self._cols
+        alive=self._alive
+        rowcount=self._rowcount
+        if rows<256:
+            grid=int.from_bytes(alive,'little')
+            shift=8*cols
+            mask=(1<<shift)-1
+            total=0
+            for row in range(rows):
+                rowcount[row]=alive.count(1,row*cols,(row+1)*cols)
+                total+=grid&mask
+                grid>>=shift
+            self._colcount[:]=total.to_bytes(cols,'little')
+        else:
+            for row in range(rows):
+                rowcount[row]=alive.count(1,row*cols,(row+1)*cols)
+            colcount=self._colcount
+            for col in range(cols):
+                colcount[col]=0
+            for i in range(len(alive)):
+                colcount[i%cols]+=alive[i]
+        self._noaliens=sum(self._rowcount)
+        self._findEdges()
+
+
+    def _findEdges(self):
+        """
+        Finds the lowest row and the leftmost and rightmost columns with an
+        alien alive, from the row and column counts.
+        """
+        rows=self._rows
+        cols=self._cols
+        self._lowrow=0
+        while self._lowrow<rows and not self._rowcount[self._lowrow]:
+            self._lowrow+=1
+        self._leftcol=0
+        while self._leftcol<cols and not self._colcount[self._leftcol]:
+            self._leftcol+=1
+        self._rightcol=cols-1
+        while self._rightcol>=0 and not self._colcount[self._rightcol]:
+            self._rightcol-=1
+
+
+    def _addBolt(self,x,y,v,kind):
+        """
+        Puts a new bolt in play, reusing a removed bolt if there is one.
+
+        Parameter x: the x-coordinate of the bolt center
+        Precondition: x is an int or float
+
+        Parameter y: the y-coordinate of the bolt center
+        Precondition: y is an int or float
+
+        Parameter v: the velocity of the bolt
+        Precondition: v is an int or float
+
+        Parameter kind: the kind of the bolt
+        Precondition: kind is one of BOLT_PLAYER, BOLT_ALIEN, BOLT_POWERUP
+        """
+        if self._spare:
+            bolt=self._spare.pop()
+            bolt.x=x
+            bolt.y=y
+            bolt.velocity=v
+            bolt.kind=kind
+            bolt.delete=False
+        else:
+            bolt=BoltData(x,y,v,kind)
+        self._bolts.append(bolt)
+
+
+    def _removeBolt(self,i):
+        """
+        Takes the bolt at position i out of play, keeping it for reuse.
+
+        The last bolt is moved into its place, so removing a bolt never shifts
+        the rest of the list. Loops that remove bolts must look at position i
+        again afterwards.
+
+        Parameter i: the position of the bolt in _bolts
+        Precondition: i is an int, 0<=i<len(_bolts)
+        """
+        bolts=self._bolts
+        bolt=bolts[i]
+        bolts[i]=bolts[-1]
+        bolts.pop()
+        if len(self._spare)<BOLT_POOL:
+            self._spare.append(bolt)
+
+
+    def _DeleteBolt(self):
+        """
+        Deletes every bolt marked for deletion.
+        """
+        i=0
+        while i < len(self._bolts):
+            if self._bolts[i].delete:
+                self._removeBolt(i)
+            else:
+                i += 1
+
+
+    def _collisionship(self,bolt):
+        """
+        Detects a collision between an alien bolt and the ship.
+
+        If a power-up bolt collides with the ship, the score increases by
+        POWERUP_SCORE. If a regular bolt collides with the ship, lives decrease
+        by 1 and the ship is destroyed.
+
+        Parameter bolt: the alien bolt with which the collision is checked
+        Precondition: bolt is a BoltData object not of kind BOLT_PLAYER
+        """
+        if self._shipalive and bolt.velocity<0:
+            left_x=bolt.x-BOLT_WIDTH/2
+            right_x=bolt.x+BOLT_WIDTH/2
+            top_y=bolt.y+BOLT_HEIGHT/2
+            bottom_y=bolt.y-BOLT_HEIGHT/2
+            hitx=abs(left_x-self._shipx)<SHIP_WIDTH/2 or \
+            abs(right_x-self._shipx)<SHIP_WIDTH/2
+            hity=abs(top_y-SHIP_BOTTOM)<SHIP_HEIGHT/2 or \
+            abs(bottom_y-SHIP_BOTTOM)<SHIP_HEIGHT/2
+            if hitx and hity:
+                if bolt.kind==BOLT_POWERUP:
+                    self._score+=POWERUP_SCORE
+                    self._events.append(EVENT_POWERUP)
+                else:
+                    self._shipalive=False
+                    self._lives-=1
+                    self._events.append(EVENT_SHIP_DIED)
+                bolt.delete=True
+
+
+    def _alienFire(self):
+        """
+        Makes the lowest alien of a random column fire a bolt. The chances of a
+        power-up bolt being fired are 1 in 10.
+
+        Also removes the bolts that have reached the bottom of the game window.
+        """
+        if self._noaliens>0:
+            while True:
+                colum=self._random.randint(0,self._cols-1)
+                row=0
+                while row<self._rows and not \
+                self._alive[row*self._cols+colum]:
+                    row+=1
+                if row<self._rows:
+                    break
+            x=self.getAlienX(colum)
+            y=self.getAlienY(row)
+            if self._random.randint(1,10)==10:
+                kind=BOLT_POWERUP
+            else:
+                kind=BOLT_ALIEN
+            self._addBolt(x,y-ALIEN_HEIGHT/2,-1*BOLT_SPEED,kind)
+            self._events.append(EVENT_ALIEN_FIRE)
+        i = 0
+        while i < len(self._bolts):
+            if self._bolts[i].y+BOLT_HEIGHT/2 < 0:
+                self._removeBolt(i)
+            else:
+                i += 1
+
+
+    # HELPER METHODS FOR THE ALIENS
+    def _moveAlien(self):
+        """
+        Keeps moving the aliens across the game window.
+
+        The aliens take a step once more than _speed seconds worth of ticks
+        have gone by, going down a row and turning around whenever they reach
+        an edge of the game window.
+        """
+        self._time+=1
+        if self._time>self._speed*self._tps and self._noaliens>0:
+            if self._movingR and self._trackRight()<GAME_WIDTH-ALIEN_H_SEP:
+                self._march(ALIEN_H_WALK)
+            elif self._trackRight()>=GAME_WIDTH-ALIEN_H_SEP:
+                self._marchDown()
+                self._march(-ALIEN_H_WALK)
+                self._movingR=False
+            elif not self._movingR and self._trackLeft()>ALIEN_H_SEP:
+                self._march(-ALIEN_H_WALK)
+            elif self._trackLeft()<=ALIEN_H_SEP:
+                self._marchDown()
+                self._march(ALIEN_H_WALK)
+                self._movingR=True
+            self._time=0
+
+
+    def _march(self,dx):
+        """
+        Moves the formation horizontally by dx and fires an alien bolt when the
+        aliens have taken _alienbolts steps.
+
+        Parameter dx: the number of pixels to move the formation
+        Precondition: dx is an int or float
+        """
+        self._offx+=dx
+        self._frame=(self._frame+1)%2
+        self._step()
+
+
+    def _marchDown(self):
+        """
+        Moves the formation down by ALIEN_V_WALK. The aliens speed up a little
+        for every alien still alive.
+
+        The formation does not move if this would put the bottom aliens right
+        on the defense line.
+        """
+        newy=self.getAlienY(self._lowestRow())-ALIEN_V_WALK
+        if newy!=DEFENSE_LINE+ALIEN_HEIGHT/2:
+            self._offy-=ALIEN_V_WALK
+            self._frame=(self._frame+1)%2
+            for i in range(self._noaliens):
+                self._speed-=self._speed/300
+        self._step()
+
+
+    def _step(self):
+        """
+        Counts an alien step, firing an alien bolt every _alienbolts steps.
+        """
+        self._marches+=1
+        self._events.append(EVENT_MARCH)
+        self._numMarch+=1
+        if self._numMarch==self._alienbolts:
+            self._alienFire()
+            self._numMarch=0
+            self._alienbolts=self._random.randint(1,BOLT_RATE)
+
+
+    def _lowestRow(self):
+        """
+        Returns the lowest row with an alien alive, or _rows if none.
+        """
+        return self._lowrow
+
+
+    def _trackRight(self):
+        """
+        Returns the right edge of the rightmost alien still alive.
+        """
+        if self._rightcol>=0:
+            return self.getAlienX(self._rightcol)+ALIEN_WIDTH/2
+
+
+    def _trackLeft(self):
+        """
+        Returns the left edge of the leftmost alien still alive.
+        """
+        if self._leftcol<self._cols:
+            return self.getAlienX(self._leftcol)-ALIEN_WIDTH/2
+
+
+    def trackDown(self):
+        """
+        Returns the height used to check whether the aliens have reached the
+        defense line.
+        """
+        row=self._lowestRow()
+        if row<self._rows:
+            return self.getAlienY(row)-ALIEN_WIDTH/2
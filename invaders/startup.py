@@ -0,0 +1,104 @@
+"""
+Startup report for Alien Invaders
+
+This module measures what it costs to import the game in each of the ways it
+can be run: the headless simulation (rollouts and tests), the learning
+environments, and the full window. Every mode is measured in a fresh Python
+process started with the -X importtime option, so nothing is already cached,
+and the report lists the modules that took the longest to import.
+
+The headless modes should never import Kivy, introcs or game2d. If one of
+them shows up in the report of a headless mode, an import is no longer lazy.
+
+To see the 15 slowest imports of every mode, type
+
+    python invaders/startup.py
+
+and to see the 30 slowest imports of the headless simulation, type
+
+    python invaders/startup.py headless 30
+
+Author: agent (agent@local), extending the game by Mihikaa Goenka (mg897) and
+Oishani Ganguly (og58)
+Date: October 18th, 2026
+"""
+import collections
+import os.path
+import subprocess
+import sys
+
+
+#: The modules imported by each way of running the game
+MODES = collections.OrderedDict([
+    ('headless',['wave','rollout']),
+    ('env',['env','vecenv']),
+    ('window',['app']),
+])
+
+#: The import cost of a single module, in microseconds
+Import = collections.namedtuple('Import',['module','self','cumulative'])
+
+
+def measure(mode):
+    """
+    Returns the import cost of every module imported by the given mode, in the
+    order the imports finished.
+
+    The modules are imported in a fresh process. An error is raised if they
+    cannot be imported (for example, if Kivy is not installed).
+
+    Parameter mode: the way of running the game
+    Precondition: mode is a key of MODES
+    """
+    assert mode in MODES, '%s is not a known mode' % repr(mode)
+    folder=os.path.dirname(os.path.abspath(__file__))
+    code='import '+', '.join(MODES[mode])
+    proc=subprocess.run([sys.executable,'-X','importtime','-c',code],
+    cwd=folder,stdout=subprocess.DEVNULL,stderr=subprocess.PIPE,
+    universal_newlines=True)
+    if proc.returncode!=0:
+        lines=proc.stderr.strip().splitlines()
+        raise ImportError(lines[-1] if lines else 'import failed')
+    result=[]
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts=line[len('import time:'):].split('|')
+        try:
+            result.append(Import(parts[2].strip(),int(parts[0]),int(parts[1])))
+        except (IndexError,ValueError):
+            pass    # The header line
+    return result
+
+
+def report(mode,top=15):
+    """
+    Prints the total import time of the given mode and its slowest imports.
+
+    Parameter mode: the way of running the game
+    Precondition: mode is a key of MODES
+
+    Parameter top: the number of imports to list
+    Precondition: top is an int >= 0
+    """
+    try:
+        imports=measure(mode)
+    except ImportError as e:
+        print('%s: cannot be imported (%s)' % (mode,e))
+        return
+    total=sum(i.self for i in imports)
+    print('%s: %d modules in %.1f ms' % (mode,len(imports),total/1000))
+    for i in sorted(imports,key=lambda i: -i.self)[:top]:
+        print('  %8.1f ms self %8.1f ms cumulative  %s'
+        % (i.self/1000,i.cumulative/1000,i.module))
+    for name in ('kivy','introcs','game2d'):
+        if mode!='window' and any(i.module==name for i in imports):
+            print('  warning: %s imports %s' % (mode,name))
+
+
+# Application code
+if __name__ == '__main__':
+    modes=[sys.argv[1]] if len(sys.argv) > 1 else list(MODES)
+    top=int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    for mode in modes:
+        report(mode,top)
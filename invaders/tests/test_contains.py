@@ -0,0 +1,75 @@
+"""
+Tests that the single-point and batch hit tests of game2d agree
+
+contains and contains_many must give the same answer for every point, also
+for shapes that are scaled or rotated. The tests need Kivy and introcs, and
+are skipped without them.
+
+Author: agent (agent@local), extending the game2d package by Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('kivy')
+pytest.importorskip('introcs')
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game2d.gobject import GObject
+from game2d.gpath import GTriangle, GPolygon
+
+# A grid of points around every shape tested
+POINTS = [(x,y) for x in range(-60,61,5) for y in range(-60,61,5)]
+
+
+def check_agree(shape):
+    """
+    Asserts that contains and contains_many agree on every point of POINTS.
+
+    Parameter shape: the shape to test
+    Precondition: shape has the methods contains and contains_many
+    """
+    many = shape.contains_many(POINTS)
+    for point, inside in zip(POINTS,many):
+        assert shape.contains(point) == bool(inside), point
+
+
+@pytest.mark.parametrize('scale,angle',[(1,0),(2,0),((0.5,3),0),(1,30),(2,45)])
+def test_gobject_contains_many(scale,angle):
+    shape = GObject(x=5,y=-3,width=20,height=10)
+    shape.scale = scale
+    shape.angle = angle
+    check_agree(shape)
+
+
+def test_gobject_scaled_box():
+    shape = GObject(x=0,y=0,width=20,height=10)
+    shape.scale = 2
+    assert shape.contains((15,0))
+    assert not shape.contains((25,0))
+    assert list(shape.contains_many([(15,0),(25,0)])) == [True,False]
+
+
+@pytest.mark.parametrize('scale,angle',[(1,0),(2,0),((0.5,3),0),(1,30),(2,45)])
+def test_polygon_contains_many(scale,angle):
+    shape = GPolygon(points=(0,0,40,0,40,40,20,8,0,40),x=-10,y=-20)
+    shape.scale = scale
+    shape.angle = angle
+    check_agree(shape)
+
+
+@pytest.mark.parametrize('scale,angle',[(1,0),(2,0),(1,30),(2,45)])
+def test_triangle_contains_many(scale,angle):
+    shape = GTriangle(points=(-20,-10,0,25,20,-10),x=3,y=4)
+    shape.scale = scale
+    shape.angle = angle
+    check_agree(shape)
+
+
+def test_concave_polygon():
+    shape = GPolygon(points=(0,0,100,0,100,100,50,20,0,100))
+    assert not shape.contains((50,50))
+    assert shape.contains((50,10))
+    assert list(shape.contains_many([(50,50),(50,10)])) == [False,True]
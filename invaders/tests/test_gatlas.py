@@ -0,0 +1,44 @@
+"""
+Tests that GAtlas cuts filmstrips into the right frames
+
+The frames of a filmstrip need not be square, so each row of frames must be
+one frame height below the last. The tests need Kivy and the rest of game2d,
+and are skipped without them.
+
+Author: agent (agent@local), extending the game2d package by Walker M. White (wmw2)
+Date:   October 18, 2026
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('kivy')
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+gatlas = pytest.importorskip('game2d.gatlas')
+
+from kivy.graphics.texture import Texture
+
+
+@pytest.fixture
+def strip():
+    """
+    Returns the name of a 60x40 filmstrip in the atlas, with 2 rows of 2 frames.
+    """
+    gatlas.GAtlas._textures = {'strip.png': Texture.create(size=(60,40))}
+    gatlas.GAtlas._frames = {}
+    yield 'strip.png'
+    gatlas.GAtlas._textures = {}
+    gatlas.GAtlas._frames = {}
+
+
+def test_frames_not_square(strip):
+    frames = gatlas.GAtlas.frames(strip,(2,2))
+    assert [tuple(frame.size) for frame in frames] == [(30,20)]*4
+    # Left-to-right, top-to-bottom, with the top row at the top of the texture
+    assert [tuple(frame.uvpos) for frame in frames] == \
+        [(0.0,0.5),(0.5,0.5),(0.0,0.0),(0.5,0.0)]
+
+
+def test_frames_cached(strip):
+    assert gatlas.GAtlas.frames(strip,(2,2)) is gatlas.GAtlas.frames(strip,(2,2))
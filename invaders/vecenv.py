@@ -0,0 +1,407 @@
+"""
+Vectorized environment module for Alien Invaders
+
+This module runs many InvadersEnv environments at once, spread over a few
+worker processes. Nothing is pickled while the games are played. The parent
+process and the workers share a single block of memory that holds
+
+    the alien grid, formation, ship and bolts of every environment,
+    the reward and done flag of every environment, and
+    a ring of action rows written by the parent.
+
+For each step, the parent writes one action per environment into the next
+row of the ring and waits on a barrier. The workers read their actions from
+that row, step their environments, write the results straight into the shared
+block, and wait on the barrier again. The parent then reads the observations
+from the very same arrays, without copying them.
+
+Every wait on the barrier has a timeout. If a worker dies, the parent raises
+a RuntimeError instead of waiting forever, and the environment is closed.
+The shared block is unlinked when the environment is closed, or when it is
+garbage collected or the program exits without being closed.
+
+A worker can be told to reset an environment by writing ACTION_RESET in
+place of an action. An environment whose game is over starts a new game on
+its own, so the observation returned along with done=True is already the first
+observation of the next game.
+
+Author: agent (agent@local), extending the game by Mihikaa Goenka (mg897) and
+Oishani Ganguly (og58)
+Date: October 18th, 2026
+"""
+from consts import *
+from env import InvadersEnv
+from multiprocessing import shared_memory
+import multiprocessing
+import numpy as np
+import threading
+import weakref
+
+# The action telling a worker to start a new game
+ACTION_RESET = -1
+
+# The commands a worker reads after each barrier
+_COMMAND_STEP = 0
+_COMMAND_CLOSE = 1
+
+# The seconds the parent waits for the workers before giving up on them
+TIMEOUT = 60.0
+
+
+def _layout(n,rows,cols,capacity,depth):
+    """
+    Returns the list of arrays in the shared block, and the size of the block.
+
+    Each array is a tuple (name,shape,dtype,offset). Every offset is a multiple
+    of 8 bytes.
+
+    Parameter n: the number of environments
+    Precondition: n is an int > 0
+
+    Parameter rows: the number of rows of aliens
+    Precondition: rows is an int > 0
+
+    Parameter cols: the number of aliens per row
+    Precondition: cols is an int > 0
+
+    Parameter capacity: the number of bolts per observation
+    Precondition: capacity is an int > 0
+
+    Parameter depth: the number of rows in the action ring
+    Precondition: depth is an int > 0
+    """
+    fields=[('aliens',(n,rows,cols),np.uint8),('formation',(n,2),np.float64),
+        ('ship',(n,2),np.float64),('bolts',(n,capacity,4),np.float32),
+        ('nbolts',(n,1),np.int32),('reward',(n,),np.int64),
+        ('done',(n,),np.bool_),('actions',(depth,n),np.int8),
+        ('cursor',(1,),np.int64),('command',(1,),np.int64)]
+    result=[]
+    size=0
+    for name,shape,dtype in fields:
+        result.append((name,shape,dtype,size))
+        size+=int(np.prod(shape))*np.dtype(dtype).itemsize
+        size=(size+7)//8*8
+    return result,size
+
+
+def _attach(block,layout):
+    """
+    Returns the tuple (whole,arrays), where whole is a byte array over the
+    entire shared block and arrays is a dictionary of the arrays in it.
+
+    Every array in the dictionary, and every view of one of them, has whole
+    as its base. The block may be unmapped once whole has been released.
+
+    Parameter block: the shared block
+    Precondition: block is a SharedMemory created with the size from _layout
+
+    Parameter layout: the arrays in the block
+    Precondition: layout is the list returned by _layout
+    """
+    whole=np.ndarray((block.size,),dtype=np.uint8,buffer=block.buf)
+    arrays={}
+    for name,shape,dtype,offset in layout:
+        count=int(np.prod(shape))*np.dtype(dtype).itemsize
+        arrays[name]=whole[offset:offset+count].view(dtype).reshape(shape)
+    return whole,arrays
+
+
+def _shutdown(block,command,barrier,workers,timeout):
+    """
+    Stops the workers of a vectorized environment and unlinks its shared block.
+
+    This runs once for every environment: when it is closed, or else when it
+    is garbage collected or the program exits. Workers that do not stop in
+    time are terminated.
+
+    Parameter block: the shared block
+    Precondition: block is a SharedMemory created by the environment
+
+    Parameter command: the command array in the block
+    Precondition: command is an int64 array (1,)
+
+    Parameter barrier: the barrier shared with the workers
+    Precondition: barrier is a multiprocessing Barrier
+
+    Parameter workers: the worker processes
+    Precondition: workers is a list of Process
+
+    Parameter timeout: the seconds to wait for the workers
+    Precondition: timeout is a number > 0, or None to wait forever
+    """
+    command[0]=_COMMAND_CLOSE
+    try:
+        barrier.wait(timeout)
+    except threading.BrokenBarrierError:
+        pass
+    for process in workers:
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    block.unlink()
+
+
+def _work(name,layout,start,stop,seed,stride,config,barrier):
+    """
+    Runs the environments start..stop-1 of a vectorized environment until the
+    parent closes it.
+
+    Environment i plays its k-th game with the seed seed+i+k*stride.
+
+    Parameter name: the name of the shared block
+    Precondition: name is a str
+
+    Parameter layout: the arrays in the block
+    Precondition: layout is the list returned by _layout
+
+    Parameter start: the first environment of this worker
+    Precondition: start is an int >= 0
+
+    Parameter stop: one past the last environment of this worker
+    Precondition: stop is an int > start
+
+    Parameter seed: the seed of the first game of environment 0
+    Precondition: seed is an int
+
+    A reset of an environment that has not been stepped since its game
+    started restarts that same game, so the first reset plays seed+i.
+
+    Parameter stride: the number of environments
+    Precondition: stride is an int > 0
+
+    Parameter config: the keyword arguments of every InvadersEnv
+    Precondition: config is a dict
+
+    Parameter barrier: the barrier shared with the parent and other workers
+    Precondition: barrier is a multiprocessing Barrier
+    """
+    block=shared_memory.SharedMemory(name=name)
+    whole,arrays=_attach(block,layout)
+    try:
+        envs=[]
+        games=[]
+        played=[]
+        for i in range(start,stop):
+            out={key:arrays[key][i] for key in ('formation','ship','bolts',
+                'nbolts')}
+            envs.append(InvadersEnv(seed=seed+i,out=out,**config))
+            games.append(0)
+            played.append(False)
+        aliens=arrays['aliens']
+        reward=arrays['reward']
+        done=arrays['done']
+        ring=arrays['actions']
+        while True:
+            barrier.wait()
+            if arrays['command'][0]==_COMMAND_CLOSE:
+                break
+            actions=ring[arrays['cursor'][0] % len(ring)]
+            for k in range(stop-start):
+                i=start+k
+                env=envs[k]
+                action=actions[i]
+                if action==ACTION_RESET:
+                    if played[k]:
+                        games[k]+=1
+                    env.reset(seed+i+games[k]*stride)
+                    played[k]=False
+                    reward[i]=0
+                    done[i]=False
+                else:
+                    obs,r,d,info=env.step(action)
+                    played[k]=not d
+                    if d:
+                        games[k]+=1
+                        env.reset(seed+i+games[k]*stride)
+                    reward[i]=r
+                    done[i]=d
+                np.copyto(aliens[i],env.getObservation()['aliens'])
+            barrier.wait()
+    except threading.BrokenBarrierError:
+        pass    # The parent gave up on the workers and closed the environment
+    finally:
+        del envs, arrays, whole
+        block.close()
+
+
+class SharedVectorEnv(object):
+    """
+    A class running many Alien Invaders environments in worker processes that
+    share their observations with this process.
+
+    The observation returned by reset and step is always the same dictionary.
+    It has the keys of an InvadersEnv observation, with an extra leading axis
+    of size n, so obs['aliens'][i] is the alien grid of environment i. The
+    arrays live in shared memory and are overwritten by every reset and step.
+    Copy them if you need to keep them. They stay readable after the
+    environment is closed, and the shared block is only unmapped once every
+    one of them has been released.
+
+    INSTANCE ATTRIBUTES:
+        _n:        the number of environments [int > 0]
+        _block:    the shared block [SharedMemory, or None once closed]
+        _arrays:   the arrays in the shared block [dict of NumPy arrays]
+        _obs:      the observation [dict of NumPy arrays]
+        _ring:     the action ring [int8 array (depth,n)]
+        _cursor:   the index of the last action row written [int64 array (1,)]
+        _barrier:  the barrier shared with the workers [multiprocessing Barrier]
+        _workers:  the worker processes [list of Process]
+        _timeout:  the seconds to wait for the workers [number > 0, or None]
+        _shutdown: stops the workers and unlinks the block, once
+                   [weakref.finalize]
+        _info:     the (empty) info dictionary returned by step [dict]
+    """
+
+    # GETTERS
+    def getCount(self):
+        """
+        Returns the number of environments.
+        """
+        return self._n
+
+
+    def getObservation(self):
+        """
+        Returns the current observation.
+        """
+        return self._obs
+
+
+    # INITIALIZER
+    def __init__(self,n,workers=None,seed=0,depth=4,rows=ALIEN_ROWS,
+    cols=ALIENS_IN_ROW,speed=ALIEN_SPEED,ticks=1,capacity=64,timeout=TIMEOUT):
+        """
+        Creates n environments. Call reset to get their first observation.
+
+        Environment i plays its first game with the seed seed+i, its second
+        with seed+i+n, and so on, no matter how many workers there are.
+        Calling reset before the first step does not use up a game.
+
+        Parameter n: the number of environments
+        Precondition: n is an int > 0
+
+        Parameter workers: the number of worker processes
+        Precondition: workers is an int > 0, or None for one per core
+
+        Parameter seed: the seed of the first game of environment 0
+        Precondition: seed is an int
+
+        Parameter depth: the number of rows in the action ring
+        Precondition: depth is an int > 0
+
+        Parameter timeout: the seconds to wait for the workers at each step
+        Precondition: timeout is a number > 0, or None to wait forever
+
+        The other parameters are the same as for InvadersEnv.
+        """
+        if workers is None:
+            workers=multiprocessing.cpu_count()
+        workers=max(1,min(workers,n))
+        layout,size=_layout(n,rows,cols,capacity,depth)
+        self._n=n
+        self._block=shared_memory.SharedMemory(create=True,size=size)
+        whole,self._arrays=_attach(self._block,layout)
+        weakref.finalize(whole,self._block.close)
+        self._arrays['command'][0]=_COMMAND_STEP
+        self._arrays['cursor'][0]=0
+        self._ring=self._arrays['actions']
+        self._cursor=self._arrays['cursor']
+        self._obs={key:self._arrays[key] for key in ('aliens','formation',
+            'ship','bolts','nbolts')}
+        self._info={}
+        self._timeout=timeout
+        self._barrier=multiprocessing.Barrier(workers+1)
+        config={'rows':rows,'cols':cols,'speed':speed,'ticks':ticks,
+            'capacity':capacity}
+        self._workers=[]
+        self._shutdown=weakref.finalize(self,_shutdown,self._block,
+            self._arrays['command'],self._barrier,self._workers,timeout)
+        for w in range(workers):
+            start=n*w//workers
+            stop=n*(w+1)//workers
+            process=multiprocessing.Process(target=_work,args=(self._block.name,
+                layout,start,stop,seed,n,config,self._barrier),daemon=True)
+            process.start()
+            self._workers.append(process)
+
+
+    # PUBLIC METHODS
+    def reset(self):
+        """
+        Starts a new game in every environment and returns the first
+        observation.
+        """
+        self._send(ACTION_RESET)
+        return self._obs
+
+
+    def step(self,actions):
+        """
+        Plays one step in every environment.
+
+        Returns the tuple (observation, rewards, dones, info), where rewards
+        and dones are arrays with one entry per environment. An environment
+        whose game ended has already started its next game.
+
+        Parameter actions: the action of each environment
+        Precondition: actions is a sequence of n ints, each 0<=a<ACTION_COUNT
+        """
+        self._send(actions)
+        return (self._obs,self._arrays['reward'],self._arrays['done'],
+            self._info)
+
+
+    def close(self):
+        """
+        Stops the workers and frees the shared block.
+
+        The block is unlinked at once, but stays mapped until the arrays
+        returned by reset and step have all been released.
+        """
+        if self._block is None:
+            return
+        self._shutdown()
+        self._obs=None
+        self._ring=None
+        self._cursor=None
+        self._arrays=None
+        self._block=None
+
+
+    def __enter__(self):
+        """
+        Returns this environment, for use in a with statement.
+        """
+        return self
+
+
+    def __exit__(self,*args):
+        """
+        Closes this environment at the end of a with statement.
+        """
+        self.close()
+
+
+    # HIDDEN METHODS
+    def _send(self,actions):
+        """
+        Writes actions into the next row of the ring and waits for every worker
+        to finish with them.
+
+        Parameter actions: the action of each environment
+        Precondition: actions is an int, or a sequence of n ints
+        """
+        assert self._block is not None, 'the environment is closed'
+        cursor=self._cursor[0]+1
+        self._ring[cursor % len(self._ring)]=actions
+        self._cursor[0]=cursor
+        try:
+            self._barrier.wait(self._timeout)
+            self._barrier.wait(self._timeout)
+        except threading.BrokenBarrierError:
+            codes=[process.exitcode for process in self._workers]
+            self.close()
+            raise RuntimeError('the workers did not finish a step within %s '
+                'seconds (exit codes %s); the environment is closed'
+                % (self._timeout,codes)) from None
@@ -6,7 +6,9 @@ Alien Invaders game.  Instances of Wave represent a single wave.  Whenever you
 move to a new level, you are expected to make a new instance of the class.
 
 The subcontroller Wave manages the ship, the aliens and any laser bolts on
-screen. These are model objects.  Their classes are defined in models.py.
+screen. The game itself is played by the headless simulation in simulation.py.
+The model objects (whose classes are defined in models.py) are only the view of
+that simulation, and are not created at all when a wave is headless.
 
 Most of your work on this assignment will be in either this module or models.py.
 Whether a helper method belongs in this module or models.py is often a
@@ -15,16 +17,16 @@ complicated issue.  If you do not know, ask on Piazza and we will answer.
 Authors: Mihikaa Goenka (mg897), Oishani Ganguly(og58)
 Date: December 4th, 2018
 """
-from game2d import *
 from consts import *
-from models import *
-import random
-import sys
+from simulation import *
 
 # PRIMARY RULE: Wave can only access attributes in models.py via getters/setters
 # Wave is NOT allowed to access anything in app.py (Subcontrollers are not
 #permitted to access anything in their parent. To see why, take CS 3152)
 
+# game2d and models.py are imported when the view is created, so that a
+# headless wave never loads Kivy.
+
 class Wave(object):
     """
     This class controls a single level or wave of Alien Invaders.
@@ -41,16 +43,21 @@ class Wave(object):
     This class will be similar to that one in how it interacts with the main
     class Invaders.
 
-    #UPDATE ME LATER
+    All of the game logic lives in the simulation _sim. Every update steps the
+    simulation and then, unless the wave is headless, copies the new state onto
+    the ship, aliens and bolts below and plays the sounds of the frame. A
+    headless wave has no view at all: the view attributes are all None and the
+    wave cannot be drawn.
+
     INSTANCE ATTRIBUTES:
-        _ship:   the player ship to control [Ship]
-        _aliens: the 2d list of aliens in the wave [rectangular 2d list of
-                 Alien or None]
-        _bolts:  the laser bolts currently on screen [list of Bolt,
-                 possibly empty]
-        _dline:  the defensive line being protected [GPath]
-        _lives:  the number of lives left  [int >= 0]
-        _time:   The amount of time since the last Alien "step" [number >= 0]
+        _ship:   the player ship to control [Ship, or None if the ship has been
+                 destroyed or the wave is headless]
+        _aliens: the formation of aliens in the wave [Formation, or None if
+                 the wave is headless]
+        _bolts:  the laser bolts currently on screen [BoltPool, or None if
+                 the wave is headless]
+        _dline:  the defensive line being protected [GPath, or None if the
+                 wave is headless]
 
     As you can see, all of these attributes are hidden.  You may find that you
     want to access an attribute in class Invaders. It is okay if you do, but you
@@ -64,86 +71,74 @@ class Wave(object):
     changes with the invariants.
 
     LIST MORE ATTRIBUTES (AND THEIR INVARIANTS) HERE IF NECESSARY
+    _sim:       the simulation of this wave [WaveSim]
+    _headless:  whether the wave runs without a view [bool]
+    _clock:     the clock turning real time into simulation ticks [SimClock]
     _music:     the sound played with every step the aliens take and the
-                background music when game is paused [Sound]
-    _pew1:      the sound played when ship fires bolt [Sound]
-    _pew2:      the sound played when aliens fire bolts [Sound]
-    _blast1:    the sound played when aliens are destroyed [Sound]
-    _blast2:    the sound played when the ship is destroyed [Sound]
-    _pop2:      the sound played when the ship intercepts a power-up bolt [Sound]
-    _alienscopy:2d list of Alien objects that stores a deep copy of _aliens
-    _alienbolts:the random number of steps the aliens take before firing a bolt
-                [1<=_alienbolts<=BOLT_RATE]
-    _noaliens:  the value of the number of aliens when all have been killed
-    _speed:     stores the speed of the aliens [_speed=ALIEN_SPEED]
-    _movingR:   boolean value that keeps track of whether the aliens are moving
-                right or left at any point
-    _numMarch:  the number of steps taken by the aliens yet
-    _score:     the score of the player [GLabel]
-    _livestext2:stores the number of lives remaining for the player [GLabel]
+                background music when game is paused [Sound, or None if the
+                wave is headless]
+    _pew1:      the sound played when ship fires bolt [Sound or None]
+    _pew2:      the sound played when aliens fire bolts [Sound or None]
+    _blast1:    the sound played when aliens are destroyed [Sound or None]
+    _blast2:    the sound played when the ship is destroyed [Sound or None]
+    _pop2:      the sound played when the ship intercepts a power-up bolt
+                [Sound or None]
+    _sounds:    the sound to play for each simulation event [dict mapping
+                EVENT_* to Sound, empty if the wave is headless]
+    _marches:   the number of alien steps shown by _aliens [int >= 0]
+    _removed:   the number of aliens of the simulation's kill list that were
+                removed from _aliens [int >= 0]
+    _view:      the view retaining the labels, defense line and aliens
+                [GView, or None if the wave has not been drawn yet]
+    _score:     the score of the player [GNumber or None]
+    _livestext2:stores the number of lives remaining for the player
+                [GNumber or None]
     """
 
 
     # GETTERS AND SETTERS (ONLY ADD IF YOU NEED THEM)
     def getScore(self):
         """
-        Returns the text attribute of the player's score.
-
-        This method returns the GLabel object _score's text attribute directly.
+        Returns the score of the player as an int.
         """
-        return self._score.text
+        return self._sim.getScore()
 
 
-    def UpdateScore(self, val):
+    def getNoAliens(self):
         """
-        Adds the score 'val' to the player's previous score text as an integer
-        and converts it to a string.
-
-        Parameter val: The value to add to self._score.text
-        Precondition:  val is an int >=0
+        Returns the number of aliens still alive.
         """
-        newscore=int(self._score.text)+val
-        self._score.text=str(newscore)
+        return self._sim.getNoAliens()
 
 
-    def getNoAliens(self):
+    def getLives(self):
         """
-        Returns the attribute _noaliens directly.
+        Returns the number of lives of the player directly.
         """
-        return self._noaliens
+        return self._sim.getLives()
 
 
-    def setNoAliens(self, value):
+    def getSim(self):
         """
-        Sets the attribute _noaliens to value.
-
-        Parameter value: The value to assign to self._noaliens
-        Precondition:  value is an int >=0
+        Returns the simulation played by this wave.
         """
-        self._noaliens=value
+        return self._sim
 
 
-    def getLives(self):
+    def getClock(self):
         """
-        Returns the number of lives of the player directly.
+        Returns the clock turning real time into simulation ticks.
         """
-        return self._lives
+        return self._clock
 
 
-    def UpdateLives(self):
+    def isHeadless(self):
         """
-        Deducts 1 from the player's current number of  lives and converts it to
-        a string.
+        Returns True if this wave runs without a view.
         """
-        self._lives-=1
-        self._livestext2.text=str(self._lives)
+        return self._headless
 
 
-    '''def UpdateNewLife(self):
-        self._lives+=1
-        self._livestext2.text=str(self._lives)
-    '''
-
     def getMusic(self):
         """
         Returns the marching-cum-background music of the game.
@@ -195,72 +190,125 @@ class Wave(object):
 
     def setShip(self):
         """
-        Creates a Ship object and assigns it the attribute _ship.
+        Creates a new ship and assigns it the attribute _ship.
         """
-        self._ship=Ship()
+        self._sim.setShip()
+        if not self._headless:
+            from models import Ship
+            self._ship=Ship()
 
 
     # INITIALIZER (standard form) TO CREATE SHIP AND ALIENS
     def initaliens(self):
         """
-        Creates and returns a 2d list of alien objects.
+        Creates and returns the formation of aliens.
 
-        The 2d list is created in a bottom up manner with adjacent pairs of rows
-        being the same kind of aliens.
+        The aliens are created in a bottom up manner with adjacent pairs of rows
+        being the same kind of aliens. They are placed where they are at the
+        start of the wave, and the formation is then moved to where the aliens
+        are now. Aliens that have been destroyed are left out.
         """
+        from models import Formation
+        offx,offy=self._sim.getOffset()
         aliens=[]
-        k=ALIEN_ROWS-1
-        for row in range(ALIEN_ROWS):
+        for row in range(self._sim.getRows()):
             alienrow=[]
-            for alien in range(ALIENS_IN_ROW):
+            for alien in range(self._sim.getCols()):
                 if row%6==0 or row%6==1:
                         c=0
                 elif row%6==2 or row%6==3:
                         c=1
                 else:
                         c=2
-                x=ALIEN_H_SEP*(alien+1)+0.5*ALIEN_WIDTH+ALIEN_WIDTH*alien
-                y=(GAME_HEIGHT-ALIEN_CEILING)-(ALIEN_V_SEP*k)-(ALIEN_HEIGHT*k)-\
-                (0.5*ALIEN_HEIGHT)
-                alienrow.append(Alien(x,y,ALIEN_IMAGES[c]))
-            k-=1
+                x=self._sim.getAlienX(alien)-offx
+                y=self._sim.getAlienY(row)-offy
+                alienrow.append((x,y,ALIEN_IMAGES[c]))
             aliens.append(alienrow)
-        return aliens
+        formation=Formation(aliens)
+        for row in range(self._sim.getRows()):
+            for col in range(self._sim.getCols()):
+                if not self._sim.isAlive(row,col):
+                    formation.removeAlien(row,col)
+        formation.x=offx
+        formation.y=offy
+        formation.setFrame(self._sim.getFrame())
+        self._removed=len(self._sim.getKilled())
+        return formation
 
 
-    def __init__(self):
+    def __init__(self,headless=False,seed=None,rows=ALIEN_ROWS,
+    cols=ALIENS_IN_ROW,speed=ALIEN_SPEED,clock=None):
         """
         Initialises all the instance attributes.
+
+        Parameter headless: whether to run the wave without a view
+        Precondition: headless is a bool
+
+        Parameter seed: the seed of the random number generator of the wave
+        Precondition: seed is an int, or None to seed from the system
+
+        Parameter rows: the number of rows of aliens
+        Precondition: rows is an int > 0
+
+        Parameter cols: the number of aliens per row
+        Precondition: cols is an int > 0
+
+        Parameter speed: the number of seconds between alien steps
+        Precondition: speed is a number > 0
+
+        Parameter clock: the clock turning the time of each update into ticks
+        Precondition: clock is a SimClock, or None for a real time clock at
+        TICKS_PER_SECOND
         """
+        if clock is None:
+            clock=SimClock()
+        self._clock=clock
+        self._sim=WaveSim(rows,cols,speed,seed,clock.getTicksPerSecond())
+        self._headless=headless
+        self._ship=None
+        self._aliens=None
+        self._bolts=None
+        self._dline=None
+        self._music=self._pew1=self._pew2=None
+        self._blast1=self._blast2=self._pop2=None
+        self._sounds={}
+        self._score=self._livestext2=None
+        self._marches=0
+        self._removed=0
+        self._view=None
+        if not headless:
+            self._initView()
+
+
+    def _initView(self):
+        """
+        Creates the model objects, labels and sounds that show the simulation.
+        """
+        from game2d import GPath, GNumber, Sound
+        from models import Ship, BoltPool
         self._ship=Ship()
+        self._bolts=BoltPool()
         self._aliens=self.initaliens()
-        self._bolts=[]
         self._dline=GPath(points=[0,DEFENSE_LINE,GAME_WIDTH,DEFENSE_LINE],
         linewidth=2,linecolor='red')
-        self._lives=SHIP_LIVES
-        self._time=0
         self._music=Sound('126347_latin_alienican.wav')
         self._pew1=Sound('pew1.wav')
         self._pew2=Sound('pew2.wav')
         self._blast1=Sound('blast1.wav')
         self._blast2=Sound('blast2.wav')
         self._pop2=Sound('pop2.wav')
-        self.movingR=True
-        self._alienscopy=[]
-        for i in range(len(self._aliens)):
-            self._alienscopy.append(self._aliens[i][:])
-        self._alienbolts=random.randint(1,BOLT_RATE)
-        self._score=GLabel(text=str(0), font_size=40,
+        self._sounds={EVENT_MARCH:self._music,EVENT_FIRE:self._pew1,
+        EVENT_ALIEN_FIRE:self._pew2,EVENT_ALIEN_DIED:self._blast1,
+        EVENT_SHIP_DIED:self._blast2,EVENT_POWERUP:self._pop2}
+        self._score=GNumber(value=self.getScore(), font_size=40,
         font_name='Arcade.ttf',x=GAME_WIDTH/10 + 100,y=GAME_HEIGHT-\
         GAME_HEIGHT/16,
         fillcolor='black',linecolor='yellow')
-        self._noaliens=ALIENS_IN_ROW*ALIEN_ROWS
-        self._livestext2=GLabel(text=str(self.getLives()), font_size=40,
+        self._livestext2=GNumber(value=self.getLives(), font_size=40,
         font_name='Arcade.ttf',x=GAME_WIDTH-GAME_WIDTH/20,\
         y=GAME_HEIGHT-GAME_HEIGHT/16,
         fillcolor='black',linecolor='green')
-        self._speed=ALIEN_SPEED
-        self._numMarch=0
+        self._marches=self._sim.getMarches()
 
 
     # UPDATE METHOD TO MOVE THE SHIP, ALIENS, AND LASER BOLTS
@@ -271,6 +319,12 @@ class Wave(object):
         This method fires both alien bolts and ship bolts and deletes them on
         collision or when the reach the end of the game window.
 
+        The input only needs a method is_key_down, so a headless wave can be
+        driven by any object that reports the keys 'left', 'right' and 'up'.
+
+        The clock decides how many fixed simulation ticks dt is worth. With a
+        clock that runs as fast as possible, dt is ignored altogether.
+
         Parameter input: the user input used to control the ship and change state
         Precondition: input is an instance of GInput; it is inherited from
         GameApp
@@ -278,403 +332,170 @@ class Wave(object):
         Parameter dt: The time in seconds since last update
         Precondition: dt is a number (int or float)
         """
-        self._moveShip(input)
-        self._moveAlien(dt)
-        for bolt in self._bolts:
-            if bolt._isPlayerBolt==False:
-                self._collisionship(bolt)
-        self._determineFire(input, self._aliens)
-        self._DeleteBolt()
-
-
-    # DRAW METHOD TO DRAW THE SHIP, ALIENS, DEFENSIVE LINE AND BOLTS
-    def draw(self,view):
-        """
-        Draws the player score, player lives, the ship, the defense line,
-        the aliens, and the bolts on the game window.
-
-        Parameter view: the game view, used in drawing
-        Precondition: view is an instance of GView; it is inherited from GameApp
-        """
-        self._score.draw(view)
-        self._livestext2.draw(view)
-        if self._ship is not None:
-            self._ship.draw(view)
-        self._dline.draw(view)
-        for row in self._aliens:
-            for alien in row:
-                if alien is not None:
-                    alien.draw(view)
-        for b in self._bolts:
-            b.draw(view)
+        self.control(input.is_key_down('left'),input.is_key_down('right'),
+        input.is_key_down('up'),dt)
 
 
-    # HELPER METHODS FOR COLLISION DETECTION
-    def _determineFire(self,input, aliens):
+    def control(self,left,right,fire,dt):
         """
-        Determines the current arrow key pressed, creates a Bolt object and
-        fires a laser bolt from the ship accordingly.
+        Method to play the wave with the given actions instead of key presses.
 
-        This method checks for an up arrow key press, and if there is
-        one, creates a Bolt object and fires a laser bolt in the upward
-        direction.  A key press is when a key is pressed EVERY TIME. We want a
-        bolt to fire when the previous bolt has killed an alien OR when the
-        previous bolt has reached the end of the game window.
+        This is the same as update, but the ship is controlled directly. It is
+        meant for bots, which do not have to fake a GInput to play the game.
 
-        Parameter input: the user input used to control the ship and change state
-        Precondition: input is an instance of GInput; it is inherited from
-        GameApp
+        Parameter left: whether the ship should move left
+        Precondition: left is a bool
 
-        Parameter aliens: the list of aliens
-        Precondition: aliens is a 2d list of Alien objects
-        """
-        if input.is_key_down('up'):
-            y=SHIP_HEIGHT+BOLT_HEIGHT/2
-            c=0
-            for bolt in self._bolts:
-                if bolt._velocity>0:
-                    bolt.setPlayerBolt(True)
-                    c+=1
-            if c==0 and self._ship is not None:
-                bolt=Bolt(self._ship.x,y,BOLT_SPEED,'blue')
-                self._pew1.play(loop=False)
-                self._bolts.append(bolt)
-        for bolt in self._bolts:
-            bolt.y+=bolt.getVelocity()
-            self._collision(bolt)
-        i = 0
-        while i < len(self._bolts):
-            if self._bolts[i].y-BOLT_HEIGHT/2 > GAME_HEIGHT:
-                del self._bolts[i]
-            else:
-                i += 1
-
-
-    def _collision(self, bolt):
-        """"
-        Checks whether a bolt from the ship has collided with an alien.
-
-        If a collision has been detected, it destroys the alien by making it a
-        None object and increases the score by a value.
-
-        Parameter bolt: the bolt with which the collision is being checked
-        Precondition: bolt is a Bolt object
-        """
-        for row in range(ALIEN_ROWS) :
-            if row>=0 and row<ALIEN_ROWS/3:
-                val=10
-            elif row>=ALIEN_ROWS/3 and row<2*ALIEN_ROWS/3:
-                val=30
-            else:
-                val=50
-            for alien in range(ALIENS_IN_ROW):
-                if self._aliens[row][alien]is not None and \
-                bolt._isPlayerBolt:
-                    if (self._aliens[row][alien].collides(bolt)):
-                        self._aliens[row][alien]=None
-                        self.UpdateScore(val)
-                        self._blast1.play(loop=False)
-                        bolt.setDelete(True)
-                        self._AliensOver()
-
-
-    def _AliensOver(self):
-        """
-        If all the aliens have been killed successfully, sets the attribute
-        _noaliens to 0.
-        """
-        k=0
-        for row in self._aliens:
-            for alien in row:
-                if alien is None:
-                    k+=1
-        if (k==(ALIEN_ROWS*ALIENS_IN_ROW)):
-            self.setNoAliens(0)
-
-
-    def _DeleteBolt(self):
-        """
-        Deletes a bolt.
-        """
-        i=0
-        while i < len(self._bolts):
-            if self._bolts[i].getDelete():
-                del self._bolts[i]
-            else:
-                i += 1
+        Parameter right: whether the ship should move right
+        Precondition: right is a bool
 
+        Parameter fire: whether the ship should fire a bolt
+        Precondition: fire is a bool
 
-    def _shipExist(self):
-        """
-        Returns True if the ship has been killed. False otherwise.
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float)
         """
-        if self.getShip() is None:
-            return True
-        return False
-
-
-    def _alienFire(self):
-        """
-        Creates regular and power-up bolts and appends it to the list of bolts
-        for the aliens to fire. The chances of a power-up bolt being created
-        and fired is 1 in 8.
-
-        Also determines whether a bolt has reached the end of the game window
-        without collision. If it has, deletes the bolt.
-        """
-        value=False
-        c=0
-        while (value is not True):
-            colum=random.randint(0,ALIENS_IN_ROW-1)
-            for row in range(ALIEN_ROWS):
-                if self._aliens[row][colum]!=None and c==0:
-                    x=self._aliens[row][colum].getX()
-                    y=self._aliens[row][colum].getY()
-                    rand=random.randint(1,10)
-                    if rand==10:
-                        a='purple'
-                    else:
-                        a='yellow'
-                    bolt=Bolt(x,y-ALIEN_HEIGHT/2,-1*BOLT_SPEED,a)
-                    bolt.setPlayerBolt(False)
-                    self._pew2.play(loop=False)
-                    self._bolts.append(bolt)
-                    c+=1
-                    value=True
-                    break
-        i = 0
-        while i < len(self._bolts):
-            if self._bolts[i].y+BOLT_HEIGHT/2 < 0:
-                del self._bolts[i]
-            else:
-                i += 1
-
-
-    def _collisionship(self, bolt):
-        """
-        Detects for a bolt collision with the ship.
-
-        If a power-up bolt collides with the ship, the score increases by __.
-        If a regular bolt collides with the ship, lives decrese by 1, the ship
-        is destroyed and set to None.
-
-        Parameter bolt: the bolt with which the collision is being checked
-        Precondition: bolt is a Bolt object
-        """
-        color=[0.6274509803921569,0.12549019607843137,0.9411764705882353,1.0]
-        if self._ship is not None:
-            if self._ship._collidesship(bolt) and bolt._isPlayerBolt==False:
-                if bolt.linecolor==color:
-                    val=50
-                    self._pop2.play(loop=False)
-                    self.UpdateScore(val)
-
-                else:
-                    self._ship=None
-                    self._blast2.play(loop=False)
-                    self.UpdateLives()
-                bolt.setDelete(True)
+        self._sim.update(left,right,fire,self._clock.advance(dt))
+        if not self._headless:
+            self._syncView()
 
 
-    def _moveShip(self,input):
+    # SNAPSHOTS FOR BOTS THAT SEARCH AHEAD
+    def snapshot(self):
         """
-        Determines the current arrow key pressed and moves the ship accordingly.
-
-        This method checks for a left or right arrow key press, and if there is
-        one, moves the ship by SHIP_MOVEMENT pixels in the direction of the
-        arrow pressed.  A key press is when a key is pressed EVERY TIME. We want
-        the ship to continue to move as we hold down the keys.
-
-        If the ship reaches the left or right edge of the game window, the ship
-        is unable to move further in the respective direction.
+        Returns the complete state of the wave packed into bytes.
 
-        Parameter input: the user input used to control the ship and change state
-        Precondition: input is an instance of GInput; it is inherited from
-        GameApp
+        See WaveSim.snapshot for what is saved. The view is not saved, as it is
+        rebuilt from the simulation on restore.
         """
-        max=GAME_WIDTH-SHIP_WIDTH/2
-        min=0+SHIP_WIDTH/2
-        if self._ship is not None:
-            if input.is_key_down('left'):
-                if self._ship.x-SHIP_WIDTH/2>=min:
-                    self._ship.x-= SHIP_MOVEMENT
-                else:
-                    self._ship.x=min
-            if input.is_key_down('right'):
-                if self._ship.x+SHIP_WIDTH/2<=max:
-                    self._ship.x+= SHIP_MOVEMENT
-                else:
-                    self._ship.x=max
+        return self._sim.snapshot()
 
 
-    def _moveAlienRight(self):
-        """
-        Moves each alien to the right by ALIEN_H_WALK.
+    def restore(self,data):
         """
-        for row in self._aliens:
-            for alien in row:
-                if alien is not None:
-                    newx=alien.getX()+ALIEN_H_WALK
-                    alien.frame = (alien.frame+1) % 2
-                    alien.setX(newx)
+        Puts the wave back into the state saved in a snapshot.
 
+        A headless wave is restored without making any objects. Otherwise the
+        aliens, ship, bolts and labels are remade to match the restored state.
 
-    def _moveAlienLeft(self):
-        """
-        Moves each alien to the left by ALIEN_H_WALK.
+        Parameter data: the snapshot to restore
+        Precondition: data is a bytes-like object returned by snapshot on a
+        wave with the same number of rows and columns
         """
-        for row in self._aliens:
-            for alien in row:
-                if alien is not None:
-                    newx=alien.getX()-ALIEN_H_WALK
-                    alien.frame = (alien.frame+1) % 2
-                    alien.setX(newx)
+        self._sim.restore(data)
+        if not self._headless:
+            old=self._aliens
+            self._aliens=self.initaliens()
+            if self._view is not None:
+                self._view.release(old)
+                self._view.retain(self._aliens,LAYER_WAVE)
+            self._syncView()
 
 
-    def _moveAlienDown(self):
-        """
-        Moves each alien dynamically down by ALIEN_V_WALK.
+    # DRAW METHOD TO DRAW THE SHIP, ALIENS, DEFENSIVE LINE AND BOLTS
+    def draw(self,view):
         """
-        for row in self._aliens:
-            for alien in row:
-                if alien is not None:
-                    newy=alien.getY()-ALIEN_V_WALK
-                    if newy==DEFENSE_LINE+ALIEN_HEIGHT/2:
-                        return STATE_COMPLETE
-                    else:
-                        alien.frame = (alien.frame+1) % 2
-                        alien.setY(newy)
-                        self._speed-=self._speed/300
-        self._time=0
+        Draws the player score, player lives, the ship, the defense line,
+        the aliens, and the bolts on the game window.
 
+        The labels, the defense line and the aliens stay on screen for the whole
+        wave, so the first call retains them in the view and later calls leave
+        them alone. Only the ship and the bolts are drawn every frame.
 
-    def _trackRight(self):
-        """
-        Tracks whether the aliens have reached the right end of the game window.
+        Parameter view: the game view, used in drawing
+        Precondition: view is an instance of GView; it is inherited from GameApp
         """
-        for alien in range(ALIENS_IN_ROW-1,-1,-1):
-            for row in range(ALIEN_ROWS):
-                if self._aliens[row][alien] is not None:
-                    return self._aliens[row][alien].getX()+ALIEN_WIDTH/2
+        if self._view is None:
+            self._view=view
+            for obj in (self._score,self._livestext2,self._dline,self._aliens):
+                view.retain(obj,LAYER_WAVE)
+        if self._ship is not None:
+            self._ship.draw(view)
+        if self._bolts is not None:
+            self._bolts.draw(view)
 
 
-    def _trackLeft(self):
+    def release(self):
         """
-        Tracks whether the aliens have reached the left end of the game window.
+        Takes the labels, defense line and aliens of this wave off the screen.
+
+        Call this before the wave is replaced. Nothing happens if the wave has
+        not been drawn.
         """
-        for alien in range(ALIENS_IN_ROW):
-            for row in range(ALIEN_ROWS):
-                if self._aliens[row][alien] is not None:
-                    return self._aliens[row][alien].getX()-ALIEN_WIDTH/2
+        if self._view is not None:
+            for obj in (self._score,self._livestext2,self._dline,self._aliens):
+                self._view.release(obj)
+            self._view=None
 
 
-    def _trackDown(self):
+    # HELPER METHODS TO SHOW THE SIMULATION
+    def _syncView(self):
         """
-        Tracks whether the aliens have reached the defense line.
+        Copies the state of the simulation onto the model objects and plays
+        the sounds of the events of the last frame.
         """
-        for alien in range(ALIEN_ROWS):
-            for colum in range(ALIENS_IN_ROW):
-                if self._aliens[alien][colum] is not None:
-                    return self._aliens[alien][colum].getY()-ALIEN_WIDTH/2
+        events=self._sim.getEvents()
+        for event in events:
+            self._sounds[event].play(loop=False)
+        self._syncShip()
+        if self._marches!=self._sim.getMarches() or \
+        self._removed!=len(self._sim.getKilled()):
+            self._syncAliens()
+        self._syncBolts()
+        self._score.value=self.getScore()
+        self._livestext2.value=self.getLives()
 
 
-    def _movingRight(self):
+    def _syncShip(self):
         """
-        Moves the aliens to the right as long as they have not reached the right
-        edge of the game window.
+        Creates, moves or destroys the ship to match the simulation.
         """
-        self._music.play(loop=False)
-        self._moveAlienRight()
-        self._numMarch+=1
-        if self._numMarch==self._alienbolts:
-            self._alienFire()
-            self._numMarch=0
-            self._alienbolts=random.randint(1,BOLT_RATE)
-        self._time=0
+        if self._sim.isShipAlive():
+            if self._ship is None:
+                from models import Ship
+                self._ship=Ship()
+            self._ship.x=self._sim.getShipX()
+        else:
+            self._ship=None
 
 
-    def _movingLeft(self):
+    def _syncAliens(self):
         """
-        Moves the aliens to the left as long as they have not reached the left
-        edge of the game window.
+        Moves and animates the formation, removing the aliens that were
+        destroyed.
+
+        Moving and animating the aliens only changes the formation itself, so
+        it costs the same however many aliens there are. Only the aliens
+        destroyed since the last call are removed.
         """
-        self._music.play(loop=False)
-        self._moveAlienLeft()
-        self._numMarch+=1
-        if self._numMarch==self._alienbolts:
-            self._alienFire()
-            self._numMarch=0
-            self._alienbolts=random.randint(1,BOLT_RATE)
-        self._time=0
+        offx,offy=self._sim.getOffset()
+        self._aliens.x=offx
+        self._aliens.y=offy
+        self._aliens.setFrame(self._sim.getFrame())
+        killed=self._sim.getKilled()
+        for i in range(self._removed,len(killed)):
+            row,col=killed[i]
+            self._aliens.removeAlien(row,col)
+        self._removed=len(killed)
+        self._marches=self._sim.getMarches()
 
 
-    def _reachedRight(self):
+    def _syncBolts(self):
         """
-        If the aliens have reached the right edge of the game window, moves the
-        aliens down by ALIEN_V_WALK and left by ALIEN_H_WALK.
+        Shows the bolts of the simulation with the bolts of the pool.
         """
-        self._music.play(loop=False)
-        self._moveAlienDown()
-        self._numMarch+=1
-        if self._numMarch==self._alienbolts:
-            self._alienFire()
-            self._numMarch=0
-            self._alienbolts=random.randint(1,BOLT_RATE)
-        self._music.play(loop=False)
-        self._moveAlienLeft()
-        self._numMarch+=1
-        if self._numMarch==self._alienbolts:
-            self._alienFire()
-            self._numMarch=0
-            self._alienbolts=random.randint(1,BOLT_RATE)
-        self._time=0
-        self.movingR=False
+        self._bolts.sync(self._sim.getBolts())
 
 
-    def _reachedLeft(self):
+    def _shipExist(self):
         """
-        If the aliens have reached the left edge of the game window, moves the
-        aliens down by ALIEN_V_WALK and right by ALIEN_H_WALK.
+        Returns True if the ship has been killed. False otherwise.
         """
-        self._music.play(loop=False)
-        self._moveAlienDown()
-        self._numMarch+=1
-        if self._numMarch==self._alienbolts:
-            self._alienFire()
-            self._numMarch=0
-            self._alienbolts=random.randint(1,BOLT_RATE)
-        self._music.play(loop=False)
-        self._moveAlienRight()
-        self._numMarch+=1
-        if self._numMarch==self._alienbolts:
-            self._alienFire()
-            self._numMarch=0
-            self._alienbolts=random.randint(1,BOLT_RATE)
-        self._time=0
-        self.movingR=True
+        return not self._sim.isShipAlive()
 
 
-    def _moveAlien(self,dt):
+    def _trackDown(self):
         """
-        Keeps moving the aliens across the game window.
-
-        The aliens keep moving from right to left as long as they are above the
-        defense line. The aliens speed up dynamically as they get closer to the
-        defense line.
-
-        Parameter dt: The time in seconds since last update
-        Precondition: dt is a number (int or float)
+        Tracks whether the aliens have reached the defense line.
         """
-        self._time+=dt
-        if self._aliens is not None:
-            if self._time>self._speed and \
-            (self._trackRight()<GAME_WIDTH-ALIEN_H_SEP) and self.movingR:
-                self._movingRight()
-            elif self._time>self._speed and \
-            (self._trackRight()>=GAME_WIDTH-ALIEN_H_SEP):
-                self._reachedRight()
-            elif self._time>self._speed and \
-            (self._trackLeft()>ALIEN_H_SEP) and self.movingR==False:
-                self._movingLeft()
-            elif self._time>self._speed and (self._trackLeft()<=ALIEN_H_SEP):
-                self._reachedLeft()
+        return self._sim.trackDown()